@@ -13,7 +13,17 @@ from flask import (
 )
 from parser import parse_bib_file, write_bib_file
 from review_logic import build_review_state, finalize_records
-from dblp_api import find_dblp_citation, ensure_local_dblp_dataset_fresh, is_dataset_sync_in_progress
+from dblp_api import (
+    find_dblp_citation,
+    ensure_local_dblp_dataset_fresh,
+    is_dataset_sync_in_progress,
+    local_index_status,
+    mirror_status,
+    rate_limiter_status,
+    remote_breaker_status,
+    resolver_status,
+)
+from errors import LookupDeferred
 from logger import logger
 
 app = Flask(__name__)
@@ -118,7 +128,11 @@ def _process_review_job(token: str) -> None:
             rec["lookup_status"] = "running"
             _write_state(token, state)
             try:
-                proposal = find_dblp_citation(arxiv_id, citation_key)
+                fields = rec.get("fields") or {}
+                proposal = find_dblp_citation(arxiv_id, citation_key, title=fields.get("title"), author=fields.get("author"))
+            except LookupDeferred:
+                proposal = None
+                rec["lookup_status"] = "deferred"
             except Exception:
                 proposal = None
                 rec["lookup_status"] = "failed"
@@ -134,11 +148,12 @@ def _process_review_job(token: str) -> None:
             state["changes"] = changes
             _write_state(token, state)
 
-        review_state = build_review_state(records, lookup_fn=lambda a, b: None)
+        review_state = build_review_state(records, lookup_fn=lambda *args, **kwargs: None)
         totals = dict(review_state["totals"])
         totals["with_proposals"] = sum(1 for p in proposals if p)
         totals["unchanged_or_nomatch"] = totals["total"] - totals["with_proposals"]
         totals["no_match_records"] = sum(1 for r in records if r.get("lookup_status") in ("no_match", "failed"))
+        totals["deferred_records"] = sum(1 for r in records if r.get("lookup_status") == "deferred")
 
         state["status"] = "done"
         state["proposals"] = proposals
@@ -214,9 +229,30 @@ def review_status(token: str):
         return jsonify({"error": "expired"}), 404
     payload = dict(state)
     payload["dataset_sync_in_progress"] = is_dataset_sync_in_progress()
+    payload["remote_breaker"] = remote_breaker_status()
     return jsonify(payload)
 
 
+@app.route("/index_status", methods=["GET"])
+def index_status():
+    return jsonify(local_index_status())
+
+
+@app.route("/rate_limit_status", methods=["GET"])
+def rate_limit_status():
+    return jsonify(rate_limiter_status())
+
+
+@app.route("/resolver_status", methods=["GET"])
+def resolver_tier_status():
+    return jsonify(resolver_status())
+
+
+@app.route("/mirror_status", methods=["GET"])
+def mirror_health_status():
+    return jsonify(mirror_status())
+
+
 @app.route("/finalize", methods=["POST"])
 def finalize():
     """Build the final .bib based on which entries the user accepted."""
@@ -0,0 +1,59 @@
+"""Wall-clock time of serial vs pipelined arXiv index extraction.
+
+Usage:
+    python -m benchmarks.bench_index_build [--records 300000] [--arxiv-ratio 0.05] [--workers N]
+
+Writes a synthetic dblp.xml.gz, then times ``iter_index_entries`` (single
+thread iterparse) against ``iter_index_entries_parallel`` (gunzip thread,
+byte-level prefilter and process pool) and prints the results as JSON.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic_dump import write_dump  # noqa: E402
+from index_builder import default_worker_count, iter_index_entries, iter_index_entries_parallel  # noqa: E402
+
+
+def _time(fn) -> dict:
+    started = time.perf_counter()
+    count = sum(1 for _ in fn())
+    return {"seconds": round(time.perf_counter() - started, 3), "entries": count}
+
+
+def run(records: int, arxiv_ratio: float, workers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dblp.xml.gz")
+        write_dump(path, records, arxiv_ratio)
+        serial = _time(lambda: iter_index_entries(path))
+        pipelined = _time(lambda: iter_index_entries_parallel(path, workers=workers))
+        return {
+            "records": records,
+            "arxiv_ratio": arxiv_ratio,
+            "compressed_bytes": os.path.getsize(path),
+            "workers": workers,
+            "serial": serial,
+            "pipelined": pipelined,
+            "speedup": round(serial["seconds"] / max(pipelined["seconds"], 1e-9), 2),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=300_000)
+    parser.add_argument("--arxiv-ratio", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=default_worker_count())
+    args = parser.parse_args()
+    print(json.dumps(run(args.records, args.arxiv_ratio, args.workers), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""Compare per-worker resident memory of the JSON index readers and the mmap binary index.
+
+Usage:
+    python -m benchmarks.bench_index_memory [--entries 200000] [--lookups 20000]
+
+Each index is opened in a fresh process, as a web worker would, and the
+process reports its RSS after a batch of lookups. ``json_dict`` is the raw
+decoded JSON; ``json_interned`` is ``JsonIndexReader``, which shares venue and
+author strings between entries. ``rss_anon_kb`` is memory
+private to the worker; ``rss_file_kb`` is file-backed page cache, which all
+workers mapping the same binary index share.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from local_index import BinaryIndexReader, JsonIndexReader, JsonIndexWriter, read_json_index  # noqa: E402
+
+
+def _synthetic_entries(n: int):
+    venues = ["CoRR", "NeurIPS", "ICML", "ICLR", "J. Mach. Learn. Res.", "CVPR", "ACL"]
+    for i in range(n):
+        arxiv_id = f"{18 + i // 1_000_000:02d}{(i // 100_000) % 12 + 1:02d}.{i % 100_000:05d}"
+        yield arxiv_id, {
+            "type": "article",
+            "title": f"Synthetic Paper Number {i} About Learning Representations.",
+            "year": str(2018 + i % 7),
+            "venue": venues[i % len(venues)],
+            "author": f"Author {i % 5000} and Coauthor {i % 7919} and Third Person {i % 311}",
+            "ee": f"https://arxiv.org/abs/{i}",
+        }
+
+
+def _memory_kb() -> dict:
+    stats = {}
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssFile"):
+                    stats[key] = int(value.split()[0])
+    except OSError:
+        import resource
+        stats["VmRSS"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "rss_kb": stats.get("VmRSS"),
+        "rss_anon_kb": stats.get("RssAnon"),
+        "rss_file_kb": stats.get("RssFile"),
+    }
+
+
+def _worker(mode: str, path: str, probe_ids: list, out_queue) -> None:
+    baseline = _memory_kb()
+    started = time.perf_counter()
+    if mode == "json_dict":
+        index = read_json_index(path)
+        get = index.get
+    elif mode == "json_interned":
+        reader = JsonIndexReader(path)
+        get = reader.get
+    else:
+        reader = BinaryIndexReader(path)
+        get = reader.get
+    open_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    hits = sum(1 for arxiv_id in probe_ids if get(arxiv_id))
+    lookup_seconds = time.perf_counter() - started
+
+    after = _memory_kb()
+    out_queue.put({
+        "mode": mode,
+        "open_seconds": round(open_seconds, 4),
+        "lookups": len(probe_ids),
+        "hits": hits,
+        "mean_lookup_us": round(lookup_seconds / max(1, len(probe_ids)) * 1e6, 2),
+        "baseline": baseline,
+        "after_lookups": after,
+        "delta_rss_kb": (after["rss_kb"] or 0) - (baseline["rss_kb"] or 0),
+    })
+
+
+def run(entries: int, lookups: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "index.json")
+        bin_path = os.path.join(tmp, "index.bin")
+        writer = JsonIndexWriter(json_path)
+        ids = []
+        for arxiv_id, entry in _synthetic_entries(entries):
+            writer.add(arxiv_id, entry)
+            ids.append(arxiv_id)
+        writer.commit(binary_path=bin_path)
+
+        rng = random.Random(7)
+        probe_ids = [rng.choice(ids) for _ in range(lookups)]
+        ctx = multiprocessing.get_context("spawn")
+        results = []
+        for mode, path in (("json_dict", json_path), ("json_interned", json_path), ("mmap_binary", bin_path)):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_worker, args=(mode, path, probe_ids, queue))
+            proc.start()
+            results.append(queue.get())
+            proc.join()
+
+        return {
+            "entries": entries,
+            "json_bytes": os.path.getsize(json_path),
+            "binary_bytes": os.path.getsize(bin_path),
+            "results": results,
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.entries, args.lookups), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
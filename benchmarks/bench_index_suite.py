@@ -0,0 +1,184 @@
+"""Rebuild throughput, index size, cold load time and lookup latency of the local index.
+
+Usage:
+    python -m benchmarks.bench_index_suite [--records 300000] [--arxiv-ratio 0.05] [--published-ratio 0.5]
+        [--type-mix article=0.4,...] [--lookups 20000] [--seed 11] [--out results.json]
+
+Writes a synthetic dump with ``benchmarks.synthetic_dump``, points
+``dblp_api`` at a temporary cache directory and runs a full
+``_rebuild_local_arxiv_index`` on it. The index is then opened in a fresh
+process, as a web worker would, which reports how long the first
+``_LOCAL_INDEX.current()`` took and the p50/p99 latency of
+``_lookup_local_index`` over a mix of indexed and absent arXiv IDs. The
+result is printed as JSON and, with ``--out``, also written to a file so runs
+can be compared over time.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic_dump import parse_type_mix, synthetic_arxiv_id, write_dump  # noqa: E402
+
+_PATH_SETTINGS = {
+    "_LOCAL_DBLP_XML_GZ": "dblp.xml.gz",
+    "_LOCAL_DBLP_INDEX": "dblp_arxiv_index.json",
+    "_LOCAL_DBLP_INDEX_DB": "dblp_arxiv_index.sqlite3",
+    "_LOCAL_DBLP_INDEX_BIN": "dblp_arxiv_index.bin",
+    "_LOCAL_DBLP_INDEX_BLOOM": "dblp_arxiv_ids.bloom",
+}
+
+
+def use_cache_dir(cache_dir: str):
+    """Import ``dblp_api`` with every index file redirected into ``cache_dir``."""
+    import dblp_api
+
+    for name, filename in _PATH_SETTINGS.items():
+        setattr(dblp_api, name, os.path.join(cache_dir, filename))
+    dblp_api._reset_local_index()
+    return dblp_api
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank ``fraction`` percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+
+def _file_sizes(cache_dir: str) -> dict:
+    sizes = {}
+    for filename in _PATH_SETTINGS.values():
+        path = os.path.join(cache_dir, filename)
+        if filename != "dblp.xml.gz" and os.path.exists(path):
+            sizes[filename] = os.path.getsize(path)
+    return sizes
+
+
+def _lookup_worker(cache_dir: str, probe_ids: list, out_queue) -> None:
+    from memory_stats import current_rss_bytes
+
+    dblp_api = use_cache_dir(cache_dir)
+    baseline_rss = current_rss_bytes()
+    started = time.perf_counter()
+    generation = dblp_api._LOCAL_INDEX.current()
+    cold_load = time.perf_counter() - started
+
+    latencies = []
+    hits = 0
+    for arxiv_id in probe_ids:
+        started = time.perf_counter()
+        if dblp_api._lookup_local_index(arxiv_id) is not None:
+            hits += 1
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    after_rss = current_rss_bytes()
+    dblp_api._reset_local_index()
+    out_queue.put({
+        "source": generation.source if generation is not None else None,
+        "bloom": generation is not None and generation.bloom is not None,
+        "cold_load_seconds": round(cold_load, 4),
+        "lookups": len(probe_ids),
+        "hits": hits,
+        "p50_lookup_us": round(percentile(latencies, 0.50) * 1e6, 2),
+        "p99_lookup_us": round(percentile(latencies, 0.99) * 1e6, 2),
+        "mean_lookup_us": round(sum(latencies) / max(1, len(latencies)) * 1e6, 2),
+        "delta_rss_bytes": (after_rss or 0) - (baseline_rss or 0),
+    })
+
+
+def _probe_ids(arxiv_records: int, lookups: int, seed: int) -> list:
+    """Indexed IDs, plus one in five that the dump never linked (filtered by the Bloom filter)."""
+    rng = random.Random(seed)
+    probes = []
+    for _ in range(lookups):
+        if arxiv_records and rng.random() < 0.8:
+            probes.append(synthetic_arxiv_id(rng.randrange(arxiv_records)))
+        else:
+            probes.append(synthetic_arxiv_id(arxiv_records + rng.randrange(1, 1_000_000)))
+    return probes
+
+
+def run(
+    records: int,
+    arxiv_ratio: float = 0.05,
+    published_ratio: float = 0.5,
+    type_mix=None,
+    lookups: int = 20_000,
+    seed: int = 11,
+) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        dump_path = os.path.join(tmp, _PATH_SETTINGS["_LOCAL_DBLP_XML_GZ"])
+        started = time.perf_counter()
+        dump = write_dump(dump_path, records, arxiv_ratio, published_ratio, type_mix, seed)
+        generate_seconds = time.perf_counter() - started
+        compressed_bytes = os.path.getsize(dump_path)
+
+        dblp_api = use_cache_dir(tmp)
+        started = time.perf_counter()
+        stats = dblp_api._rebuild_local_arxiv_index(incremental=False)
+        rebuild_seconds = time.perf_counter() - started
+        dblp_api._reset_local_index()
+
+        ctx = multiprocessing.get_context("spawn")
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_lookup_worker, args=(tmp, _probe_ids(dump["arxiv_records"], lookups, seed), queue))
+        proc.start()
+        load = queue.get()
+        proc.join()
+
+        elapsed = max(rebuild_seconds, 1e-9)
+        return {
+            "python": platform.python_version(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "parameters": {
+                "records": records,
+                "arxiv_ratio": arxiv_ratio,
+                "published_ratio": published_ratio,
+                "type_mix": type_mix,
+                "lookups": lookups,
+                "seed": seed,
+            },
+            "dump": {**dump, "compressed_bytes": compressed_bytes, "generate_seconds": round(generate_seconds, 3)},
+            "rebuild": {
+                "seconds": round(rebuild_seconds, 3),
+                "records_per_second": round(dump["records"] / elapsed),
+                "compressed_mb_per_second": round(compressed_bytes / 1e6 / elapsed, 2),
+                "uncompressed_mb_per_second": round(dump["uncompressed_bytes"] / 1e6 / elapsed, 2),
+                **stats,
+            },
+            "index_bytes": _file_sizes(tmp),
+            "load": load,
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=300_000)
+    parser.add_argument("--arxiv-ratio", type=float, default=0.05)
+    parser.add_argument("--published-ratio", type=float, default=0.5)
+    parser.add_argument("--type-mix", type=parse_type_mix, default=None)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--out", help="also write the JSON result to this file")
+    args = parser.parse_args()
+    result = run(args.records, args.arxiv_ratio, args.published_ratio, args.type_mix, args.lookups, args.seed)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""Parse throughput of parser.parse_bib_content on a synthetic bibliography.
+
+Usage:
+    python -m benchmarks.bench_parser [--entries 20000] [--repeat 3] [--out results.json]
+
+Generates a reproducible bibliography (braced, quoted and bare values,
+nested braces, escapes, multi-line abstracts, arXiv-style and published
+entries), parses it ``--repeat`` times and reports the best wall time,
+entries per second and MB per second, as JSON.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from parser import parse_bib_content  # noqa: E402
+
+_WORDS = ("learning", "graph", "neural", "robust", "sparse", "quantum", "{GPU}", "M{\\\"u}ller", "{\\&}", "on", "of")
+
+
+def synthetic_bibliography(entries: int, seed: int = 3) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for i in range(entries):
+        title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 12)))
+        authors = " and ".join(f"Author {rng.randrange(10000)}" for _ in range(rng.randint(1, 8)))
+        abstract = "\n    ".join(" ".join(rng.choice(_WORDS) for _ in range(12)) for _ in range(rng.randint(0, 6)))
+        if i % 3 == 0:
+            parts.append(
+                f"@article{{key{i},\n  title = {{{title}}},\n  author = {{{authors}}},\n"
+                f"  journal = {{arXiv preprint arXiv:{2000 + i % 400}.{i:05d}}},\n"
+                f"  url = \"https://arxiv.org/abs/{2000 + i % 400}.{i:05d}\",\n  year = {2000 + i % 25},\n}}\n"
+            )
+        else:
+            parts.append(
+                f"@inproceedings(key{i},\n  title = \"{{{title}}} with \\\"quotes\\\"\",\n  author = {{{authors}}},\n"
+                f"  booktitle = {{Proceedings of {{Venue}} {i % 300}}},\n  abstract = {{{abstract}}},\n"
+                f"  pages = {{{i % 90}--{i % 90 + 12}}},\n  year = {2000 + i % 25}\n)\n"
+            )
+    return "\n".join(parts)
+
+
+def run(entries: int = 20000, repeat: int = 3) -> dict:
+    content = synthetic_bibliography(entries)
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        parsed = parse_bib_content(content)
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    size_mb = len(content.encode("utf-8")) / (1024 * 1024)
+    return {
+        "python": platform.python_version(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "parameters": {"entries": entries, "repeat": repeat},
+        "input_mb": round(size_mb, 2),
+        "parsed_entries": len(parsed),
+        "best_seconds": round(best, 4),
+        "entries_per_second": round(len(parsed) / best),
+        "mb_per_second": round(size_mb / best, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", help="also write the JSON result to this file")
+    args = parser.parse_args()
+    text = json.dumps(run(args.entries, args.repeat), indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+"""End-to-end throughput and latency of remote DBLP lookups against the fake DBLP.
+
+Usage:
+    python -m benchmarks.bench_remote_lookups [--ids 500] [--mode batched|single] [--concurrency 4]
+        [--latency lognormal:0.08,0.6] [--throttle-ratio 0.02] [--max-rps 20] [--reset-ratio 0.01]
+        [--rate 10] [--burst 4] [--seed 7] [--out results.json]
+
+Starts ``benchmarks.fake_dblp`` in-process, points ``dblp_api`` at it with an
+empty local index and fresh caches, and resolves ``--ids`` distinct arXiv IDs
+either through ``DblpLookupService.lookup_many`` (batched) or one
+``find_dblp_citation`` per ID on ``--concurrency`` threads (as the web review
+does). Reports wall time, lookups per second, per-lookup latency
+percentiles, failures by type, what the server saw (requests, 429s, resets)
+and the client rate limiter's final state, as JSON. The same arguments and
+seed give the same server behaviour, so runs can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.bench_index_suite import percentile, use_cache_dir  # noqa: E402
+from benchmarks.fake_dblp import FakeDblpServer  # noqa: E402
+from benchmarks.synthetic_dump import synthetic_arxiv_id  # noqa: E402
+
+
+def _configure_client(dblp_api, cache_dir: str, base_url: str, rate: float, burst: int) -> None:
+    from circuit_breaker import CircuitBreaker
+    from lookup_cache import LookupCache
+    from rate_limiter import HostRateLimiter
+    from single_flight import SingleFlight
+
+    dblp_api.use_dblp_base_urls([base_url])
+    dblp_api._RATE_LIMITER = HostRateLimiter(rate=rate, burst=burst, max_rate=rate)
+    dblp_api._BREAKER = CircuitBreaker(failure_threshold=10_000)
+    dblp_api._SINGLE_FLIGHT = SingleFlight()
+    dblp_api._LOOKUP_CACHE = LookupCache(os.path.join(cache_dir, "lookup_cache.sqlite3"), 3600.0, 3600.0)
+
+
+def _lookup_single(dblp_api, ids: list, concurrency: int):
+    def one(arxiv_id: str):
+        started = time.perf_counter()
+        try:
+            found = dblp_api.find_dblp_citation(arxiv_id, arxiv_id, cache_mode="bypass") is not None
+            error = None
+        except Exception as e:
+            found, error = False, type(e).__name__
+        return time.perf_counter() - started, found, error
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(one, ids))
+
+
+def _lookup_batched(dblp_api, ids: list, concurrency: int, chunk: int):
+    service = dblp_api.DblpLookupService(max_concurrency=concurrency, total_timeout_budget=3600.0)
+    outcomes = []
+    for start in range(0, len(ids), chunk):
+        part = ids[start:start + chunk]
+        started = time.perf_counter()
+        results = service.lookup_many(part, part)
+        elapsed = time.perf_counter() - started
+        # A lookup_many call answers all its IDs at once; each ID waited that long.
+        outcomes.extend((elapsed, result is not None, None) for result in results)
+    return outcomes
+
+
+def run(
+    ids: int = 500,
+    mode: str = "batched",
+    concurrency: int = 4,
+    chunk: int = 100,
+    rate: float = 10.0,
+    burst: int = 4,
+    seed: int = 7,
+    **server_options,
+) -> dict:
+    probe_ids = [synthetic_arxiv_id(n * 7919 % 5_000_000) for n in range(ids)]
+    with tempfile.TemporaryDirectory() as tmp, FakeDblpServer(seed=seed, **server_options) as server:
+        dblp_api = use_cache_dir(tmp)
+        _configure_client(dblp_api, tmp, server.base_url, rate, burst)
+        started = time.perf_counter()
+        if mode == "single":
+            outcomes = _lookup_single(dblp_api, probe_ids, concurrency)
+        else:
+            outcomes = _lookup_batched(dblp_api, probe_ids, concurrency, chunk)
+        wall = time.perf_counter() - started
+        server_stats = server.stats()
+        limiter = dblp_api.rate_limiter_status()
+
+    latencies = sorted(seconds for seconds, _, _ in outcomes)
+    errors = {}
+    for _, _, error in outcomes:
+        if error:
+            errors[error] = errors.get(error, 0) + 1
+    return {
+        "python": platform.python_version(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "parameters": {
+            "ids": ids, "mode": mode, "concurrency": concurrency, "chunk": chunk,
+            "rate": rate, "burst": burst, "seed": seed, **server_options,
+        },
+        "wall_seconds": round(wall, 3),
+        "lookups_per_second": round(len(outcomes) / max(wall, 1e-9), 2),
+        "found": sum(1 for _, found, _ in outcomes if found),
+        "errors": errors,
+        "p50_latency_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_latency_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_latency_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "server": server_stats,
+        "rate_limiter": limiter,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ids", type=int, default=500)
+    parser.add_argument("--mode", choices=["batched", "single"], default="batched")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--chunk", type=int, default=100, help="IDs per lookup_many call in batched mode")
+    parser.add_argument("--rate", type=float, default=10.0, help="client requests per second per host")
+    parser.add_argument("--burst", type=int, default=4)
+    parser.add_argument("--latency", default="lognormal:0.08,0.6")
+    parser.add_argument("--throttle-ratio", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--error-ratio", type=float, default=0.0)
+    parser.add_argument("--reset-ratio", type=float, default=0.0)
+    parser.add_argument("--hit-ratio", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="also write the JSON result to this file")
+    args = parser.parse_args()
+    result = run(
+        args.ids, args.mode, args.concurrency, args.chunk, args.rate, args.burst, args.seed,
+        latency=args.latency, throttle_ratio=args.throttle_ratio, retry_after=args.retry_after,
+        max_rps=args.max_rps, error_ratio=args.error_ratio, reset_ratio=args.reset_ratio, hit_ratio=args.hit_ratio,
+    )
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
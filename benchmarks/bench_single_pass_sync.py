@@ -0,0 +1,109 @@
+"""Time-to-ready of a two-pass (download, then index) vs single-pass dataset sync.
+
+Usage:
+    python -m benchmarks.bench_single_pass_sync [--records 200000] [--mbit 200] [--workers N]
+
+Serves a synthetic dblp.xml.gz from a local HTTP server throttled to
+``--mbit`` and measures how long each mode takes until the index is usable.
+Two-pass downloads the file and then parses it; single-pass tees the
+downloaded bytes into ``StreamingIndexBuilder``, so parsing overlaps the
+transfer and the total approaches the download time alone.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic_dump import write_dump  # noqa: E402
+from dblp_download import download_dump  # noqa: E402
+from index_builder import StreamingIndexBuilder, default_worker_count, iter_index_entries_parallel  # noqa: E402
+from local_index import SqliteIndexWriter  # noqa: E402
+
+
+def _serve(payload: bytes, bytes_per_second: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", '"bench"')
+            self.end_headers()
+            block = 64 * 1024
+            for i in range(0, len(payload), block):
+                self.wfile.write(payload[i:i + block])
+                time.sleep(block / bytes_per_second)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server
+
+
+def _two_pass(url: str, tmp: str, workers: int) -> dict:
+    xml_path = os.path.join(tmp, "two_pass.xml.gz")
+    started = time.perf_counter()
+    download_dump(url, xml_path)
+    downloaded = time.perf_counter() - started
+    writer = SqliteIndexWriter(os.path.join(tmp, "two_pass.sqlite3"))
+    for arxiv_id, entry in iter_index_entries_parallel(xml_path, workers=max(1, workers)):
+        writer.add(arxiv_id, entry)
+    writer.commit()
+    return {"download_seconds": round(downloaded, 3), "ready_seconds": round(time.perf_counter() - started, 3), "entries": writer.count}
+
+
+def _single_pass(url: str, tmp: str, workers: int) -> dict:
+    started = time.perf_counter()
+    writer = SqliteIndexWriter(os.path.join(tmp, "single_pass.sqlite3"))
+    builder = StreamingIndexBuilder(writer.add, workers=workers)
+    download_dump(url, os.path.join(tmp, "single_pass.xml.gz"), on_chunk=builder.feed)
+    builder.close()
+    writer.commit()
+    return {"ready_seconds": round(time.perf_counter() - started, 3), "entries": writer.count}
+
+
+def run(records: int, mbit: float, workers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.xml.gz")
+        write_dump(source, records, 0.05)
+        with open(source, "rb") as f:
+            payload = f.read()
+        server = _serve(payload, mbit * 1_000_000 / 8)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/xml/dblp.xml.gz"
+            two_pass = _two_pass(url, tmp, workers)
+            single_pass = _single_pass(url, tmp, workers)
+        finally:
+            server.shutdown()
+            server.server_close()
+        return {
+            "records": records,
+            "compressed_bytes": len(payload),
+            "mbit": mbit,
+            "workers": workers,
+            "two_pass": two_pass,
+            "single_pass": single_pass,
+            "speedup": round(two_pass["ready_seconds"] / max(single_pass["ready_seconds"], 1e-9), 2),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--mbit", type=float, default=200.0)
+    parser.add_argument("--workers", type=int, default=default_worker_count())
+    args = parser.parse_args()
+    print(json.dumps(run(args.records, args.mbit, args.workers), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,349 @@
+"""A local stand-in for dblp.org, for offline load and latency tests.
+
+Usage:
+    python -m benchmarks.fake_dblp [--port 8765] [--dump dblp.xml.gz | --records 100000]
+        [--latency lognormal:0.08,0.6] [--throttle-ratio 0.05] [--throttle-first 0] [--retry-after 2] [--max-rps 5]
+        [--error-ratio 0.01] [--reset-ratio 0.01] [--bandwidth-mbit 100] [--hit-ratio 0.8] [--seed 7]
+
+    DBLP_BASE_URLS=http://127.0.0.1:8765 python main.py refs.bib
+
+Serves ``/search/publ/api`` in DBLP's JSON shape and ``/xml/dblp.xml.gz``
+(with ETag, If-None-Match and Range, like dblp.org). Whether an arXiv ID is
+"in DBLP" is a hash of the ID, so any ID can be queried and the same ID
+always gets the same answer. Faults are drawn from a seeded generator:
+
+- ``latency``: delay before each answer, ``fixed:S``, ``uniform:A,B``,
+  ``exp:MEAN`` or ``lognormal:MEDIAN,SIGMA`` (seconds).
+- ``throttle_ratio`` / ``retry_after``: share of requests answered 429 with
+  that Retry-After. ``throttle_first`` answers 429 to that many first
+  requests, for deterministic tests. ``max_rps`` also answers 429 to
+  requests beyond a real per-server rate, the way dblp.org does.
+- ``error_ratio``: share of searches answered 503.
+- ``reset_ratio``: share of searches whose connection is reset (RST) instead
+  of answered, and of dump transfers whose connection closes somewhere in the
+  body (a reset would also discard what the client had not read yet).
+- ``bandwidth``: bytes per second every response body is throttled to.
+
+``GET /_stats`` (and ``FakeDblpServer.stats()``) counts what was served.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from rate_limiter import TokenBucket  # noqa: E402
+
+SEARCH_PATH = "/search/publ/api"
+DUMP_PATH = "/xml/dblp.xml.gz"
+_BLOCK_BYTES = 16 * 1024
+_WORDS = ("learning neural graph efficient scalable robust adaptive distributed secure privacy model "
+          "network optimization inference language vision quantum algorithm analysis data system").split()
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """``fixed:S``, ``uniform:A,B``, ``exp:MEAN`` or ``lognormal:MEDIAN,SIGMA`` as a sampler."""
+    kind, _, args = spec.partition(":")
+    try:
+        values = [float(v) for v in args.split(",")] if args else []
+        if kind == "fixed" and len(values) == 1:
+            return lambda rng: values[0]
+        if kind == "uniform" and len(values) == 2:
+            return lambda rng: rng.uniform(values[0], values[1])
+        if kind == "exp" and len(values) == 1:
+            return lambda rng: rng.expovariate(1.0 / values[0]) if values[0] > 0 else 0.0
+        if kind == "lognormal" and len(values) == 2:
+            mu = math.log(values[0])
+            return lambda rng: rng.lognormvariate(mu, values[1])
+    except ValueError:
+        pass
+    raise ValueError(f"Bad latency distribution {spec!r}; use fixed:S, uniform:A,B, exp:MEAN or lognormal:MEDIAN,SIGMA")
+
+
+def _digest(arxiv_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(arxiv_id.encode(), digest_size=8).digest(), "big")
+
+
+def fake_hit(arxiv_id: str) -> dict:
+    """The ``info`` of the CoRR record the fake DBLP holds for ``arxiv_id``."""
+    rng = random.Random(_digest(arxiv_id))
+    slug = arxiv_id.replace("/", "-").replace(".", "-")
+    return {
+        "authors": {"author": [{"@pid": f"{rng.randrange(1000)}/{rng.randrange(10000)}", "text": f"Author {rng.randrange(5000)}"}
+                               for _ in range(rng.randint(1, 4))]},
+        "title": " ".join(rng.sample(_WORDS, rng.randint(3, 7))).capitalize() + ".",
+        "venue": "CoRR",
+        "volume": f"abs/{arxiv_id}",
+        "year": str(2007 + rng.randrange(18)),
+        "type": "article",
+        "key": f"journals/corr/abs-{slug}",
+        "ee": f"https://arxiv.org/abs/{arxiv_id}",
+        "url": f"https://dblp.org/rec/journals/corr/abs-{slug}",
+    }
+
+
+class FakeDblpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        dump_path: Optional[str] = None,
+        hit_ratio: float = 0.8,
+        latency: str = "fixed:0",
+        throttle_ratio: float = 0.0,
+        throttle_first: int = 0,
+        retry_after: float = 1.0,
+        max_rps: Optional[float] = None,
+        error_ratio: float = 0.0,
+        reset_ratio: float = 0.0,
+        bandwidth: Optional[float] = None,
+        seed: int = 7,
+    ):
+        super().__init__((host, port), _Handler)
+        self.dump_path = dump_path
+        self.hit_ratio = hit_ratio
+        self.latency = parse_latency(latency)
+        self.throttle_ratio = throttle_ratio
+        self.throttle_first = throttle_first
+        self.retry_after = retry_after
+        self.error_ratio = error_ratio
+        self.reset_ratio = reset_ratio
+        self.bandwidth = bandwidth
+        self._rng = random.Random(seed)
+        self._bucket = TokenBucket(max_rps, burst=max(1, int(max_rps))) if max_rps else None
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def knows(self, arxiv_id: str) -> bool:
+        return _digest(arxiv_id) % 10_000 < self.hit_ratio * 10_000
+
+    def draw(self) -> Dict[str, float]:
+        """This request's fate: latency, and whether it is throttled, failed or reset."""
+        with self._lock:
+            upfront = self.throttle_first > 0
+            self.throttle_first -= upfront
+            return {
+                "latency": max(0.0, self.latency(self._rng)),
+                "throttle": self._rng.random() < self.throttle_ratio or upfront,
+                "error": self._rng.random() < self.error_ratio,
+                "reset": self._rng.random() < self.reset_ratio,
+                "cut": self._rng.random(),
+            }
+
+    def over_rate(self) -> bool:
+        return self._bucket is not None and not self._bucket.try_acquire()
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + n
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def start(self) -> "FakeDblpServer":
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeDblpServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeDblpServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.server.count("requests")
+        if url.path == "/_stats":
+            return self._send(200, json.dumps(self.server.stats()).encode(), "application/json")
+        if url.path not in (SEARCH_PATH, DUMP_PATH):
+            return self._send(404, b"not found", "text/plain")
+
+        fate = self.server.draw()
+        if fate["latency"]:
+            time.sleep(fate["latency"])
+        if fate["reset"] and url.path == SEARCH_PATH:
+            return self._reset()
+        if fate["throttle"] or self.server.over_rate():
+            self.server.count("throttled")
+            return self._send(429, b"too many requests", "text/plain", {"Retry-After": f"{self.server.retry_after:g}"})
+        if url.path == DUMP_PATH:
+            return self._dump(fate)
+        if fate["error"]:
+            self.server.count("errors")
+            return self._send(503, b"service unavailable", "text/plain")
+        return self._search(parse_qs(url.query))
+
+    def _search(self, query: Dict[str, list]):
+        ids = [part.strip() for part in (query.get("q") or [""])[0].split("|") if part.strip()]
+        hits_wanted = int((query.get("h") or ["30"])[0])
+        found = [fake_hit(arxiv_id) for arxiv_id in ids if self.server.knows(arxiv_id)]
+        self.server.count("searches")
+        self.server.count("searched_ids", len(ids))
+        sent = found[:hits_wanted]
+        hits: Dict[str, object] = {"@total": str(len(found)), "@computed": str(len(found)), "@sent": str(len(sent)), "@first": "0"}
+        if sent:
+            hits["hit"] = [{"@score": "1", "@id": str(_digest(info["key"]) % 10**7), "info": info} for info in sent]
+        body = {"result": {"query": "|".join(ids), "status": {"@code": "200", "text": "OK"}, "hits": hits}}
+        self._send(200, json.dumps(body).encode(), "application/json")
+
+    def _dump(self, fate: Dict[str, float]):
+        if not self.server.dump_path or not os.path.exists(self.server.dump_path):
+            return self._send(404, b"no dump configured", "text/plain")
+        stat = os.stat(self.server.dump_path)
+        size = stat.st_size
+        etag = f'"{int(stat.st_mtime)}-{size}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.count("not_modified")
+            return self._send(304, b"", None, {"ETag": etag})
+
+        start = 0
+        status = 200
+        headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+        requested = self.headers.get("Range", "")
+        if requested.startswith("bytes=") and self.headers.get("If-Range", etag) == etag:
+            start = int(requested[len("bytes="):].split("-")[0] or 0)
+            if start >= size:
+                return self._send(416, b"", None, {"Content-Range": f"bytes */{size}"})
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{size - 1}/{size}"
+        cut_at = start + int(fate["cut"] * (size - start)) if fate["reset"] else None
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/gzip")
+        self.send_header("Content-Length", str(size - start))
+        self.end_headers()
+        self.server.count(f"status_{status}")
+        with open(self.server.dump_path, "rb") as f:
+            f.seek(start)
+            position = start
+            while position < size:
+                block = f.read(_BLOCK_BYTES)
+                if cut_at is not None and position + len(block) > cut_at:
+                    self._write(block[:cut_at - position])
+                    self.server.count("truncated")
+                    self.connection.shutdown(socket.SHUT_WR)
+                    self.close_connection = True
+                    return
+                self._write(block)
+                position += len(block)
+
+    def _send(self, status: int, body: bytes, content_type: Optional[str], headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.server.count(f"status_{status}")
+        if body:
+            self._write(body)
+
+    def _write(self, data: bytes) -> None:
+        bandwidth = self.server.bandwidth
+        for i in range(0, len(data), _BLOCK_BYTES):
+            block = data[i:i + _BLOCK_BYTES]
+            self.wfile.write(block)
+            self.server.count("bytes_sent", len(block))
+            if bandwidth:
+                time.sleep(len(block) / bandwidth)
+
+    def _reset(self) -> None:
+        """Drop the connection with a TCP reset rather than an answer."""
+        self.server.count("resets")
+        self.wfile.flush()
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.connection.close()
+        self.close_connection = True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    dump = parser.add_mutually_exclusive_group()
+    dump.add_argument("--dump", help="dblp.xml.gz to serve")
+    dump.add_argument("--records", type=int, help="serve a synthetic dump of this many records")
+    parser.add_argument("--hit-ratio", type=float, default=0.8, help="share of arXiv IDs the search finds")
+    parser.add_argument("--latency", default="fixed:0", help="fixed:S | uniform:A,B | exp:MEAN | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--throttle-ratio", type=float, default=0.0)
+    parser.add_argument("--throttle-first", type=int, default=0, help="answer 429 to this many first requests")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--error-ratio", type=float, default=0.0)
+    parser.add_argument("--reset-ratio", type=float, default=0.0)
+    parser.add_argument("--bandwidth-mbit", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    dump_path = args.dump
+    if args.records:
+        import tempfile
+        from benchmarks.synthetic_dump import write_dump
+
+        dump_path = os.path.join(tempfile.mkdtemp(prefix="fake-dblp-"), "dblp.xml.gz")
+        write_dump(dump_path, args.records, seed=args.seed)
+    server = FakeDblpServer(
+        args.host,
+        args.port,
+        dump_path=dump_path,
+        hit_ratio=args.hit_ratio,
+        latency=args.latency,
+        throttle_ratio=args.throttle_ratio,
+        throttle_first=args.throttle_first,
+        retry_after=args.retry_after,
+        max_rps=args.max_rps,
+        error_ratio=args.error_ratio,
+        reset_ratio=args.reset_ratio,
+        bandwidth=args.bandwidth_mbit * 1_000_000 / 8 if args.bandwidth_mbit else None,
+        seed=args.seed,
+    )
+    print(f"Fake DBLP at {server.base_url} (dump: {dump_path or 'none'}); set DBLP_BASE_URLS={server.base_url}")
+    try:
+        server.serve_forever(poll_interval=0.2)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+"""Write synthetic dblp.xml.gz dumps with the shape of the real one.
+
+Usage:
+    python -m benchmarks.synthetic_dump OUT.xml.gz [--records 1000000] [--arxiv-ratio 0.05]
+        [--published-ratio 0.5] [--type-mix article=0.4,inproceedings=0.45,www=0.08] [--seed 11]
+
+The real dump is several GB and changes daily, which makes it useless for
+repeatable measurements. The synthetic one reproduces what the index builders
+care about: the record-type mix, person pages (``www``) in between, CoRR
+preprints linking ``arxiv.org/abs`` in new and old ID styles, published
+versions of some of those preprints under a publisher ``ee`` (what the title
+index matches), Zipf-distributed author names with DBLP homonym suffixes, and
+HTML character entities. The same arguments and seed always give the same file.
+"""
+import argparse
+import gzip
+import json
+import random
+from typing import Dict, Optional
+
+# Roughly the proportions of record types in dblp.xml (2024).
+DEFAULT_TYPE_MIX: Dict[str, float] = {
+    "article": 0.38,
+    "inproceedings": 0.44,
+    "proceedings": 0.02,
+    "book": 0.01,
+    "incollection": 0.03,
+    "phdthesis": 0.01,
+    "mastersthesis": 0.002,
+    "www": 0.098,
+}
+_VENUE_TAGS = {"article": "journal", "inproceedings": "booktitle", "incollection": "booktitle"}
+_HEADER = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<!DOCTYPE dblp SYSTEM "dblp.dtd">\n<dblp>\n'
+_GIVEN = ["Anna", "Wei", "J&ouml;rg", "Maria", "Hiroshi", "Fran&ccedil;ois", "Priya", "Lars", "Chen", "Olga",
+          "Jos&eacute;", "Fatima", "David", "Yuki", "Sara", "Mehmet"]
+_FAMILY = ["Wang", "M&uuml;ller", "Smith", "Zhang", "Garc&iacute;a", "Kim", "Nguyen", "Schmidt", "Rossi",
+           "Tanaka", "Kowalski", "Dubois", "Ivanova", "Singh", "Andersson", "&Ouml;zt&uuml;rk"]
+_WORDS = ("learning neural graph efficient scalable robust adaptive distributed secure privacy model "
+          "network optimization inference language vision quantum algorithm analysis data system "
+          "generative causal federated sparse transformer reinforcement verification").split()
+_OLD_ARXIV_CATEGORIES = ["cs", "math", "hep-th", "quant-ph", "cs.LG", "math.AG"]
+
+
+def parse_type_mix(spec: str) -> Dict[str, float]:
+    """Parse ``"article=0.4,inproceedings=0.5"`` into a record-type mix."""
+    mix = {}
+    for part in spec.split(","):
+        tag, _, weight = part.partition("=")
+        tag = tag.strip()
+        if tag not in DEFAULT_TYPE_MIX:
+            raise ValueError(f"Unknown DBLP record type {tag!r} in type mix")
+        mix[tag] = float(weight)
+    return mix
+
+
+class _Names:
+    """Author pool with Zipf-like reuse: a few prolific authors, a long tail."""
+
+    def __init__(self, rng: random.Random, size: int):
+        self._rng = rng
+        self._size = max(1, size)
+
+    def pick(self) -> str:
+        n = min(self._size - 1, int(self._size ** self._rng.random()) - 1)
+        name = f"{_GIVEN[n % len(_GIVEN)]} {_FAMILY[(n // len(_GIVEN)) % len(_FAMILY)]}"
+        homonym = n // (len(_GIVEN) * len(_FAMILY))
+        return f"{name} {homonym:04d}" if homonym else name
+
+
+def _title(rng: random.Random, n: int) -> str:
+    words = rng.sample(_WORDS, rng.randint(3, 8))
+    words[0] = words[0].capitalize()
+    joiner = " &amp; " if n % 97 == 0 else " "
+    return f"{joiner.join(words)} {n}."
+
+
+def synthetic_arxiv_id(n: int) -> str:
+    """The arXiv ID of the ``n``-th preprint ``write_dump`` writes."""
+    # One in ten preprints uses a pre-2007 "category/YYMMNNN" ID.
+    if n % 10 == 9:
+        k = n // 10
+        month = k // 1000
+        return f"{_OLD_ARXIV_CATEGORIES[k % len(_OLD_ARXIV_CATEGORIES)]}/{(92 + month // 12) % 100:02d}{month % 12 + 1:02d}{k % 1000:03d}"
+    month = n // 50000
+    return f"{(7 + month // 12) % 100:02d}{month % 12 + 1:02d}.{n % 50000:05d}"
+
+
+def _record(tag: str, key: str, authors, title: str, year: int, venue: str, ee: str, extra: str = "") -> str:
+    lines = [f'<{tag} mdate="2024-0{1 + year % 9}-1{year % 10}" key="{key}">']
+    lines.extend(f"<author>{a}</author>" for a in authors)
+    lines.append(f"<title>{title}</title>")
+    if venue:
+        lines.append(f"<{_VENUE_TAGS.get(tag, 'publisher')}>{venue}</{_VENUE_TAGS.get(tag, 'publisher')}>")
+    lines.append(f"<year>{year}</year>")
+    if extra:
+        lines.append(extra)
+    if ee:
+        lines.append(f"<ee>{ee}</ee>")
+    lines.append(f"</{tag}>\n")
+    return "\n".join(lines)
+
+
+def write_dump(
+    path: str,
+    records: int,
+    arxiv_ratio: float = 0.05,
+    published_ratio: float = 0.5,
+    type_mix: Optional[Dict[str, float]] = None,
+    seed: int = 11,
+) -> Dict[str, object]:
+    """Write ``records`` DBLP records to ``path`` and return what was written.
+
+    ``arxiv_ratio`` of the publication records are CoRR preprints linking an
+    arXiv abstract; ``published_ratio`` of those are followed later in the dump
+    by a published version of the same paper that does not link arXiv.
+    """
+    rng = random.Random(seed)
+    mix = type_mix or DEFAULT_TYPE_MIX
+    tags = list(mix)
+    weights = [mix[t] for t in tags]
+    names = _Names(rng, max(100, records // 4))
+    venues = [f"Venue {i} on {w.capitalize()}" for i, w in enumerate(_WORDS * 20)]
+    pending_published = []
+    counts: Dict[str, int] = {"records": 0, "arxiv_records": 0, "published_versions": 0, "www": 0}
+    uncompressed = 0
+    with gzip.open(path, "wt", encoding="iso-8859-1") as f:
+        f.write(_HEADER)
+        for i in range(records):
+            tag = rng.choices(tags, weights)[0]
+            year = 1990 + rng.randrange(35)
+            if tag == "www":
+                author = names.pick()
+                record = _record("www", f"homepages/{i % 1000}/{i}", [author], "Home Page", year, "", "",
+                                 f"<url>https://example.org/~{i}</url>")
+                counts["www"] += 1
+            elif pending_published and rng.random() < 0.5 and pending_published[0][0] <= i:
+                _, authors, title, year = pending_published.pop(0)
+                venue_tag = tag if tag in _VENUE_TAGS else "article"
+                record = _record(venue_tag, f"conf/pub/{i}", authors, title, year + 1, rng.choice(venues),
+                                 f"https://doi.org/10.1000/{i}")
+                counts["published_versions"] += 1
+            elif rng.random() < arxiv_ratio:
+                authors = [names.pick() for _ in range(rng.randint(1, 6))]
+                title = _title(rng, i)
+                arxiv_id = synthetic_arxiv_id(counts["arxiv_records"])
+                record = _record("article", f"journals/corr/abs-{i}", authors, title, year, "CoRR",
+                                 f"https://arxiv.org/abs/{arxiv_id}", f"<volume>abs/{arxiv_id}</volume>")
+                counts["arxiv_records"] += 1
+                if rng.random() < published_ratio:
+                    pending_published.append((i + rng.randint(1, 200), authors, title, year))
+            else:
+                authors = [names.pick() for _ in range(rng.randint(1, 6 if tag != "phdthesis" else 1))]
+                record = _record(tag, f"x/{tag}/{i}", authors, _title(rng, i), year, rng.choice(venues),
+                                 f"https://doi.org/10.1000/{i}")
+            f.write(record)
+            uncompressed += len(record.encode("iso-8859-1"))
+            counts["records"] += 1
+        f.write("</dblp>\n")
+    return {**counts, "uncompressed_bytes": uncompressed + len(_HEADER) + len("</dblp>\n")}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out")
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--arxiv-ratio", type=float, default=0.05)
+    parser.add_argument("--published-ratio", type=float, default=0.5)
+    parser.add_argument("--type-mix", type=parse_type_mix, default=None)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    print(json.dumps(write_dump(
+        args.out, args.records, args.arxiv_ratio, args.published_ratio, args.type_mix, args.seed
+    ), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
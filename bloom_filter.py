@@ -0,0 +1,113 @@
+"""Compact set membership for the arXiv IDs in the local index.
+
+A Bloom filter answers "definitely not in the dump" from a few KB/MB held in
+memory, without touching the index files. Sizing follows the usual formulas
+for ``n`` keys at false-positive rate ``p``: ``m = -n ln p / (ln 2)^2`` bits
+and ``k = (m / n) ln 2`` hash functions, with the ``k`` probes derived from
+one blake2b digest by double hashing.
+"""
+import hashlib
+import math
+import os
+import struct
+import time
+from typing import Dict, Iterable
+
+_MAGIC = b"AXBLOOM1"
+_VERSION = 1
+# magic, version, num_hashes, num_bits, count, target false-positive rate, created_at
+_HEADER = struct.Struct("<8sIIQQdd")
+DEFAULT_FP_RATE = 0.001
+
+
+class BloomFilter:
+    def __init__(self, num_bits: int, num_hashes: int, fp_rate: float = DEFAULT_FP_RATE):
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, num_hashes)
+        self.fp_rate = fp_rate
+        self.count = 0
+        self.created_at = time.time()
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float = DEFAULT_FP_RATE) -> "BloomFilter":
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError(f"Bloom filter false-positive rate must be in (0, 1), got {fp_rate}")
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+        num_hashes = round(num_bits / capacity * math.log(2))
+        return cls(num_bits, num_hashes, fp_rate)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def expected_fp_rate(self) -> float:
+        """False-positive rate for the number of keys actually added."""
+        return (1.0 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "keys": self.count,
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "memory_bytes": self.memory_bytes,
+            "target_fp_rate": self.fp_rate,
+            "expected_fp_rate": round(self.expected_fp_rate(), 8),
+            "created_at": self.created_at,
+        }
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, _VERSION, self.num_hashes, self.num_bits, self.count, self.fp_rate, self.created_at
+            ))
+            f.write(self._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            bits = f.read()
+        try:
+            magic, version, num_hashes, num_bits, count, fp_rate, created_at = _HEADER.unpack(header)
+        except struct.error:
+            magic = version = None
+        if magic != _MAGIC or version != _VERSION or len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"{path} is not a version {_VERSION} Bloom filter")
+        bloom = cls(num_bits, num_hashes, fp_rate)
+        bloom._bits = bytearray(bits)
+        bloom.count = count
+        bloom.created_at = created_at
+        return bloom
+
+
+def build_bloom_filter(
+    path: str,
+    keys: Iterable[str],
+    capacity: int,
+    fp_rate: float = DEFAULT_FP_RATE,
+) -> Dict[str, object]:
+    """Write a filter of ``keys`` sized for ``capacity`` to ``path``; return its stats."""
+    bloom = BloomFilter.for_capacity(capacity, fp_rate)
+    for key in keys:
+        bloom.add(key)
+    bloom.save(path)
+    return bloom.stats()
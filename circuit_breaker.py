@@ -0,0 +1,101 @@
+"""Circuit breaker for the remote DBLP search path.
+
+After ``failure_threshold`` consecutive failed requests the breaker opens and
+``allow`` turns every caller away at once, so lookups fall back to the local
+index or come back "deferred" instead of sitting through retries and backoff
+against a DBLP that is down. After ``reset_timeout`` seconds it goes half-open
+and lets a single probe request through: success closes it, failure opens it
+for another ``reset_timeout``. A probe abandoned before it got an answer (the
+caller ran out of time, say) is released, so the next caller probes instead.
+"""
+import threading
+import time
+from typing import Callable, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.opened = 0
+
+    def _refresh(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh(self._clock())
+            return self._state
+
+    def allow(self) -> bool:
+        """True if a remote request may be sent now (the probe, when half-open)."""
+        with self._lock:
+            self._refresh(self._clock())
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.opened += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """The probe was given up without an outcome; let another caller probe."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)."""
+        with self._lock:
+            now = self._clock()
+            self._refresh(now)
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (now - self._opened_at))
+
+    def stats(self) -> Dict[str, object]:
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "retry_in_seconds": round(retry_in, 1),
+                "times_opened": self.opened,
+                "rejected": self.rejected,
+            }
@@ -1,10 +1,12 @@
 import random
+import re
 import threading
 import time
 import os
-import gzip
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -13,19 +15,98 @@ from urllib3.util.retry import Retry
 from formatter import format_authors
 from logger import logger
 from parser import VALID_BIBTEX_TYPES
-from errors import LookupFailure
+from errors import LookupDeadlineExceeded, LookupDeferred, LookupFailure
+from circuit_breaker import OPEN, CircuitBreaker
+from deadline import Deadline, remaining
+from bloom_filter import DEFAULT_FP_RATE, BloomFilter, build_bloom_filter
+from dblp_download import download_dump, dump_last_checked
+from index_builder import StreamingIndexBuilder, default_worker_count, iter_index_entries, iter_index_entries_parallel
+from index_handle import IndexHandle, bump_generation
+from local_index import (
+    BinaryIndexReader,
+    JsonIndexReader,
+    JsonIndexWriter,
+    SqliteIndexReader,
+    SqliteIndexUpdater,
+    SqliteIndexWriter,
+    sqlite_available,
+    sqlite_index_is_current,
+)
+from memory_stats import PeakRssSampler, format_mb, peak_rss_bytes
+from lookup_cache import CACHE_MISS, CACHE_USE, LookupCache
+from memory_cache import MemoryCache
+from mirror_health import MirrorSelector
+from single_flight import SingleFlight
+from rate_limiter import HostRateLimiter
+from resolver import FunctionTier, LookupQuery, MemoryTier, PersistentCacheTier, ResolverEngine, with_key
 
-_CACHE_MISS = object()
-_REQUEST_GATE_LOCK = threading.Lock()
-_NEXT_REQUEST_NOT_BEFORE = 0.0
-_MIN_SECONDS_BETWEEN_REQUESTS = 2.0
+# Requests per second to each DBLP host; it drops on 429s and climbs back to the max.
+_RATE_LIMITER = HostRateLimiter(
+    rate=float(os.environ.get("DBLP_RATE_PER_SECOND", "0.5")),
+    burst=int(os.environ.get("DBLP_RATE_BURST", "2")),
+    min_rate=float(os.environ.get("DBLP_RATE_MIN_PER_SECOND", "0.05")),
+    max_rate=float(os.environ.get("DBLP_RATE_MAX_PER_SECOND", "1.0")),
+)
+_DBLP_SESSION_LOCK = threading.Lock()
+_DBLP_SESSION: Optional[requests.Session] = None
 _DATASET_LOCK = threading.Lock()
 _DATASET_SYNC_IN_PROGRESS = False
 _LOCAL_DBLP_XML_GZ = os.environ.get("DBLP_XML_GZ_PATH", os.path.join(os.getcwd(), ".cache", "dblp.xml.gz"))
 _LOCAL_DBLP_INDEX = os.environ.get("DBLP_INDEX_PATH", os.path.join(os.getcwd(), ".cache", "dblp_arxiv_index.json"))
+_LOCAL_DBLP_INDEX_DB = os.environ.get("DBLP_INDEX_DB_PATH", os.path.join(os.getcwd(), ".cache", "dblp_arxiv_index.sqlite3"))
+_LOCAL_DBLP_INDEX_BIN = os.environ.get("DBLP_INDEX_BIN_PATH", os.path.join(os.getcwd(), ".cache", "dblp_arxiv_index.bin"))
+_LOCAL_DBLP_INDEX_BLOOM = os.environ.get("DBLP_INDEX_BLOOM_PATH", os.path.join(os.getcwd(), ".cache", "dblp_arxiv_ids.bloom"))
+_BLOOM_FP_RATE = float(os.environ.get("DBLP_BLOOM_FP_RATE", str(DEFAULT_FP_RATE)))
+# How long an ID absent from the dump (per its Bloom filter) is trusted to be missing from DBLP.
+_NEGATIVE_TTL_SECONDS = float(os.environ.get("DBLP_NEGATIVE_TTL_HOURS", "168")) * 3600.0
+# Remote lookup results, found and not found, reused across runs and processes.
+_LOOKUP_CACHE = LookupCache(
+    os.environ.get("DBLP_LOOKUP_CACHE_PATH", os.path.join(os.getcwd(), ".cache", "dblp_lookup_cache.sqlite3")),
+    positive_ttl_seconds=float(os.environ.get("DBLP_LOOKUP_CACHE_TTL_HOURS", "720")) * 3600.0,
+    negative_ttl_seconds=float(os.environ.get("DBLP_LOOKUP_CACHE_NEGATIVE_TTL_HOURS", "24")) * 3600.0,
+)
+# Every answer not read from the dump, kept in this process by the shared resolver engine.
+_MEMORY_CACHE_ENTRIES = int(os.environ.get("DBLP_MEMORY_CACHE_ENTRIES", "10000"))
+_MEMORY_CACHE_BYTES = int(os.environ.get("DBLP_MEMORY_CACHE_MB", "32")) * 1024 * 1024
+_MEMORY_CACHE_TTL_SECONDS = float(os.environ.get("DBLP_MEMORY_CACHE_TTL_SECONDS", "120"))
+_MEMORY_CACHE_NEGATIVE_TTL_SECONDS = float(os.environ.get("DBLP_MEMORY_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+# Resolver tiers in the order they are asked; see build_resolver_engine.
+RESOLVER_TIERS = ("memory", "local_index", "title_index", "lookup_cache", "known_miss", "remote")
 _LOCAL_DBLP_SYNC_LOCKFILE = os.environ.get("DBLP_SYNC_LOCKFILE_PATH", os.path.join(os.getcwd(), ".cache", "dblp.sync.lock"))
-_DBLP_XML_URL = "https://dblp.org/xml/dblp.xml.gz"
-_LOCAL_INDEX_CACHE: Dict[str, dict] = {}
+# DBLP mirrors to search, in order of preference; the dump comes from the first
+# unless DBLP_XML_URL says otherwise. Point these at a local stand-in such as
+# benchmarks/fake_dblp.py to run offline.
+_DBLP_BASE_URLS = [
+    url.strip().rstrip("/")
+    for url in os.environ.get("DBLP_BASE_URLS", "https://dblp.org,https://dblp.uni-trier.de").split(",")
+    if url.strip()
+]
+_DBLP_XML_URL = os.environ.get("DBLP_XML_URL", f"{_DBLP_BASE_URLS[0]}/xml/dblp.xml.gz")
+_DBLP_SEARCH_URLS = [f"{base}/search/publ/api" for base in _DBLP_BASE_URLS]
+_MIRRORS = MirrorSelector(_DBLP_SEARCH_URLS)
+# Send a second request to the next-healthiest mirror once the first is slower
+# than this percentile of its recent requests, if that host has a free slot.
+_HEDGE_REQUESTS = os.environ.get("DBLP_HEDGE_REQUESTS", "0") == "1"
+_HEDGE_PERCENTILE = float(os.environ.get("DBLP_HEDGE_PERCENTILE", "0.9"))
+_HEDGE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dblp-hedge")
+# Remote searches in flight, so concurrent lookups of one arXiv ID share a request.
+_SINGLE_FLIGHT = SingleFlight()
+# Consecutive failed DBLP requests after which remote lookups stop for a while.
+_BREAKER = CircuitBreaker(
+    failure_threshold=int(os.environ.get("DBLP_BREAKER_FAILURES", "5")),
+    reset_timeout=float(os.environ.get("DBLP_BREAKER_RESET_SECONDS", "60")),
+)
+# arXiv IDs OR-ed into one search request by find_dblp_citations, and the hits
+# requested per ID (DBLP returns at most 1000 per request).
+_SEARCH_BATCH_SIZE = int(os.environ.get("DBLP_SEARCH_BATCH_SIZE", "10"))
+_HITS_PER_BATCHED_ID = 5
+_MAX_SEARCH_HITS = 1000
+# Also index every titled publication, so published versions that do not link
+# arXiv in ``ee`` can be matched by title. Needs SQLite. Off by default: every
+# record must then be parsed, which slows the rebuild and grows the index many times.
+_TITLE_INDEX_ENABLED = os.environ.get("DBLP_TITLE_INDEX", "0") == "1"
+# Build the index while the dump downloads rather than re-reading it afterwards.
+_SINGLE_PASS_SYNC = os.environ.get("DBLP_SYNC_SINGLE_PASS", "1") != "0"
 
 
 def _retry_wait_seconds(response: Optional[requests.Response], attempt: int) -> float:
@@ -40,26 +121,30 @@ def _retry_wait_seconds(response: Optional[requests.Response], attempt: int) ->
     return base_wait + random.uniform(0.0, 0.5)
 
 
-def _reserve_request_slot(min_gap_seconds: float = _MIN_SECONDS_BETWEEN_REQUESTS) -> None:
-    """Serialize outbound DBLP calls and enforce a small inter-request gap."""
-    global _NEXT_REQUEST_NOT_BEFORE
-    with _REQUEST_GATE_LOCK:
-        now = time.monotonic()
-        wait = max(0.0, _NEXT_REQUEST_NOT_BEFORE - now)
-        if wait > 0:
-            time.sleep(wait)
-            now = time.monotonic()
-        _NEXT_REQUEST_NOT_BEFORE = now + min_gap_seconds
+def _reserve_request_slot(host: str, deadline: Optional[Deadline] = None) -> None:
+    """Wait for this host's rate limiter; other threads queue without a shared lock.
 
+    Raises ``LookupDeadlineExceeded``, without taking a slot, when the slot
+    would only come after ``deadline``.
+    """
+    waited = _RATE_LIMITER.bucket(host).acquire(max_wait=remaining(deadline))
+    if waited is None:
+        raise LookupDeadlineExceeded(f"No DBLP request slot on {host} before the lookup deadline")
+    if waited >= 1.0:
+        logger.info(f"Waited {waited:.1f}s for a DBLP request slot on {host}")
 
-def _apply_global_cooldown(seconds: float) -> None:
-    global _NEXT_REQUEST_NOT_BEFORE
-    with _REQUEST_GATE_LOCK:
-        _NEXT_REQUEST_NOT_BEFORE = max(_NEXT_REQUEST_NOT_BEFORE, time.monotonic() + seconds)
 
+def rate_limiter_status() -> Dict[str, Dict[str, float]]:
+    """Current request rate, queue depth and cooldown of each DBLP host."""
+    return _RATE_LIMITER.stats()
 
-def ensure_local_dblp_dataset_fresh(max_age_hours: float = 24.0) -> None:
-    """Download DBLP XML dump and rebuild local arXiv index if stale/missing."""
+
+def ensure_local_dblp_dataset_fresh(max_age_hours: float = 24.0, single_pass: Optional[bool] = None) -> None:
+    """Download DBLP XML dump and rebuild local arXiv index if stale/missing.
+
+    ``single_pass`` (default: ``DBLP_SYNC_SINGLE_PASS``, on) indexes the dump
+    while it downloads; otherwise the downloaded file is parsed afterwards.
+    """
     global _DATASET_SYNC_IN_PROGRESS
     with _DATASET_LOCK:
         lock_fd: Optional[int] = None
@@ -73,19 +158,26 @@ def ensure_local_dblp_dataset_fresh(max_age_hours: float = 24.0) -> None:
         _DATASET_SYNC_IN_PROGRESS = True
         try:
             os.makedirs(os.path.dirname(_LOCAL_DBLP_XML_GZ), exist_ok=True)
-            os.makedirs(os.path.dirname(_LOCAL_DBLP_INDEX), exist_ok=True)
+            index_path = _local_index_path()
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
             now = time.time()
             stale_after = max_age_hours * 3600.0
 
             xml_missing = not os.path.exists(_LOCAL_DBLP_XML_GZ)
-            xml_stale = (not xml_missing) and ((now - os.path.getmtime(_LOCAL_DBLP_XML_GZ)) > stale_after)
+            xml_stale = (not xml_missing) and ((now - (dump_last_checked(_LOCAL_DBLP_XML_GZ) or 0.0)) > stale_after)
+            xml_changed = False
             if xml_missing or xml_stale:
                 logger.info("Refreshing local DBLP XML dataset")
-                _download_dblp_xml(_DBLP_XML_URL, _LOCAL_DBLP_XML_GZ)
+                if _SINGLE_PASS_SYNC if single_pass is None else single_pass:
+                    if _download_and_index_single_pass() is not None:
+                        return
+                else:
+                    xml_changed = _download_dblp_xml(_DBLP_XML_URL, _LOCAL_DBLP_XML_GZ)
 
-            idx_missing = not os.path.exists(_LOCAL_DBLP_INDEX)
-            idx_stale = (not idx_missing) and ((now - os.path.getmtime(_LOCAL_DBLP_INDEX)) > stale_after)
-            if idx_missing or idx_stale or xml_missing or xml_stale:
+            idx_missing = not _local_index_exists()
+            # An unchanged dump (304) leaves the index as is, however old it is.
+            idx_behind = (not idx_missing) and os.path.getmtime(index_path) < os.path.getmtime(_LOCAL_DBLP_XML_GZ)
+            if idx_missing or idx_behind or xml_changed:
                 _rebuild_local_arxiv_index()
         finally:
             _DATASET_SYNC_IN_PROGRESS = False
@@ -101,81 +193,286 @@ def is_dataset_sync_in_progress() -> bool:
     return _DATASET_SYNC_IN_PROGRESS
 
 
-def _rebuild_local_arxiv_index() -> None:
+def _local_index_path() -> str:
+    """Return the index file the rebuild job writes (SQLite unless unavailable)."""
+    return _LOCAL_DBLP_INDEX_DB if sqlite_available() else _LOCAL_DBLP_INDEX
+
+
+def _local_index_exists() -> bool:
+    if sqlite_available():
+        return sqlite_index_is_current(_LOCAL_DBLP_INDEX_DB)
+    return os.path.exists(_LOCAL_DBLP_INDEX)
+
+
+def _index_titles() -> bool:
+    return _TITLE_INDEX_ENABLED and sqlite_available()
+
+
+def _iter_arxiv_index_entries(xml_gz_path: str) -> Iterator[Tuple[str, dict]]:
+    """Yield ``(arxiv_id, entry)`` for every DBLP record that links an arXiv abstract."""
+    workers = default_worker_count()
+    if workers > 0:
+        logger.info(f"Extracting arXiv records with {workers} worker process(es)")
+        return iter_index_entries_parallel(xml_gz_path, workers=workers, with_titles=_index_titles())
+    return iter_index_entries(xml_gz_path, with_titles=_index_titles())
+
+
+IndexWriter = Union[SqliteIndexUpdater, SqliteIndexWriter, JsonIndexWriter]
+
+
+def _open_index_writer(incremental: bool) -> IndexWriter:
+    if sqlite_available() and incremental and sqlite_index_is_current(_LOCAL_DBLP_INDEX_DB):
+        logger.info("Updating local DBLP arXiv index incrementally")
+        return SqliteIndexUpdater(_LOCAL_DBLP_INDEX_DB)
     logger.info("Rebuilding local DBLP arXiv index")
-    arxiv_index: Dict[str, dict] = {}
-    valid_types = {"article", "inproceedings", "proceedings", "book", "incollection", "phdthesis", "mastersthesis", "www"}
-    with gzip.open(_LOCAL_DBLP_XML_GZ, "rb") as f:
-        context = ET.iterparse(f, events=("end",))
-        for _, elem in context:
-            if elem.tag not in valid_types:
-                continue
-            ee_vals = [e.text or "" for e in elem.findall("ee")]
-            arxiv_id = None
-            for ee in ee_vals:
-                if "arxiv.org/abs/" in ee:
-                    arxiv_id = ee.split("/abs/")[-1].split("v")[0]
-                    break
-            if not arxiv_id:
-                elem.clear()
-                continue
-            title = (elem.findtext("title") or "").strip()
-            year = (elem.findtext("year") or "").strip()
-            venue = (elem.findtext("journal") or elem.findtext("booktitle") or "").strip()
-            authors = [a.text.strip() for a in elem.findall("author") if a.text]
-            arxiv_index[arxiv_id] = {
-                "type": elem.tag if elem.tag in VALID_BIBTEX_TYPES else "misc",
-                "title": title,
-                "year": year,
-                "venue": venue,
-                "author": " and ".join(authors),
-                "ee": ee_vals[0] if ee_vals else "",
-            }
-            elem.clear()
-    with open(_LOCAL_DBLP_INDEX, "w", encoding="utf-8") as out:
-        import json
-        json.dump(arxiv_index, out)
-    _LOCAL_INDEX_CACHE.clear()
-
-
-def _download_dblp_xml(url: str, out_path: str, timeout: float = 120.0) -> None:
-    """Download DBLP XML dump using requests (more robust TLS handling than urllib on some systems)."""
-    tmp_path = f"{out_path}.tmp"
-    with requests.get(url, stream=True, timeout=timeout) as resp:
-        resp.raise_for_status()
-        total_bytes = int(resp.headers.get("Content-Length", "0") or "0")
-        downloaded = 0
-        next_log_percent = 5
-        with open(tmp_path, "wb") as out:
-            for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    out.write(chunk)
-                    downloaded += len(chunk)
-                    if total_bytes > 0:
-                        pct = int((downloaded / total_bytes) * 100)
-                        while pct >= next_log_percent and next_log_percent <= 100:
-                            logger.info(f"DBLP dataset download progress: {next_log_percent}%")
-                            next_log_percent += 5
-                    else:
-                        if downloaded % (25 * 1024 * 1024) < len(chunk):
-                            logger.info(f"DBLP dataset download progress: {downloaded // (1024 * 1024)} MB")
-    os.replace(tmp_path, out_path)
-
-
-def _load_local_index() -> Dict[str, dict]:
-    if _LOCAL_INDEX_CACHE:
-        return _LOCAL_INDEX_CACHE
-    if not os.path.exists(_LOCAL_DBLP_INDEX):
-        return {}
-    import json
-    with open(_LOCAL_DBLP_INDEX, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    _LOCAL_INDEX_CACHE.update(data)
-    return _LOCAL_INDEX_CACHE
+    if sqlite_available():
+        return SqliteIndexWriter(_LOCAL_DBLP_INDEX_DB)
+    return JsonIndexWriter(_LOCAL_DBLP_INDEX)
+
+
+def _finish_index_build(writer: IndexWriter, memory: PeakRssSampler) -> Dict[str, Optional[int]]:
+    # Mark the index as built from the current dump even if no row changed.
+    os.utime(_local_index_path())
+    stats: Dict[str, Optional[int]] = {
+        "entries": writer.count,
+        "peak_rss_bytes": memory.peak_bytes,
+        "worker_peak_rss_bytes": peak_rss_bytes(children=True),
+    }
+    delta = ""
+    if isinstance(writer, SqliteIndexUpdater):
+        stats["upserted"] = writer.upserted
+        stats["deleted"] = writer.deleted
+        stats["reordered"] = writer.reordered
+        delta = f", {writer.upserted} upserted, {writer.deleted} deleted, {writer.reordered} reordered"
+    logger.info(
+        f"Local DBLP arXiv index rebuilt from {writer.count} records{delta} "
+        f"(peak RSS {format_mb(stats['peak_rss_bytes'])}, "
+        f"largest worker process {format_mb(stats['worker_peak_rss_bytes'])})"
+    )
+    bloom = _write_bloom_filter(writer.count)
+    if bloom is not None:
+        stats["bloom_bytes"] = bloom["memory_bytes"]
+        logger.info(
+            f"arXiv ID filter: {bloom['keys']} IDs in {format_mb(bloom['memory_bytes'])}, "
+            f"{bloom['hashes']} hashes, expected false-positive rate {bloom['expected_fp_rate']:.2e}"
+        )
+    # Other processes notice the new generation on their next lookups; this one
+    # loads it now, while lookups keep using the previous generation.
+    bump_generation(_index_generation_path(), entries=writer.count)
+    _LOCAL_INDEX.reload()
+    return stats
+
+
+def _rebuild_local_arxiv_index(incremental: bool = True) -> Dict[str, Optional[int]]:
+    """Stream arXiv-linked records from the dump into the on-disk index files.
+
+    With an existing SQLite index and ``incremental`` set, only records whose
+    fingerprint changed are written and vanished records are deleted, in place,
+    while lookups keep reading the index.
+    """
+    writer = _open_index_writer(incremental)
+    with PeakRssSampler() as memory:
+        try:
+            for arxiv_id, entry in _iter_arxiv_index_entries(_LOCAL_DBLP_XML_GZ):
+                writer.add(arxiv_id, entry)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.commit(binary_path=_LOCAL_DBLP_INDEX_BIN)
+    return _finish_index_build(writer, memory)
+
+
+def _download_and_index_single_pass(incremental: bool = True) -> Optional[Dict[str, Optional[int]]]:
+    """Download the dump and build the index from the same byte stream.
+
+    The compressed bytes are teed to a ``StreamingIndexBuilder`` while they are
+    written to disk, so the index is ready when the download finishes instead
+    of after a second full read of the file. Returns the build stats, or None
+    if upstream answered 304 and nothing was built.
+    """
+    writer = _open_index_writer(incremental)
+    with PeakRssSampler() as memory:
+        builder = StreamingIndexBuilder(writer.add, workers=default_worker_count(), with_titles=_index_titles())
+        try:
+            changed = download_dump(_DBLP_XML_URL, _LOCAL_DBLP_XML_GZ, on_chunk=builder.feed)
+            if changed:
+                builder.close()
+        except BaseException:
+            builder.abort()
+            writer.abort()
+            raise
+        if not changed:
+            builder.abort()
+            writer.abort()
+            return None
+        writer.commit(binary_path=_LOCAL_DBLP_INDEX_BIN)
+    return _finish_index_build(writer, memory)
+
+
+def _download_dblp_xml(url: str, out_path: str, timeout: float = 120.0) -> bool:
+    """Conditionally download/resume the DBLP XML dump; return True if the file changed."""
+    return download_dump(url, out_path, timeout=timeout)
+
+
+LocalIndexReader = Union[BinaryIndexReader, SqliteIndexReader, JsonIndexReader]
+
+
+class _LocalIndexGeneration:
+    """The readers of one index generation: arXiv ID lookups, the title index and the ID filter."""
+
+    def __init__(
+        self,
+        source: str,
+        reader: LocalIndexReader,
+        title_reader: Optional[SqliteIndexReader],
+        bloom: Optional[BloomFilter] = None,
+    ):
+        self.source = source
+        self.reader = reader
+        self.title_reader = title_reader
+        self.bloom = bloom
+
+    def close(self) -> None:
+        self.reader.close()
+        if self.title_reader is not None and self.title_reader is not self.reader:
+            self.title_reader.close()
+
+
+def _open_local_index_readers() -> Optional[_LocalIndexGeneration]:
+    """Open the best available on-disk index: mmap binary first, then SQLite, then JSON."""
+    title_reader = SqliteIndexReader(_LOCAL_DBLP_INDEX_DB) if sqlite_index_is_current(_LOCAL_DBLP_INDEX_DB) else None
+    if os.path.exists(_LOCAL_DBLP_INDEX_BIN):
+        try:
+            return _LocalIndexGeneration("binary", BinaryIndexReader(_LOCAL_DBLP_INDEX_BIN), title_reader)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable binary DBLP index {_LOCAL_DBLP_INDEX_BIN}: {e}")
+    if title_reader is not None:
+        return _LocalIndexGeneration("sqlite", title_reader, title_reader)
+    if os.path.exists(_LOCAL_DBLP_INDEX):
+        return _LocalIndexGeneration("json", JsonIndexReader(_LOCAL_DBLP_INDEX), None)
+    return None
+
+
+def _load_bloom_filter() -> Optional[BloomFilter]:
+    if not os.path.exists(_LOCAL_DBLP_INDEX_BLOOM):
+        return None
+    try:
+        bloom = BloomFilter.load(_LOCAL_DBLP_INDEX_BLOOM)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable arXiv ID filter {_LOCAL_DBLP_INDEX_BLOOM}: {e}")
+        return None
+    # A filter older than the index would turn new IDs into false misses.
+    if bloom.created_at < os.path.getmtime(_local_index_path()):
+        logger.warning(f"Ignoring arXiv ID filter {_LOCAL_DBLP_INDEX_BLOOM}: older than the index")
+        return None
+    return bloom
+
+
+def _open_local_index_generation() -> Optional[_LocalIndexGeneration]:
+    generation = _open_local_index_readers()
+    if generation is not None:
+        generation.bloom = _load_bloom_filter()
+    return generation
+
+
+def _write_bloom_filter(capacity: int) -> Optional[Dict[str, object]]:
+    """Write the filter of every arXiv ID in the freshly built index."""
+    readers = _open_local_index_readers()
+    if readers is None:
+        return None
+    try:
+        return build_bloom_filter(_LOCAL_DBLP_INDEX_BLOOM, readers.reader.iter_ids(), capacity, _BLOOM_FP_RATE)
+    finally:
+        readers.close()
+
+
+def _index_generation_path() -> str:
+    return f"{_local_index_path()}.generation.json"
+
+
+_LOCAL_INDEX: IndexHandle[_LocalIndexGeneration] = IndexHandle(_open_local_index_generation, _index_generation_path)
+
+
+def _get_local_index_reader() -> Optional[LocalIndexReader]:
+    generation = _LOCAL_INDEX.current()
+    return generation.reader if generation is not None else None
+
+
+def _get_title_index_reader() -> Optional[SqliteIndexReader]:
+    """The SQLite index, which is the only one that carries the title index."""
+    generation = _LOCAL_INDEX.current()
+    return generation.title_reader if generation is not None else None
+
+
+def _reset_local_index() -> None:
+    """Close every open generation; the next lookup opens the index on disk."""
+    _LOCAL_INDEX.close()
+
+
+def local_index_status() -> Dict[str, object]:
+    """Active index generation of this process, and the newest one on disk."""
+    status = _LOCAL_INDEX.status()
+    generation = _LOCAL_INDEX.peek()
+    status["source"] = generation.source if generation is not None else None
+    status["bloom"] = generation.bloom.stats() if generation is not None and generation.bloom is not None else None
+    status["lookup_cache"] = _LOOKUP_CACHE.stats()
+    status["single_flight"] = _SINGLE_FLIGHT.stats()
+    status["sync_in_progress"] = is_dataset_sync_in_progress()
+    return status
+
+
+def _lookup_local_index(arxiv_id: str) -> Optional[dict]:
+    generation = _LOCAL_INDEX.current()
+    if generation is None:
+        return None
+    if generation.bloom is not None and arxiv_id not in generation.bloom:
+        return None
+    return generation.reader.get(arxiv_id)
+
+
+def _is_known_miss(arxiv_id: str) -> bool:
+    """True if ``arxiv_id`` was absent from a recent dump."""
+    generation = _LOCAL_INDEX.current()
+    bloom = generation.bloom if generation is not None else None
+    return bloom is not None and arxiv_id not in bloom and time.time() - bloom.created_at <= _NEGATIVE_TTL_SECONDS
+
+
+def _is_preprint(entry: dict) -> bool:
+    return entry.get("venue", "") == "CoRR" or "arxiv.org/abs/" in entry.get("ee", "")
+
+
+def _match_local_title(title: str, author: str) -> Optional[dict]:
+    """Best published (non-arXiv) record with this title and first-author surname."""
+    reader = _get_title_index_reader()
+    if reader is None or not title:
+        return None
+    for score, dblp_key, entry in reader.find_by_title(title, author):
+        if not _is_preprint(entry):
+            logger.info(f"Matched DBLP record {dblp_key} by title (similarity {score:.2f})")
+            return entry
+    return None
+
+
+def _citation_from_entry(entry: dict, original_key: str) -> dict:
+    return {
+        "type": entry.get("type", "misc"),
+        "citation_key": original_key,
+        "fields": {
+            "title": entry.get("title", ""),
+            "year": entry.get("year", ""),
+            "venue": entry.get("venue", ""),
+            "ee": entry.get("ee", ""),
+            "author": entry.get("author", ""),
+        },
+    }
 
 
 def _build_dblp_session() -> requests.Session:
     session = requests.Session()
+    session.headers.update({
+        "User-Agent": "arXivToDBLP/1.0 (+https://dblp.org)",
+        "Accept": "application/json",
+    })
     retry = Retry(
         total=0,
         connect=0,
@@ -192,95 +489,229 @@ def _build_dblp_session() -> requests.Session:
     return session
 
 
-def try_fetch_from_dblp(arxiv_id, max_retries=5, request_timeout=10):
-    base_urls = [
-        "https://dblp.org/search/publ/api",
-        "https://dblp.uni-trier.de/search/publ/api",
-    ]
-    headers = {
-        "User-Agent": "arXivToDBLP/1.0 (+https://dblp.org)",
-        "Accept": "application/json",
-        "Connection": "close",
-    }
+def _get_dblp_session() -> requests.Session:
+    """The keep-alive session every DBLP API call of this process shares."""
+    global _DBLP_SESSION
+    with _DBLP_SESSION_LOCK:
+        if _DBLP_SESSION is None:
+            _DBLP_SESSION = _build_dblp_session()
+        return _DBLP_SESSION
+
+
+def _discard_dblp_session(session: requests.Session) -> None:
+    """Forget ``session`` after a connection error; the next call reconnects.
+
+    It is not closed here: other threads may still be reading a response from
+    it, and its pooled sockets are released once the last of them is done.
+    """
+    global _DBLP_SESSION
+    with _DBLP_SESSION_LOCK:
+        if _DBLP_SESSION is session:
+            _DBLP_SESSION = None
+
+
+def _timed_get(session: requests.Session, url: str, params: dict, timeout: float) -> requests.Response:
+    """GET ``url`` and record the latency and outcome against that mirror."""
+    started = time.monotonic()
+    try:
+        response = session.get(url, params=params, timeout=timeout)
+    except requests.RequestException:
+        _MIRRORS.record(url, time.monotonic() - started, ok=False)
+        raise
+    _MIRRORS.record(url, time.monotonic() - started, ok=response.status_code < 500 and response.status_code != 429)
+    return response
+
+
+def _discard_response(future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _hedged_get(session: requests.Session, urls: List[str], params: dict, timeout: float) -> Tuple[str, requests.Response]:
+    """Ask ``urls[0]``; if it is slow, also ask ``urls[1]`` and keep whichever answers first.
+
+    The second request is only sent when its host's rate limiter has a slot
+    free right away, so hedging never exceeds the request budget. The losing
+    request cannot be aborted mid-flight: it is cancelled if it has not
+    started, and otherwise its response is closed and ignored.
+    """
+    primary = urls[0]
+    first = _HEDGE_POOL.submit(_timed_get, session, primary, params, timeout)
+    try:
+        return primary, first.result(timeout=_MIRRORS.hedge_delay(primary, _HEDGE_PERCENTILE, timeout / 2))
+    except FutureTimeout:
+        pass
+    backup = urls[1]
+    if not _RATE_LIMITER.bucket(urlsplit(backup).netloc).try_acquire():
+        return primary, first.result()
+    logger.info(f"Hedging slow DBLP request to {primary} with {backup}")
+    second = _HEDGE_POOL.submit(_timed_get, session, backup, params, timeout)
+    pending = {first: primary, second: backup}
+    while True:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        winner = next(iter(done))
+        url = pending.pop(winner)
+        if winner.exception() is None or not pending:
+            break
+    for loser in pending:
+        loser.cancel()
+        loser.add_done_callback(_discard_response)
+    return url, winner.result()
+
+
+def _out_of_time(label: str) -> LookupDeadlineExceeded:
+    logger.warning(f"Giving up on DBLP query for {label}: lookup deadline reached")
+    return LookupDeadlineExceeded(f"DBLP lookup for {label} ran out of time")
+
+
+def _search_dblp(
+    query: str,
+    label: str,
+    max_retries: int = 5,
+    request_timeout: float = 10,
+    hits: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+):
+    """Run one DBLP publication search on the healthiest mirror, retrying across them.
+
+    A retry that goes to a different mirror than the one that just failed is
+    sent at once; the backoff sleep only applies when the same mirror would be
+    asked again. Network errors and 5xx answers count against the circuit
+    breaker; while it is open, ``LookupDeferred`` is raised without a request.
+    With a ``deadline``, each request's timeout is cut to the time left, and
+    ``LookupDeadlineExceeded`` is raised instead of a rate-limiter wait or a
+    backoff sleep that would end past it.
+    """
+    params: Dict[str, object] = {"q": query, "format": "json"}
+    if hits is not None:
+        params["h"] = hits
 
     for attempt in range(max_retries):
+        if deadline is not None and deadline.expired():
+            raise _out_of_time(label)
+        if not _BREAKER.allow():
+            logger.warning(f"Deferring DBLP query for {label}: remote lookups paused after repeated failures")
+            raise LookupDeferred(
+                f"DBLP remote lookups are paused; {label} deferred (retry in {_BREAKER.retry_in():.0f}s)"
+            )
         response: Optional[requests.Response] = None
-        session = _build_dblp_session()
-        base_url = base_urls[attempt % len(base_urls)]
+        session = _get_dblp_session()
+        urls = _MIRRORS.ranked()
+        base_url = urls[0]
+        host = urlsplit(base_url).netloc
+        # Anything leaving the attempt before the breaker hears an outcome
+        # (deadline, unexpected error) must not keep the half-open probe slot.
+        outcome_recorded = False
         try:
-            _reserve_request_slot()
-            logger.info(f"Querying DBLP for arXiv ID: {arxiv_id} via {base_url}")
-            response = session.get(
-                base_url,
-                params={"q": arxiv_id, "format": "json"},
-                timeout=request_timeout,
-                headers=headers,
-            )
+            _reserve_request_slot(host, deadline)
+            timeout = deadline.cap(request_timeout) if deadline is not None else request_timeout
+            if timeout <= 0:
+                raise _out_of_time(label)
+            logger.info(f"Querying DBLP for {label} via {base_url}")
+            if _HEDGE_REQUESTS and len(urls) > 1:
+                base_url, response = _hedged_get(session, urls, params, timeout)
+                host = urlsplit(base_url).netloc
+            else:
+                response = _timed_get(session, base_url, params, timeout)
+            outcome_recorded = True
+            if response.status_code >= 500:
+                _BREAKER.record_failure()
+            else:
+                _BREAKER.record_success()
             if response.status_code == 200:
+                _RATE_LIMITER.bucket(host).on_success()
                 return response.json()
-            logger.warning(f"Received {response.status_code} from DBLP for ID {arxiv_id} via {base_url}")
+            logger.warning(f"Received {response.status_code} from DBLP for {label} via {base_url}")
             if response.status_code == 429:
                 cooldown = _retry_wait_seconds(response, attempt)
+                bucket = _RATE_LIMITER.bucket(host)
+                bucket.on_throttled(cooldown)
                 logger.warning(
-                    f"DBLP asked us to back off for ~{cooldown:.1f}s (429/Retry-After) for {arxiv_id}"
+                    f"DBLP asked us to back off for ~{cooldown:.1f}s (429/Retry-After) for {label}; "
+                    f"{host} rate now {bucket.rate:.2f} req/s"
                 )
-                _apply_global_cooldown(max(cooldown, 10.0))
         except requests.RequestException as e:
+            outcome_recorded = True
+            _BREAKER.record_failure()
+            if isinstance(e, requests.ConnectionError):
+                _discard_dblp_session(session)
             if attempt < max_retries - 1:
-                logger.warning(f"Transient network error while querying DBLP (attempt {attempt + 1}/{max_retries}) for {arxiv_id}: {e}")
+                logger.warning(f"Transient network error while querying DBLP (attempt {attempt + 1}/{max_retries}) for {label}: {e}")
             else:
-                logger.error(f"Network error while querying DBLP for {arxiv_id}: {e}")
+                logger.error(f"Network error while querying DBLP for {label}: {e}")
         finally:
-            session.close()
+            if not outcome_recorded:
+                _BREAKER.release_probe()
 
-        if attempt < max_retries - 1:
+        if attempt < max_retries - 1 and _MIRRORS.ranked()[0] == base_url and _BREAKER.state != OPEN:
             wait_seconds = _retry_wait_seconds(response, attempt)
-            logger.info(f"Waiting {wait_seconds:.1f}s before retrying DBLP ID {arxiv_id}")
+            if deadline is not None and wait_seconds >= deadline.remaining():
+                raise _out_of_time(label)
+            logger.info(f"Waiting {wait_seconds:.1f}s before retrying DBLP query for {label}")
             time.sleep(wait_seconds)
 
-    logger.error(f"Failed to fetch from DBLP for {arxiv_id} after {max_retries} retries.")
-    raise LookupFailure(f"DBLP lookup failed for arXiv ID {arxiv_id}")
-
-
-def find_dblp_citation(arxiv_id, original_key, request_timeout=10, min_confidence=0.0):
-    local_idx = _load_local_index()
-    local_hit = local_idx.get(arxiv_id)
-    if local_hit:
-        return {
-            "type": local_hit.get("type", "misc"),
-            "citation_key": original_key,
-            "fields": {
-                "title": local_hit.get("title", ""),
-                "year": local_hit.get("year", ""),
-                "venue": local_hit.get("venue", ""),
-                "ee": local_hit.get("ee", ""),
-                "author": local_hit.get("author", ""),
-            },
-        }
-
-    data = try_fetch_from_dblp(arxiv_id, request_timeout=request_timeout)
-    if not data:
-        return None
+    logger.error(f"Failed to fetch from DBLP for {label} after {max_retries} retries.")
+    raise LookupFailure(f"DBLP lookup failed for {label}")
+
+
+def remote_breaker_status() -> Dict[str, object]:
+    """State of the circuit breaker in front of the DBLP search API."""
+    return _BREAKER.stats()
 
-    hits = data.get('result', {}).get('hits', {})
-    if int(hits.get('@total', 0)) == 0:
-        logger.warning(f"No DBLP match found for citation key: {original_key}")
-        return None
 
+def use_dblp_base_urls(base_urls: Sequence[str], xml_url: Optional[str] = None) -> None:
+    """Send searches (and, unless ``xml_url`` is given, the dump download) to other DBLP hosts.
+
+    Mirror health starts over for the new endpoints.
+    """
+    global _DBLP_BASE_URLS, _DBLP_SEARCH_URLS, _DBLP_XML_URL, _MIRRORS
+    bases = [url.rstrip("/") for url in base_urls if url]
+    if not bases:
+        raise ValueError("At least one DBLP base URL is required")
+    _DBLP_BASE_URLS = bases
+    _DBLP_SEARCH_URLS = [f"{base}/search/publ/api" for base in bases]
+    _DBLP_XML_URL = xml_url or f"{bases[0]}/xml/dblp.xml.gz"
+    _MIRRORS = MirrorSelector(_DBLP_SEARCH_URLS)
+
+
+def mirror_status() -> Dict[str, Dict[str, object]]:
+    """Latency, error rate and routing score of each DBLP search mirror."""
+    return _MIRRORS.stats()
+
+
+def try_fetch_from_dblp(arxiv_id, max_retries=5, request_timeout=10, deadline: Optional[Deadline] = None):
+    return _search_dblp(arxiv_id, f"arXiv ID {arxiv_id}", max_retries, request_timeout, deadline=deadline)
+
+
+def try_fetch_many_from_dblp(
+    arxiv_ids: Sequence[str], max_retries=5, request_timeout=10, deadline: Optional[Deadline] = None
+):
+    """Search several arXiv IDs in one request, OR-ed together with DBLP's ``|``."""
+    hits = min(_MAX_SEARCH_HITS, _HITS_PER_BATCHED_ID * len(arxiv_ids))
+    return _search_dblp(
+        "|".join(arxiv_ids), f"{len(arxiv_ids)} arXiv IDs", max_retries, request_timeout, hits=hits, deadline=deadline
+    )
+
+
+def _search_hits(data: dict) -> Tuple[int, Optional[List[dict]]]:
+    """The reported total and the ``info`` of every returned hit (None if malformed)."""
+    hits = data.get('result', {}).get('hits', {})
+    total = int(hits.get('@total', 0))
     raw_hit = hits.get('hit', [])
     if isinstance(raw_hit, dict):
-        candidate_hits = [(raw_hit.get("info") or {})]
-    elif isinstance(raw_hit, list) and raw_hit:
-        candidate_hits = [(h.get("info") or {}) for h in raw_hit if isinstance(h, dict)]
-    else:
-        logger.warning(f"Malformed DBLP response for citation key: {original_key}")
-        return None
-    hit = candidate_hits[0]
-    for cand in candidate_hits:
-        blob = " ".join(str(cand.get(k, "")) for k in ("ee", "url", "note", "key", "title"))
-        if arxiv_id in blob:
-            hit = cand
-            break
+        return total, [(raw_hit.get("info") or {})]
+    if isinstance(raw_hit, list) and raw_hit:
+        return total, [(h.get("info") or {}) for h in raw_hit if isinstance(h, dict)]
+    return total, None
+
+
+def _hit_mentions(info: dict, arxiv_id: str) -> bool:
+    """True if the hit links or names ``arxiv_id`` (and not a longer ID it prefixes)."""
+    blob = " ".join(str(info.get(k, "")) for k in ("ee", "url", "note", "key", "title"))
+    return re.search(rf"(?<![\d.]){re.escape(arxiv_id)}(?!\d)", blob) is not None
+
+
+def _citation_from_hit(hit: dict, original_key: str) -> dict:
     record_type = hit.get('type', 'misc')
     if record_type not in VALID_BIBTEX_TYPES:
         record_type = 'misc'
@@ -295,54 +726,310 @@ def find_dblp_citation(arxiv_id, original_key, request_timeout=10, min_confidenc
         'fields': {k: v for k, v in hit.items() if k not in ['type', 'key', 'authors']}
     }
     citation['fields']['author'] = authors
-    if min_confidence >= 0.7:
-        source_blob = " ".join(str(hit.get(k, "")) for k in ("ee", "url", "note", "key", "title"))
-        if arxiv_id not in source_blob:
-            return None
     return citation
 
 
+def _confident(citation: Optional[dict], arxiv_id: str, min_confidence: float) -> Optional[dict]:
+    """Drop a remote match that does not link ``arxiv_id`` when high confidence is required."""
+    if citation and min_confidence >= 0.7 and not _hit_mentions(citation.get("fields") or {}, arxiv_id):
+        return None
+    return citation
+
+
+def _citation_from_search(data, arxiv_id: str, original_key: str) -> Optional[dict]:
+    """Pick the best hit of a single-ID search, preferring one that links ``arxiv_id``."""
+    if not data:
+        return None
+    total, candidate_hits = _search_hits(data)
+    if total == 0:
+        logger.warning(f"No DBLP match found for citation key: {original_key}")
+        return None
+    if not candidate_hits:
+        logger.warning(f"Malformed DBLP response for citation key: {original_key}")
+        return None
+    hit = next((cand for cand in candidate_hits if _hit_mentions(cand, arxiv_id)), candidate_hits[0])
+    return _citation_from_hit(hit, original_key)
+
+
+def lookup_cache_counters() -> Dict[str, int]:
+    """Hits and misses of the persistent lookup cache in this process so far."""
+    return _LOOKUP_CACHE.counters()
+
+
+def prune_lookup_caches() -> int:
+    """Delete expired remote results, found or not; return how many went."""
+    return _LOOKUP_CACHE.purge_expired()
+
+
+def _local_index_answer(query: LookupQuery):
+    """The arXiv-linked record in the dump, swapped for its published version when it is the preprint."""
+    entry = _lookup_local_index(query.arxiv_id)
+    if not entry:
+        return CACHE_MISS
+    if _is_preprint(entry):
+        entry = _match_local_title(entry.get("title", ""), entry.get("author", "")) or entry
+    return _citation_from_entry(entry, query.key)
+
+
+def _title_index_answer(query: LookupQuery):
+    """A published record matching the citing entry's title and first author."""
+    entry = _match_local_title(query.title, query.author or "") if query.title else None
+    return _citation_from_entry(entry, query.key) if entry else CACHE_MISS
+
+
+def _known_miss_answer(query: LookupQuery):
+    if query.cache_mode == CACHE_USE and _is_known_miss(query.arxiv_id):
+        logger.info(f"Skipping DBLP search for {query.arxiv_id}: known miss")
+        return None
+    return CACHE_MISS
+
+
+def _remote_answer(query: LookupQuery) -> Optional[dict]:
+    return with_key(_fetch_remote_once(query.arxiv_id, query.key, query.request_timeout, query.deadline), query.key)
+
+
+def _remote_answers(queries: Sequence[LookupQuery], batch_size: Optional[int] = None) -> Dict[str, Optional[dict]]:
+    first = queries[0]
+    return search_dblp_citations(
+        [query.arxiv_id for query in queries],
+        [query.key for query in queries],
+        request_timeout=first.request_timeout,
+        batch_size=batch_size or _SEARCH_BATCH_SIZE,
+        deadline=first.deadline,
+    )
+
+
+def build_resolver_engine(
+    tiers: Sequence[str] = RESOLVER_TIERS,
+    memory_cache: Optional[MemoryCache] = None,
+    lookup_cache: Optional[LookupCache] = None,
+) -> ResolverEngine:
+    """An engine with the named tiers of ``RESOLVER_TIERS``, in that order.
+
+    The memory tier gets ``memory_cache`` or a fresh one sized from the
+    ``DBLP_MEMORY_CACHE_*`` settings; the persistent tier uses
+    ``lookup_cache`` or, by default, whatever ``_LOOKUP_CACHE`` is at the time.
+    The index, known-miss and remote tiers use this module's shared state.
+    """
+    factories = {
+        "memory": lambda: MemoryTier(memory_cache if memory_cache is not None else _new_memory_cache()),
+        "local_index": lambda: FunctionTier("local_index", _local_index_answer, local=True),
+        "title_index": lambda: FunctionTier("title_index", _title_index_answer, local=True),
+        "known_miss": lambda: FunctionTier("known_miss", _known_miss_answer, local=True),
+        "lookup_cache": lambda: PersistentCacheTier(lookup_cache if lookup_cache is not None else lambda: _LOOKUP_CACHE),
+        "remote": lambda: FunctionTier("remote", _remote_answer, _remote_answers, remote=True),
+    }
+    unknown = set(tiers) - set(factories)
+    if unknown:
+        raise ValueError(f"Unknown resolver tiers: {', '.join(sorted(unknown))}")
+    return ResolverEngine([factories[name]() for name in tiers])
+
+
+def _new_memory_cache() -> MemoryCache:
+    return MemoryCache(
+        max_entries=_MEMORY_CACHE_ENTRIES,
+        max_bytes=_MEMORY_CACHE_BYTES,
+        positive_ttl_seconds=_MEMORY_CACHE_TTL_SECONDS,
+        negative_ttl_seconds=_MEMORY_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+
+
+_ENGINE = build_resolver_engine()
+
+
+def resolver_status() -> Dict[str, Dict[str, object]]:
+    """Hit rate and latency of each tier of the shared resolver engine."""
+    return _ENGINE.stats()
+
+
+def find_dblp_citation(
+    arxiv_id,
+    original_key,
+    request_timeout=10,
+    min_confidence=0.0,
+    title=None,
+    author=None,
+    cache_mode=CACHE_USE,
+    deadline: Optional[Deadline] = None,
+):
+    """Resolve ``arxiv_id`` to a DBLP citation through the shared resolver engine.
+
+    A local arXiv-linked record that is only the CoRR preprint is swapped for
+    the published version found through the title index; ``title``/``author``
+    from the citing entry let the title index answer IDs DBLP does not link.
+    Otherwise the in-process and persistent lookup caches are consulted before
+    DBLP is searched; ``cache_mode`` ``"refresh"`` searches again (ignoring
+    known misses too) and stores the new result, ``"bypass"`` neither reads
+    nor writes the caches. ``deadline`` bounds the remote search, waits and
+    retries included. ``min_confidence`` only filters answers not read from
+    the dump.
+    """
+    query = LookupQuery(arxiv_id, original_key, title, author, cache_mode, deadline, request_timeout)
+    citation, tier = _ENGINE.resolve(query)
+    if citation is CACHE_MISS:
+        return None
+    if tier.local:
+        return citation
+    return _confident(citation, arxiv_id, min_confidence)
+
+
+def _fetch_remote_once(
+    arxiv_id: str,
+    original_key: str,
+    request_timeout: float,
+    deadline: Optional[Deadline] = None,
+) -> Optional[dict]:
+    """Search DBLP for ``arxiv_id``; concurrent callers for the same ID share one search.
+
+    The search runs under the first caller's deadline; a caller joining it
+    waits no longer than its own.
+    """
+    def fetch() -> Optional[dict]:
+        data = try_fetch_from_dblp(arxiv_id, request_timeout=request_timeout, deadline=deadline)
+        return _citation_from_search(data, arxiv_id, original_key)
+
+    try:
+        return _SINGLE_FLIGHT.do(arxiv_id, fetch, timeout=remaining(deadline))
+    except TimeoutError:
+        raise LookupDeadlineExceeded(f"DBLP lookup for arXiv ID {arxiv_id} ran out of time") from None
+
+
+def find_dblp_citations(
+    arxiv_ids: Sequence[str],
+    original_keys: Sequence[str],
+    request_timeout: float = 10,
+    batch_size: int = _SEARCH_BATCH_SIZE,
+    cache_mode: str = CACHE_USE,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Optional[dict]]:
+    """Resolve several arXiv IDs with as few DBLP requests as possible.
+
+    IDs a tier before the remote one answers (as in ``find_dblp_citation``,
+    per ``cache_mode``) cost nothing. The rest are searched ``batch_size`` at
+    a time with one OR query each, and every ID gets the hit whose
+    ``ee``/``url`` links it. An ID that no hit links is a miss when DBLP
+    returned all its hits, and is searched on its own when the result was cut
+    off at ``h``. Returns a citation (or None) per distinct ID, keyed with the
+    first of its ``original_keys``.
+    """
+    queries = [
+        LookupQuery(arxiv_id, original_key, cache_mode=cache_mode, deadline=deadline, request_timeout=request_timeout)
+        for arxiv_id, original_key in zip(arxiv_ids, original_keys)
+    ]
+    return _ENGINE.resolve_many(queries, batch_size=batch_size)
+
+
+def search_dblp_citations(
+    arxiv_ids: Sequence[str],
+    original_keys: Sequence[str],
+    request_timeout: float = 10,
+    batch_size: int = _SEARCH_BATCH_SIZE,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Optional[dict]]:
+    """The remote tier's batch search: look up distinct IDs on DBLP, ``batch_size`` per request.
+
+    Every request, follow-up searches included, shares ``deadline``.
+    """
+    first_keys = dict(zip(arxiv_ids, original_keys))
+    remote_ids = list(first_keys)
+    results: Dict[str, Optional[dict]] = {}
+    batch_size = max(1, batch_size)
+    for start in range(0, len(remote_ids), batch_size):
+        batch = remote_ids[start:start + batch_size]
+        if len(batch) == 1:
+            data = try_fetch_from_dblp(batch[0], request_timeout=request_timeout, deadline=deadline)
+            results[batch[0]] = _citation_from_search(data, batch[0], first_keys[batch[0]])
+            continue
+        data = try_fetch_many_from_dblp(batch, request_timeout=request_timeout, deadline=deadline)
+        if not data:
+            results.update((arxiv_id, None) for arxiv_id in batch)
+            continue
+        total, candidate_hits = _search_hits(data)
+        if total and not candidate_hits:
+            logger.warning(f"Malformed DBLP response for a batched search of {len(batch)} arXiv IDs")
+            results.update((arxiv_id, None) for arxiv_id in batch)
+            continue
+        candidate_hits = candidate_hits or []
+        complete = len(candidate_hits) >= total
+        for arxiv_id in batch:
+            original_key = first_keys[arxiv_id]
+            hit = next((cand for cand in candidate_hits if _hit_mentions(cand, arxiv_id)), None)
+            if hit is not None:
+                results[arxiv_id] = _citation_from_hit(hit, original_key)
+            elif complete:
+                logger.warning(f"No DBLP match found for citation key: {original_key}")
+                results[arxiv_id] = None
+            else:
+                data = try_fetch_from_dblp(arxiv_id, request_timeout=request_timeout, deadline=deadline)
+                results[arxiv_id] = _citation_from_search(data, arxiv_id, original_key)
+    return results
+
+
 class DblpLookupService:
-    """Resolve arXiv IDs to DBLP records with dedupe and short cache."""
+    """Resolve arXiv IDs to DBLP records with dedupe and short cache.
+
+    ``lookup_many`` runs on up to ``max_concurrency`` worker threads: local
+    answers first, then remote batches side by side. Burst control is left to
+    the per-host rate limiter every remote request goes through.
+    ``total_timeout_budget`` is one deadline shared by every request, rate
+    limiter wait and retry of the call. Lookups go through the service's own
+    resolver engine, whose memory tier is a bounded LRU (``cache_max_entries``,
+    ``cache_max_bytes``) keeping results for ``cache_ttl_seconds``, or
+    ``negative_cache_ttl_seconds`` when nothing was found.
+    """
 
     def __init__(
         self,
-        max_concurrency: int = 1,
+        max_concurrency: int = 4,
         per_request_timeout: float = 8.0,
         total_timeout_budget: float = 20.0,
         cache_ttl_seconds: float = 120.0,
+        batch_size: int = _SEARCH_BATCH_SIZE,
+        negative_cache_ttl_seconds: float = 30.0,
+        cache_max_entries: int = 10_000,
+        cache_max_bytes: int = 32 * 1024 * 1024,
     ):
-        # Intentionally pinned to sequential DBLP requests to avoid burst traffic.
-        self.max_concurrency = 1
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
         self.per_request_timeout = per_request_timeout
         self.total_timeout_budget = total_timeout_budget
-        self.cache_ttl_seconds = cache_ttl_seconds
-        self._cache: Dict[str, Tuple[float, Optional[dict]]] = {}
-        self._cache_lock = threading.Lock()
-
-    def _cache_get(self, arxiv_id: str):
-        now = time.time()
-        with self._cache_lock:
-            cached = self._cache.get(arxiv_id)
-            if cached is None:
-                return _CACHE_MISS
-            ts, value = cached
-            if now - ts > self.cache_ttl_seconds:
-                self._cache.pop(arxiv_id, None)
-                return _CACHE_MISS
-            return value
-
-    def _cache_set(self, arxiv_id: str, value: Optional[dict]) -> None:
-        with self._cache_lock:
-            self._cache[arxiv_id] = (time.time(), value)
-
-    def _fetch_one(self, arxiv_id: str, original_key: str) -> Optional[dict]:
-        return find_dblp_citation(
-            arxiv_id,
-            original_key,
-            request_timeout=self.per_request_timeout,
+        self._cache = MemoryCache(
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            positive_ttl_seconds=cache_ttl_seconds,
+            negative_ttl_seconds=negative_cache_ttl_seconds,
         )
 
+        self.engine = build_resolver_engine(memory_cache=self._cache)
+
+    def cache_stats(self) -> Dict[str, object]:
+        """Size, limits and hit/miss/eviction counters of the in-process result cache."""
+        return self._cache.stats()
+
+    def resolver_stats(self) -> Dict[str, Dict[str, object]]:
+        """Hit rate and latency of each tier of this service's resolver engine."""
+        return self.engine.stats()
+
+    def _resolve_local(self, arxiv_id: str, original_key: str):
+        """Answer without the network, or ``CACHE_MISS``."""
+        return self.engine.resolve(LookupQuery(arxiv_id, original_key), remote=False)[0]
+
+    def _fetch_batch(
+        self, arxiv_ids: List[str], original_keys: List[str], deadline: Optional[Deadline] = None
+    ) -> Dict[str, Optional[dict]]:
+        queries = [
+            LookupQuery(arxiv_id, original_key, deadline=deadline, request_timeout=self.per_request_timeout)
+            for arxiv_id, original_key in zip(arxiv_ids, original_keys)
+        ]
+        return self.engine.resolve_many(queries, local=False, batch_size=len(arxiv_ids), remember=False)
+
+    def _remote_batches(self, arxiv_ids: List[str]) -> List[List[str]]:
+        """Split IDs so every worker gets a batch, each at most ``batch_size`` long."""
+        if not arxiv_ids:
+            return []
+        size = min(self.batch_size, -(-len(arxiv_ids) // self.max_concurrency))
+        return [arxiv_ids[i:i + size] for i in range(0, len(arxiv_ids), size)]
+
     def lookup_many(
         self,
         arxiv_ids: List[Optional[str]],
@@ -360,37 +1047,41 @@ class DblpLookupService:
                 unique_ids.append(arxiv_id)
                 first_keys[arxiv_id] = original_key or arxiv_id
 
-        pending_ids: List[str] = []
-        for arxiv_id in unique_ids:
-            cached = self._cache_get(arxiv_id)
-            if cached is not _CACHE_MISS:
-                results_by_id[arxiv_id] = cached
-            else:
-                pending_ids.append(arxiv_id)
-
-        deadline = time.monotonic() + self.total_timeout_budget
-        for arxiv_id in pending_ids:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                logger.warning(f"DBLP lookup budget exhausted; skipping unresolved ID {arxiv_id}")
-                results_by_id[arxiv_id] = None
-                self._cache_set(arxiv_id, None)
-                continue
+        deadline = Deadline(self.total_timeout_budget)
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="dblp-lookup")
+        try:
+            remote_ids: List[str] = []
+            remote = self.engine.tier("remote")
+            local = pool.map(lambda arxiv_id: self._resolve_local(arxiv_id, first_keys[arxiv_id]), unique_ids)
+            for arxiv_id, answer in zip(unique_ids, local):
+                if answer is CACHE_MISS:
+                    remote_ids.append(arxiv_id)
+                else:
+                    results_by_id[arxiv_id] = answer
 
-            started = time.monotonic()
-            try:
-                result = self._fetch_one(arxiv_id, first_keys[arxiv_id])
-            except Exception as e:
-                logger.warning(f"DBLP lookup failed for {arxiv_id}: {e}")
-                result = None
-
-            elapsed = time.monotonic() - started
-            if elapsed > remaining:
-                logger.warning(f"DBLP lookup budget exceeded while resolving {arxiv_id}")
-                result = None
-
-            results_by_id[arxiv_id] = result
-            self._cache_set(arxiv_id, result)
+            futures = {
+                pool.submit(self._fetch_batch, batch, [first_keys[arxiv_id] for arxiv_id in batch], deadline): batch
+                for batch in self._remote_batches(remote_ids)
+            }
+            # Batches stop on their own at the deadline; the wait only guards against overruns.
+            done, not_done = wait(futures, timeout=deadline.remaining())
+            for future in not_done:
+                future.cancel()
+                logger.warning(f"DBLP lookup budget exhausted; skipping unresolved IDs {', '.join(futures[future])}")
+            for future, batch in futures.items():
+                batch_results: Optional[Dict[str, Optional[dict]]] = None
+                if future in done:
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        logger.warning(f"DBLP lookup failed for {', '.join(batch)}: {e}")
+                for arxiv_id in batch:
+                    results_by_id[arxiv_id] = (batch_results or {}).get(arxiv_id)
+                    if batch_results is not None:
+                        self.engine.remember(LookupQuery(arxiv_id, first_keys[arxiv_id]), results_by_id[arxiv_id], remote)
+        finally:
+            # Do not wait for batches still running past the budget.
+            pool.shutdown(wait=False, cancel_futures=True)
 
         ordered_results: List[Optional[dict]] = []
         for arxiv_id, original_key in zip(arxiv_ids, original_keys):
@@ -0,0 +1,216 @@
+"""Conditional, resumable download of the DBLP XML dump.
+
+Validators (ETag / Last-Modified) of the last complete download are kept in a
+``<dump>.meta.json`` sidecar, so an unchanged upstream dump costs one 304. An
+interrupted transfer keeps its ``.tmp`` file plus the validators it was started
+with, and the next call resumes it with an HTTP Range request.
+"""
+import json
+import os
+import time
+from typing import Callable, Dict, Optional
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from errors import DownloadIncomplete
+from logger import logger
+
+_CHUNK_BYTES = 1024 * 1024
+
+
+def _meta_path(path: str) -> str:
+    return f"{path}.meta.json"
+
+
+def _read_meta(path: str) -> Dict[str, object]:
+    try:
+        with open(_meta_path(path), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta if isinstance(meta, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(path: str, meta: Dict[str, object]) -> None:
+    tmp = f"{_meta_path(path)}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, _meta_path(path))
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def dump_last_checked(path: str) -> Optional[float]:
+    """When upstream was last confirmed to match ``path`` (falls back to its mtime)."""
+    checked = _read_meta(path).get("checked_at")
+    if isinstance(checked, (int, float)):
+        return float(checked)
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _validators(resp: requests.Response) -> Dict[str, object]:
+    return {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+    }
+
+
+def _expected_total(resp: requests.Response, offset: int) -> Optional[int]:
+    content_range = resp.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    length = resp.headers.get("Content-Length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
+
+
+def _range_start(resp: requests.Response) -> Optional[int]:
+    # "bytes 1000-1999/5000" -> 1000
+    unit_and_range = resp.headers.get("Content-Range", "").split("/", 1)[0]
+    try:
+        return int(unit_and_range.split()[-1].split("-", 1)[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _replay_partial(path: str, offset: int, on_chunk: Callable[[bytes], None]) -> None:
+    # A resumed transfer only streams the tail; the consumer needs the whole file.
+    with open(path, "rb") as f:
+        remaining = offset
+        while remaining > 0:
+            block = f.read(min(_CHUNK_BYTES, remaining))
+            if not block:
+                break
+            on_chunk(block)
+            remaining -= len(block)
+
+
+def _stream_to_file(
+    resp: requests.Response,
+    out,
+    offset: int,
+    total: Optional[int],
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> int:
+    downloaded = offset
+    next_log_percent = 5
+    # raw.stream(decode_content=False): count and store the bytes exactly as
+    # served, even if a proxy adds Content-Encoding.
+    for chunk in resp.raw.stream(_CHUNK_BYTES, decode_content=False):
+        if not chunk:
+            continue
+        out.write(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk)
+        downloaded += len(chunk)
+        if total:
+            pct = int((downloaded / total) * 100)
+            while pct >= next_log_percent and next_log_percent <= 100:
+                logger.info(f"DBLP dataset download progress: {next_log_percent}%")
+                next_log_percent += 5
+        elif downloaded % (25 * 1024 * 1024) < len(chunk):
+            logger.info(f"DBLP dataset download progress: {downloaded // (1024 * 1024)} MB")
+    return downloaded
+
+
+def download_dump(
+    url: str,
+    out_path: str,
+    timeout: float = 120.0,
+    session: Optional[requests.Session] = None,
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> bool:
+    """Bring ``out_path`` up to date with ``url``.
+
+    Returns True if a new file was written and False if upstream answered 304.
+    Raises ``DownloadIncomplete`` when the connection drops mid-body or the body
+    does not match the advertised length; the partial file is kept for the next
+    attempt to resume.
+
+    ``on_chunk`` receives the compressed bytes of the new file in order while
+    they are written, including the already-downloaded prefix on a resume, so
+    a consumer can process the dump in the same pass. It is not called on 304.
+    """
+    http = session or requests
+    tmp_path = f"{out_path}.tmp"
+    partial_meta = _read_meta(tmp_path)
+    offset = os.path.getsize(tmp_path) if os.path.exists(tmp_path) else 0
+    validator = partial_meta.get("etag") or partial_meta.get("last_modified")
+
+    headers: Dict[str, str] = {}
+    if offset and validator:
+        logger.info(f"Resuming DBLP dataset download at byte {offset}")
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = str(validator)
+    else:
+        offset = 0
+        if os.path.exists(out_path):
+            done_meta = _read_meta(out_path)
+            if done_meta.get("etag"):
+                headers["If-None-Match"] = str(done_meta["etag"])
+            if done_meta.get("last_modified"):
+                headers["If-Modified-Since"] = str(done_meta["last_modified"])
+
+    with http.get(url, stream=True, timeout=timeout, headers=headers) as resp:
+        if resp.status_code == 304:
+            logger.info("DBLP dataset unchanged upstream (304); keeping local copy")
+            _write_meta(out_path, {**_read_meta(out_path), "checked_at": time.time()})
+            return False
+        if resp.status_code == 416 and offset:
+            # Nothing left to fetch from this offset: start over rather than guess.
+            logger.warning("DBLP server rejected resume range; restarting download")
+            _remove(tmp_path)
+            _remove(_meta_path(tmp_path))
+            return download_dump(url, out_path, timeout=timeout, session=session, on_chunk=on_chunk)
+        resp.raise_for_status()
+
+        if resp.status_code == 206 and _range_start(resp) == offset:
+            mode = "ab"
+            meta = partial_meta
+        else:
+            if offset:
+                logger.info("DBLP dataset changed since the partial download; restarting from byte 0")
+            offset = 0
+            mode = "wb"
+            meta = {**_validators(resp), "url": url}
+        total = _expected_total(resp, offset)
+        meta["content_length"] = total
+        _write_meta(tmp_path, meta)
+
+        if on_chunk is not None and offset:
+            _replay_partial(tmp_path, offset, on_chunk)
+        with open(tmp_path, mode) as out:
+            if mode == "wb":
+                out.truncate(0)
+            try:
+                downloaded = _stream_to_file(resp, out, offset, total, on_chunk)
+            except Urllib3HTTPError as e:
+                raise DownloadIncomplete(
+                    f"DBLP dataset download interrupted at {out.tell()} bytes; will resume on next sync: {e}"
+                ) from e
+
+    if total is not None and downloaded > total:
+        # Resuming this file can never succeed; start clean next time.
+        _remove(tmp_path)
+        _remove(_meta_path(tmp_path))
+        raise DownloadIncomplete(f"DBLP dataset download overran its length ({downloaded} > {total} bytes)")
+    if total is not None and downloaded < total:
+        raise DownloadIncomplete(
+            f"DBLP dataset download ended at {downloaded} of {total} bytes; will resume on next sync"
+        )
+    os.replace(tmp_path, out_path)
+    _write_meta(out_path, {**meta, "checked_at": time.time()})
+    _remove(_meta_path(tmp_path))
+    return True
@@ -0,0 +1,31 @@
+"""Wall-clock budget handed down through a chain of calls.
+
+A ``Deadline`` is created once, where the budget is known (``lookup_many``'s
+``total_timeout_budget``), and passed down to the code that sleeps or waits
+on the network. Each of those asks how much time is ``remaining`` and caps
+its own timeout with it, so the budget bounds the whole call instead of
+being checked only between steps. ``None`` wherever a deadline is accepted
+means "no limit".
+"""
+import time
+from typing import Callable, Optional
+
+
+class Deadline:
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self._clock() >= self.expires_at
+
+    def cap(self, seconds: float) -> float:
+        """``seconds``, shortened to what is left of the budget."""
+        return min(seconds, self.remaining())
+
+
+def remaining(deadline: Optional[Deadline]) -> Optional[float]:
+    return deadline.remaining() if deadline is not None else None
@@ -12,3 +12,15 @@ class LookupFailure(PipelineError):
 
 class WriteFailure(PipelineError):
     """Raised when writing output artifacts fails."""
+
+
+class DownloadIncomplete(PipelineError):
+    """Raised when a dataset download ends before (or after) its advertised length."""
+
+
+class LookupDeferred(LookupFailure):
+    """Raised instead of a remote lookup while the DBLP circuit breaker is open."""
+
+
+class LookupDeadlineExceeded(LookupFailure):
+    """Raised when a lookup's time budget runs out before it could finish."""
@@ -0,0 +1,357 @@
+"""Extract arXiv-linked records from the DBLP XML dump for the local index.
+
+Two producers yield the same ``(arxiv_id, entry)`` stream (with
+``with_titles``, also ``("", entry)`` for every other titled publication, which
+feeds the title index):
+
+- ``iter_index_entries`` parses the whole dump with ``iterparse`` on one thread.
+- ``iter_index_entries_parallel`` runs a pipeline: one thread gunzips the dump
+  and cuts it into chunks at record boundaries, a process pool pulls the
+  arXiv-linked records out of each chunk, and results come back in dump order.
+
+``StreamingIndexBuilder`` is the push-based variant of the pipeline, fed with
+compressed bytes while the dump is still downloading.
+
+Both hold a fixed amount of the dump at a time (one record, or at most
+``4 * workers + 1`` chunks), so memory does not grow with the dump size.
+"""
+import gzip
+import html.entities
+import multiprocessing
+import os
+import queue
+import re
+import threading
+import zlib
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from logger import logger
+from parser import VALID_BIBTEX_TYPES
+
+RECORD_TAGS = ("article", "inproceedings", "proceedings", "book", "incollection", "phdthesis", "mastersthesis", "www")
+_ARXIV_NEEDLE = b"arxiv.org/abs"
+_RECORD_END_RE = re.compile(rb"</(" + b"|".join(t.encode("ascii") for t in RECORD_TAGS) + rb")>")
+_RECORD_END_TAGS = tuple(f"</{t}>".encode("ascii") for t in RECORD_TAGS)
+_XML_ENCODING_RE = re.compile(rb"<\?xml[^>]*encoding=[\"']([A-Za-z0-9._-]+)[\"']")
+_ENTITY_RE = re.compile(r"&([A-Za-z][A-Za-z0-9]*);")
+_XML_BUILTIN_ENTITIES = {"amp", "lt", "gt", "quot", "apos"}
+# dblp.xml relies on the HTML character entities declared in dblp.dtd.
+_HTML_ENTITIES = {
+    name: chr(code)
+    for name, code in html.entities.name2codepoint.items()
+    if name not in _XML_BUILTIN_ENTITIES
+}
+_DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+_READ_BLOCK_BYTES = 1024 * 1024
+
+IndexEntry = Tuple[str, Dict[str, str]]
+
+
+def default_worker_count() -> int:
+    """Worker processes for the pipelined build; ``0`` selects the serial iterparse path."""
+    configured = os.environ.get("DBLP_INDEX_BUILD_WORKERS")
+    if configured:
+        return max(0, int(configured))
+    cpus = os.cpu_count() or 1
+    # One CPU gains nothing from a pool but pays for the pickling and the gunzip thread.
+    return cpus if cpus > 1 else 0
+
+
+def extract_index_entry(elem: ET.Element, with_titles: bool = False) -> Optional[IndexEntry]:
+    """Return ``(arxiv_id, entry)`` for a record element that links an arXiv abstract.
+
+    With ``with_titles``, other titled publication records are returned too,
+    with an empty arXiv ID, for the title index.
+    """
+    if elem.tag not in RECORD_TAGS:
+        return None
+    ee_vals = [e.text or "" for e in elem.findall("ee")]
+    arxiv_id = None
+    for ee in ee_vals:
+        if "arxiv.org/abs/" in ee:
+            arxiv_id = ee.split("/abs/")[-1].split("v")[0]
+            break
+    title = (elem.findtext("title") or "").strip()
+    if not arxiv_id and not (with_titles and title and elem.tag != "www"):
+        return None
+    authors = [a.text.strip() for a in elem.findall("author") if a.text]
+    return arxiv_id or "", {
+        "key": elem.get("key", ""),
+        "type": elem.tag if elem.tag in VALID_BIBTEX_TYPES else "misc",
+        "title": title,
+        "year": (elem.findtext("year") or "").strip(),
+        "venue": (elem.findtext("journal") or elem.findtext("booktitle") or "").strip(),
+        "author": " and ".join(authors),
+        "ee": ee_vals[0] if ee_vals else "",
+    }
+
+
+def _dump_parser() -> ET.XMLParser:
+    parser = ET.XMLParser()
+    parser.entity.update(_HTML_ENTITIES)
+    return parser
+
+
+def iter_index_entries(xml_gz_path: str, with_titles: bool = False) -> Iterator[IndexEntry]:
+    """Single-threaded extraction with ``iterparse``.
+
+    ``elem.clear()`` alone leaves an empty element per record attached to the
+    ``<dblp>`` root, so memory would still grow with the dump. Clearing the root
+    after each record drops those too.
+    """
+    with gzip.open(xml_gz_path, "rb") as f:
+        root = None
+        for event, elem in ET.iterparse(f, events=("start", "end"), parser=_dump_parser()):
+            if root is None:
+                root = elem
+                continue
+            if event != "end" or elem.tag not in RECORD_TAGS:
+                continue
+            hit = extract_index_entry(elem, with_titles)
+            root.clear()
+            if hit is not None:
+                yield hit
+
+
+def _replace_entity(match: "re.Match[str]") -> str:
+    return _HTML_ENTITIES.get(match.group(1), match.group(0))
+
+
+def _parse_record(chunk: bytes, prev_end: int, end_match: "re.Match[bytes]", encoding: str, with_titles: bool):
+    tag = end_match.group(1)
+    start = max(
+        chunk.rfind(b"<" + tag + b" ", prev_end, end_match.start()),
+        chunk.rfind(b"<" + tag + b">", prev_end, end_match.start()),
+    )
+    if start < 0:
+        return None
+    if tag == b"www" and chunk.find(_ARXIV_NEEDLE, start, end_match.start()) < 0:
+        return None  # person pages: never indexed, and most of the dump in title mode
+    text = _ENTITY_RE.sub(_replace_entity, chunk[start:end_match.end()].decode(encoding, errors="replace"))
+    return extract_index_entry(ET.fromstring(text), with_titles)
+
+
+def extract_chunk(chunk: bytes, encoding: str = "utf-8", with_titles: bool = False) -> Tuple[List[IndexEntry], int]:
+    """Extract index entries from a chunk of whole records.
+
+    Only records containing ``arxiv.org/abs`` are handed to the XML parser; the
+    rest are skipped with a byte search. With ``with_titles`` every record is
+    parsed, since the title index needs them all. Returns the entries and the
+    number of records that failed to parse.
+    """
+    entries: List[IndexEntry] = []
+    errors = 0
+    pos = 0 if with_titles else chunk.find(_ARXIV_NEEDLE)
+    if pos < 0:
+        return entries, errors
+
+    record_ends = list(_RECORD_END_RE.finditer(chunk))
+    end_idx = 0
+    prev_end = 0
+    while pos >= 0:
+        while end_idx < len(record_ends) and record_ends[end_idx].end() <= pos:
+            prev_end = record_ends[end_idx].end()
+            end_idx += 1
+        if end_idx >= len(record_ends):
+            break
+        end_match = record_ends[end_idx]
+        try:
+            hit = _parse_record(chunk, prev_end, end_match, encoding, with_titles)
+        except ET.ParseError:
+            errors += 1
+            hit = None
+        if hit is not None:
+            entries.append(hit)
+        pos = end_match.end() if with_titles else chunk.find(_ARXIV_NEEDLE, end_match.end())
+    return entries, errors
+
+
+def _last_record_end(buf: bytearray) -> int:
+    return max(
+        (i + len(tag) for tag in _RECORD_END_TAGS for i in (buf.rfind(tag),) if i >= 0),
+        default=-1,
+    )
+
+
+def _detect_encoding(head: bytes) -> str:
+    match = _XML_ENCODING_RE.search(head)
+    return match.group(1).decode("ascii") if match else "utf-8"
+
+
+def _spawn_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn, not fork: the web app rebuilds from a background thread.
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class _RecordChunker:
+    """Cut a decompressed XML byte stream into chunks that end on a record boundary."""
+
+    def __init__(self, chunk_bytes: int):
+        self.chunk_bytes = chunk_bytes
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> Iterator[bytes]:
+        self._buf += data
+        if len(self._buf) >= self.chunk_bytes:
+            cut = _last_record_end(self._buf)
+            if cut > 0:
+                chunk = bytes(self._buf[:cut])
+                del self._buf[:cut]
+                yield chunk
+
+    def finish(self) -> Iterator[bytes]:
+        if self._buf:
+            chunk = bytes(self._buf)
+            self._buf.clear()
+            yield chunk
+
+
+def _read_chunks(xml_gz_path: str, chunk_bytes: int, out: "queue.Queue", stop: threading.Event) -> None:
+    """Decompression stage: gunzip and cut the stream after the last complete record."""
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        chunker = _RecordChunker(chunk_bytes)
+        with gzip.open(xml_gz_path, "rb") as f:
+            while not stop.is_set():
+                block = f.read(_READ_BLOCK_BYTES)
+                chunks = chunker.feed(block) if block else chunker.finish()
+                for chunk in chunks:
+                    if not put(chunk):
+                        return
+                if not block:
+                    break
+        put(None)
+    except BaseException as e:  # surfaced to the consumer thread
+        put(e)
+
+
+def iter_index_entries_parallel(
+    xml_gz_path: str,
+    workers: Optional[int] = None,
+    chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+    with_titles: bool = False,
+) -> Iterator[IndexEntry]:
+    """Pipelined extraction: gunzip thread -> process pool -> in-order merge."""
+    workers = max(1, workers or default_worker_count())
+    with gzip.open(xml_gz_path, "rb") as f:
+        encoding = _detect_encoding(f.read(4096))
+
+    chunks: "queue.Queue" = queue.Queue(maxsize=workers * 2)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_chunks, args=(xml_gz_path, chunk_bytes, chunks, stop), daemon=True)
+    reader.start()
+    parse_errors = 0
+    try:
+        with _spawn_pool(workers) as pool:
+            in_flight: deque = deque()
+            exhausted = False
+            while True:
+                while not exhausted and len(in_flight) < workers * 2:
+                    item = chunks.get()
+                    if item is None:
+                        exhausted = True
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        in_flight.append(pool.submit(extract_chunk, item, encoding, with_titles))
+                if not in_flight:
+                    break
+                entries, errors = in_flight.popleft().result()
+                parse_errors += errors
+                yield from entries
+    finally:
+        stop.set()
+        reader.join()
+    if parse_errors:
+        logger.warning(f"Skipped {parse_errors} unparsable DBLP records")
+
+
+class StreamingIndexBuilder:
+    """Push-based extraction for a compressed dump that is still arriving.
+
+    ``feed()`` takes raw ``dblp.xml.gz`` bytes as they come off the network,
+    gunzips them incrementally and hands whole-record chunks to the same
+    prefilter + parser as the pipelined builder. Entries are passed to ``emit``
+    in dump order. With ``workers > 0`` chunks are parsed in a process pool,
+    and ``feed()`` blocks once ``2 * workers`` chunks are pending, so a slow
+    parser throttles the download instead of buffering it.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[str, Dict[str, str]], None],
+        workers: int = 0,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+        with_titles: bool = False,
+    ):
+        self._emit = emit
+        self.workers = workers
+        self.with_titles = with_titles
+        self.parse_errors = 0
+        self._decomp = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._chunker = _RecordChunker(chunk_bytes)
+        self._encoding: Optional[str] = None
+        self._pool = _spawn_pool(workers) if workers > 0 else None
+        self._in_flight: deque = deque()
+
+    def _gunzip(self, data: bytes) -> bytes:
+        out = []
+        while data:
+            out.append(self._decomp.decompress(data))
+            if not self._decomp.eof:
+                break
+            # Concatenated gzip members: start a fresh decompressor on the rest.
+            data = self._decomp.unused_data
+            self._decomp = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        return b"".join(out)
+
+    def _deliver(self, result: Tuple[List[IndexEntry], int]) -> None:
+        entries, errors = result
+        self.parse_errors += errors
+        for arxiv_id, entry in entries:
+            self._emit(arxiv_id, entry)
+
+    def _submit(self, chunk: bytes) -> None:
+        if self._pool is None:
+            self._deliver(extract_chunk(chunk, self._encoding or "utf-8", self.with_titles))
+            return
+        self._in_flight.append(self._pool.submit(extract_chunk, chunk, self._encoding or "utf-8", self.with_titles))
+        while len(self._in_flight) > self.workers * 2:
+            self._deliver(self._in_flight.popleft().result())
+
+    def feed(self, compressed: bytes) -> None:
+        data = self._gunzip(compressed)
+        if self._encoding is None and data:
+            self._encoding = _detect_encoding(data[:4096])
+        for chunk in self._chunker.feed(data):
+            self._submit(chunk)
+
+    def close(self) -> None:
+        """Flush the tail of the stream and wait for all pending chunks."""
+        try:
+            for chunk in self._chunker.finish():
+                self._submit(chunk)
+            while self._in_flight:
+                self._deliver(self._in_flight.popleft().result())
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+        if self.parse_errors:
+            logger.warning(f"Skipped {self.parse_errors} unparsable DBLP records")
+
+    def abort(self) -> None:
+        self._in_flight.clear()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
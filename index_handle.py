@@ -0,0 +1,160 @@
+"""Versioned, hot-swappable handle on the local index files.
+
+Every successful rebuild bumps a generation number in a small marker file next
+to the index. An ``IndexHandle`` serves lookups from the generation it has
+loaded and, when the marker moves on (in this process or because another
+process rebuilt), loads the new generation on a background thread and swaps
+it in with a single assignment. Lookups never wait for a load and never see an
+empty index; the replaced generation is closed after a grace period, once no
+lookup can still be using it.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from logger import logger
+
+T = TypeVar("T")
+
+
+def read_generation(path: str) -> int:
+    """Generation recorded at ``path``; 0 if no build has recorded one."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return int(json.load(f).get("generation", 0))
+    except (OSError, ValueError, AttributeError, TypeError):
+        return 0
+
+
+def bump_generation(path: str, **info: Any) -> int:
+    """Record a new index generation, atomically, and return its number."""
+    generation = read_generation(path) + 1
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"generation": generation, "built_at": time.time(), **info}, f)
+    os.replace(tmp, path)
+    return generation
+
+
+class IndexHandle(Generic[T]):
+    """Hold the active generation of an index and replace it without a gap.
+
+    ``load`` opens the index files as they are on disk and returns an object
+    with a ``close()`` method (or None if there is no index yet). The marker
+    file is checked at most every ``check_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], Optional[T]],
+        generation_path: Callable[[], str],
+        check_interval: float = 2.0,
+        retire_after: float = 30.0,
+    ):
+        self._load = load
+        self._generation_path = generation_path
+        self.check_interval = check_interval
+        self.retire_after = retire_after
+        self._lock = threading.Lock()
+        self._active: Optional[Tuple[int, Optional[T], float]] = None
+        self._retired: List[Tuple[float, T]] = []
+        self._next_check = 0.0
+        self._loading = False
+        self._epoch = 0  # bumped by close(); a load started before it is discarded
+
+    def _open(self, generation: int) -> Tuple[int, Optional[T], float]:
+        return generation, self._load(), time.time()
+
+    def _swap(self, loaded: Tuple[int, Optional[T], float], epoch: int) -> None:
+        with self._lock:
+            current = epoch == self._epoch
+            if current:
+                previous, self._active = self._active, loaded
+                if previous is not None and previous[1] is not None:
+                    self._retired.append((time.monotonic(), previous[1]))
+        if not current:
+            if loaded[1] is not None:
+                loaded[1].close()
+            return
+        logger.info(f"Local DBLP index generation {loaded[0]} is active")
+
+    def _close_retired(self, force: bool = False) -> None:
+        cutoff = time.monotonic() - self.retire_after
+        with self._lock:
+            due = [value for retired_at, value in self._retired if force or retired_at <= cutoff]
+            self._retired = [item for item in self._retired if not (force or item[0] <= cutoff)]
+        for value in due:
+            value.close()
+
+    def _load_in_background(self, generation: int, epoch: int) -> None:
+        try:
+            self._swap(self._open(generation), epoch)
+        except Exception as e:
+            logger.warning(f"Could not load local DBLP index generation {generation}: {e}")
+        finally:
+            with self._lock:
+                self._loading = False
+
+    def current(self) -> Optional[T]:
+        """The active index; the first call loads it, later calls only poll for a newer one."""
+        now = time.monotonic()
+        with self._lock:
+            active = self._active
+            poll = now >= self._next_check
+            if poll:
+                self._next_check = now + self.check_interval
+        if active is None:
+            with self._lock:
+                if self._active is None:
+                    self._active = self._open(read_generation(self._generation_path()))
+                return self._active[1]
+        if poll:
+            self._close_retired()
+            generation = read_generation(self._generation_path())
+            with self._lock:
+                start = generation != active[0] and not self._loading
+                if start:
+                    self._loading = True
+                epoch = self._epoch
+            if start:
+                threading.Thread(target=self._load_in_background, args=(generation, epoch), daemon=True).start()
+        return active[1]
+
+    def peek(self) -> Optional[T]:
+        """The active index as is: no loading, no polling."""
+        with self._lock:
+            return self._active[1] if self._active is not None else None
+
+    def reload(self) -> None:
+        """Load the generation on disk now (on the calling thread) and swap it in."""
+        with self._lock:
+            epoch = self._epoch
+        self._swap(self._open(read_generation(self._generation_path())), epoch)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            active = self._active
+            retired = len(self._retired)
+            loading = self._loading
+        status: Dict[str, Any] = {
+            "generation": None,
+            "loaded": False,
+            "on_disk_generation": read_generation(self._generation_path()),
+            "loading": loading,
+            "retired_generations": retired,
+        }
+        if active is not None:
+            status.update(generation=active[0], loaded=active[1] is not None, loaded_at=active[2])
+        return status
+
+    def close(self) -> None:
+        """Close every generation held; the next ``current()`` starts from scratch."""
+        with self._lock:
+            active, self._active = self._active, None
+            self._next_check = 0.0
+            self._epoch += 1
+        if active is not None and active[1] is not None:
+            active[1].close()
+        self._close_retired(force=True)
@@ -0,0 +1,699 @@
+"""On-disk storage for the local arXiv -> DBLP index.
+
+The index is written once by the rebuild job and then queried one arXiv ID at a
+time, so lookups never need the whole index in memory.
+"""
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from title_index import MIN_TITLE_SIMILARITY, first_author_surname, title_band_keys, title_similarity
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - minimal Python builds may ship without sqlite3
+    sqlite3 = None
+
+INDEX_FIELDS = ("type", "title", "year", "venue", "author", "ee")
+_INSERT_BATCH_SIZE = 5000
+_SPILL_RUN_SIZE = 50000
+
+# Binary index layout (all integers little-endian):
+#   header   magic, version, id_width, count, string count, and the section offsets
+#   ids      ``count`` arXiv IDs, sorted, NUL-padded to ``id_width`` bytes
+#   offsets  ``count + 1`` uint64 positions into the heap
+#   heap     per entry: uint32 type ref, uint32 venue ref, uint16 author count,
+#            that many uint32 author refs, then UTF-8 title \x1f year \x1f ee
+#   strings  ``strings + 1`` uint64 positions into the string heap, then the
+#            string heap: each distinct type, venue and author name once
+# Venues and author names repeat across many entries; storing each once and
+# referencing it by number keeps the file (and the page cache it occupies) small.
+_BINARY_MAGIC = b"AXDBIDX1"
+_BINARY_VERSION = 2
+_BINARY_HEADER = struct.Struct("<8sIIQQQQQQQ")
+_BINARY_OFFSET = struct.Struct("<Q")
+_ENTRY_REFS = struct.Struct("<IIH")
+_AUTHOR_REF = struct.Struct("<I")
+_AUTHOR_SEP = " and "
+_FIELD_SEP = "\x1f"
+
+
+def sqlite_available() -> bool:
+    return sqlite3 is not None
+
+
+# SQLite schema: one row per DBLP record that links an arXiv abstract. ``seq`` is
+# the record's position in the dump; when several records link the same arXiv
+# ID, the one with the highest ``seq`` wins, like the old dict-based index.
+# Records added only for the title index have a NULL ``arxiv_id``; every titled
+# record has its ``title_index`` bucket keys in ``title_bands``.
+_SQLITE_SCHEMA_VERSION = 3
+_RECORD_COLUMNS = ("dblp_key", "arxiv_id", "fingerprint", "seq") + INDEX_FIELDS
+_INSERT_RECORD_SQL = f"INSERT OR REPLACE INTO {{table}} VALUES ({', '.join('?' * len(_RECORD_COLUMNS))})"
+
+
+def _create_records_table(conn, table: str = "records", temp: bool = False) -> None:
+    conn.execute(
+        f"CREATE {'TEMP ' if temp else ''}TABLE IF NOT EXISTS {table} ("
+        "dblp_key TEXT PRIMARY KEY, arxiv_id TEXT, fingerprint TEXT NOT NULL, "
+        "seq INTEGER NOT NULL, type TEXT, title TEXT, year TEXT, venue TEXT, author TEXT, ee TEXT"
+        ") WITHOUT ROWID"
+    )
+
+
+def _create_title_bands_table(conn) -> None:
+    conn.execute("CREATE TABLE IF NOT EXISTS title_bands (band INTEGER NOT NULL, dblp_key TEXT NOT NULL)")
+
+
+def _title_band_rows(rows: Sequence[Tuple]) -> List[Tuple[int, str]]:
+    title_col = _RECORD_COLUMNS.index("title")
+    return [(band, row[0]) for row in rows for band in title_band_keys(row[title_col])]
+
+
+def record_fingerprint(arxiv_id: str, entry: Dict[str, str]) -> str:
+    """Content hash of everything the index stores for one DBLP record."""
+    blob = _FIELD_SEP.join([arxiv_id, *(str(entry.get(f, "") or "") for f in INDEX_FIELDS)])
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _record_row(seq: int, arxiv_id: str, entry: Dict[str, str]) -> Tuple:
+    # Records without a DBLP key (never the case in the real dump) are keyed by arXiv ID.
+    dblp_key = entry.get("key") or f"arxiv:{arxiv_id}"
+    return (
+        dblp_key,
+        arxiv_id or None,
+        record_fingerprint(arxiv_id, entry),
+        seq,
+        *(entry.get(f, "") for f in INDEX_FIELDS),
+    )
+
+
+def sqlite_index_is_current(path: str) -> bool:
+    """True if ``path`` is a SQLite index in the schema this module writes."""
+    if sqlite3 is None or not os.path.exists(path):
+        return False
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0] == _SQLITE_SCHEMA_VERSION
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+
+def _export_binary(sqlite_path: str, binary_path: str) -> None:
+    reader = SqliteIndexReader(sqlite_path)
+    try:
+        _, id_width = reader.stats()
+        write_binary_index(binary_path, reader.iter_sorted(), id_width)
+    finally:
+        reader.close()
+
+
+class SqliteIndexWriter:
+    """Stream index entries into a fresh SQLite file using bulk transactions.
+
+    Entries go to ``<path>.tmp`` and the finished file is moved into place on
+    ``commit()``, so readers never observe a half-built index.
+    """
+
+    def __init__(self, path: str, batch_size: int = _INSERT_BATCH_SIZE):
+        if sqlite3 is None:
+            raise RuntimeError("sqlite3 is not available in this Python build")
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.batch_size = batch_size
+        self.count = 0  # arXiv-linked records
+        self.records = 0  # all records, including title-only ones
+        self._pending: List[Tuple] = []
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+        self._conn = sqlite3.connect(self.tmp_path)
+        # The temp file is thrown away on failure, so durability knobs can be off.
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        # Keep the page cache fixed (16 MiB) however large the index grows.
+        self._conn.execute("PRAGMA cache_size=-16384")
+        _create_records_table(self._conn)
+        _create_title_bands_table(self._conn)
+
+    def add(self, arxiv_id: str, entry: Dict[str, str]) -> None:
+        self._pending.append(_record_row(self.records + len(self._pending), arxiv_id, entry))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(_INSERT_RECORD_SQL.format(table="records"), self._pending)
+            self._conn.executemany("INSERT INTO title_bands VALUES (?, ?)", _title_band_rows(self._pending))
+        self.records += len(self._pending)
+        self.count += sum(1 for row in self._pending if row[1] is not None)
+        self._pending = []
+
+    def commit(self, binary_path: Optional[str] = None) -> None:
+        """Move the finished index into place and optionally export the binary index."""
+        self._flush()
+        with self._conn:
+            self._conn.execute("CREATE INDEX records_by_arxiv_id ON records (arxiv_id, seq)")
+            # Built after the bulk load: cheaper than maintaining them per insert.
+            self._conn.execute("CREATE INDEX title_bands_by_band ON title_bands (band)")
+            self._conn.execute("CREATE INDEX title_bands_by_key ON title_bands (dblp_key)")
+        self._conn.execute(f"PRAGMA user_version={_SQLITE_SCHEMA_VERSION}")
+        # WAL lets incremental updates run while other processes keep reading.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.close()
+        os.replace(self.tmp_path, self.path)
+        if binary_path:
+            _export_binary(self.path, binary_path)
+
+    def abort(self) -> None:
+        self._pending = []
+        self._conn.close()
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+
+class SqliteIndexUpdater:
+    """Apply a fresh dump to an existing SQLite index, writing only the delta.
+
+    Every streamed record is compared with the stored fingerprint for its DBLP
+    key; only new or changed records are written. Records that are no longer
+    in the dump are deleted on ``commit()``. Each batch is its own transaction
+    on the live file (WAL mode), so the index stays queryable throughout. If
+    the stream fails, ``abort()`` keeps the upserts so far and skips the deletes.
+    Where several records link the same arXiv ID, ``commit()`` also gives the
+    unchanged ones their position in the new dump as ``seq`` (counted in
+    ``reordered``), so the record that wins the ID is the one a full rebuild
+    would pick. Other records keep their old ``seq``: it only ranks records of
+    one ID, so moving them in the dump does not need a write.
+    """
+
+    def __init__(self, path: str, batch_size: int = _INSERT_BATCH_SIZE):
+        if not sqlite_index_is_current(path):
+            raise ValueError(f"{path} is not a schema {_SQLITE_SCHEMA_VERSION} SQLite index")
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0  # arXiv-linked records
+        self.records = 0  # all records, including title-only ones
+        self.upserted = 0
+        self.deleted = 0
+        self.reordered = 0
+        self._pending: List[Tuple] = []
+        self._conn = sqlite3.connect(path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA cache_size=-16384")
+        self._conn.execute("PRAGMA temp_store=FILE")
+        _create_records_table(self._conn, "staging", temp=True)
+        self._conn.execute("CREATE TEMP TABLE seen (dblp_key TEXT PRIMARY KEY, seq INTEGER) WITHOUT ROWID")
+
+    def add(self, arxiv_id: str, entry: Dict[str, str]) -> None:
+        self._pending.append(_record_row(self.records + len(self._pending), arxiv_id, entry))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(_INSERT_RECORD_SQL.format(table="staging"), self._pending)
+            self._conn.execute("INSERT OR REPLACE INTO seen SELECT dblp_key, seq FROM staging")
+            changed = {
+                key for (key,) in self._conn.execute(
+                    "SELECT s.dblp_key FROM staging AS s "
+                    "LEFT JOIN records AS r ON r.dblp_key = s.dblp_key "
+                    "WHERE r.fingerprint IS NULL OR r.fingerprint != s.fingerprint"
+                )
+            }
+            if changed:
+                rows = [row for row in self._pending if row[0] in changed]
+                self._conn.executemany(_INSERT_RECORD_SQL.format(table="records"), rows)
+                self._conn.executemany("DELETE FROM title_bands WHERE dblp_key = ?", ((k,) for k in changed))
+                self._conn.executemany("INSERT INTO title_bands VALUES (?, ?)", _title_band_rows(rows))
+            self.upserted += len(changed)
+            self._conn.execute("DELETE FROM staging")
+        self.records += len(self._pending)
+        self.count += sum(1 for row in self._pending if row[1] is not None)
+        self._pending = []
+
+    def commit(self, binary_path: Optional[str] = None) -> None:
+        """Apply deletes for records missing from the dump, then re-export the binary index."""
+        self._flush()
+        with self._conn:
+            self._conn.execute("DELETE FROM title_bands WHERE dblp_key NOT IN (SELECT dblp_key FROM seen)")
+            cursor = self._conn.execute("DELETE FROM records WHERE dblp_key NOT IN (SELECT dblp_key FROM seen)")
+            self.deleted = cursor.rowcount
+            # Done once all records are in: an ID can become shared after its first record was flushed.
+            self.reordered = self._conn.execute(
+                "UPDATE records SET seq = (SELECT seen.seq FROM seen WHERE seen.dblp_key = records.dblp_key) "
+                "WHERE arxiv_id IN (SELECT arxiv_id FROM records WHERE arxiv_id IS NOT NULL "
+                "GROUP BY arxiv_id HAVING count(*) > 1) "
+                "AND seq != (SELECT seen.seq FROM seen WHERE seen.dblp_key = records.dblp_key)"
+            ).rowcount
+        self._conn.close()
+        if binary_path and (
+            self.upserted or self.deleted or self.reordered or not binary_index_is_current(binary_path)
+        ):
+            _export_binary(self.path, binary_path)
+
+    def abort(self) -> None:
+        self._pending = []
+        self._conn.close()
+
+
+class SqliteIndexReader:
+    """Point lookups against a SQLite index file, shared by all threads."""
+
+    def __init__(self, path: str):
+        if not sqlite_index_is_current(path):
+            raise ValueError(f"{path} is not a schema {_SQLITE_SCHEMA_VERSION} SQLite index")
+        self.path = path
+        self._lock = threading.Lock()
+        # Not mode=ro: a read-only handle cannot create the WAL index files the
+        # updater's live database needs. query_only keeps this handle read-only.
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA query_only=ON")
+
+    def get(self, arxiv_id: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT type, title, year, venue, author, ee FROM records "
+                "WHERE arxiv_id = ? ORDER BY seq DESC LIMIT 1",
+                (arxiv_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(INDEX_FIELDS, row))
+
+    def iter_sorted(self, batch_size: int = _INSERT_BATCH_SIZE) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """Stream the winning entry per arXiv ID in byte order, as the binary index needs."""
+        # SQLite returns the other columns from the row that holds max(seq).
+        cursor = self._conn.execute(
+            "SELECT arxiv_id, type, title, year, venue, author, ee, max(seq) FROM records "
+            "WHERE arxiv_id IS NOT NULL GROUP BY arxiv_id ORDER BY arxiv_id"
+        )
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield row[0], dict(zip(INDEX_FIELDS, row[1:7]))
+
+    def find_by_title(
+        self,
+        title: str,
+        author: str = "",
+        min_similarity: float = MIN_TITLE_SIMILARITY,
+        max_candidates: int = 500,
+    ) -> List[Tuple[float, str, Dict[str, str]]]:
+        """Records whose title matches ``title``, best first, as ``(score, dblp_key, entry)``.
+
+        Candidates come from shared title buckets and are kept if their title
+        similarity reaches ``min_similarity`` and, when ``author`` is given,
+        their first author has the same surname.
+        """
+        bands = title_band_keys(title)
+        if not bands:
+            return []
+        surname = first_author_surname(author)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT dblp_key, type, title, year, venue, author, ee FROM records WHERE dblp_key IN ("
+                "SELECT DISTINCT dblp_key FROM title_bands "
+                f"WHERE band IN ({', '.join('?' * len(bands))}) LIMIT ?)",
+                (*bands, max_candidates),
+            ).fetchall()
+        matches = []
+        for row in rows:
+            entry = dict(zip(INDEX_FIELDS, row[1:]))
+            if surname and first_author_surname(entry["author"]) != surname:
+                continue
+            score = title_similarity(title, entry["title"])
+            if score >= min_similarity:
+                matches.append((score, row[0], entry))
+        matches.sort(key=lambda m: m[0], reverse=True)
+        return matches
+
+    def iter_ids(self, batch_size: int = _INSERT_BATCH_SIZE) -> Iterator[str]:
+        cursor = self._conn.execute("SELECT DISTINCT arxiv_id FROM records WHERE arxiv_id IS NOT NULL")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for (arxiv_id,) in rows:
+                yield arxiv_id
+
+    def stats(self) -> Tuple[int, int]:
+        """Return ``(distinct_arxiv_ids, longest_arxiv_id_in_bytes)``."""
+        with self._lock:
+            count, width = self._conn.execute(
+                "SELECT count(DISTINCT arxiv_id), coalesce(max(length(CAST(arxiv_id AS BLOB))), 0) FROM records"
+            ).fetchone()
+        return count, width
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _keyed_run(f, run_no: int) -> Iterator[Tuple[Tuple[str, int], Dict[str, str]]]:
+    for line in f:
+        arxiv_id, entry = json.loads(line)
+        yield (arxiv_id, -run_no), entry
+
+
+class JsonIndexWriter:
+    """Append entries to the legacy JSON index (used when sqlite3 is unavailable).
+
+    Entries are written as they arrive. A repeated arXiv ID becomes a repeated
+    object key, and ``json.load`` keeps the last one, the same later-record-wins
+    rule as the SQLite writer. For the binary export, entries are also spilled
+    to sorted run files of ``run_size`` entries that are merged on ``commit()``.
+    """
+
+    def __init__(self, path: str, run_size: int = _SPILL_RUN_SIZE):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.run_size = run_size
+        self.count = 0
+        self.id_width = 0
+        self._run: Dict[str, Dict[str, str]] = {}
+        self._run_paths: List[str] = []
+        self._run_dir = tempfile.mkdtemp(prefix="arxiv-index-runs-", dir=os.path.dirname(path) or ".")
+        self._out = open(self.tmp_path, "w", encoding="utf-8")
+        self._out.write("{")
+
+    def add(self, arxiv_id: str, entry: Dict[str, str]) -> None:
+        if not arxiv_id:
+            return  # title-index records need SQLite
+        if self.count:
+            self._out.write(", ")
+        self._out.write(f"{json.dumps(arxiv_id)}: {json.dumps(entry)}")
+        self.count += 1
+        self.id_width = max(self.id_width, len(arxiv_id.encode("utf-8")))
+        self._run[arxiv_id] = entry
+        if len(self._run) >= self.run_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        if not self._run:
+            return
+        run_path = os.path.join(self._run_dir, f"run{len(self._run_paths):05d}.jsonl")
+        with open(run_path, "w", encoding="utf-8") as f:
+            for arxiv_id in sorted(self._run):
+                f.write(json.dumps([arxiv_id, self._run[arxiv_id]]) + "\n")
+        self._run_paths.append(run_path)
+        self._run = {}
+
+    def _iter_sorted(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        files = [open(p, "r", encoding="utf-8") for p in self._run_paths]
+        try:
+            # Sort key (arxiv_id, -run): the newest run comes first for a repeated ID.
+            streams = [_keyed_run(f, run_no) for run_no, f in enumerate(files)]
+            previous = None
+            for (arxiv_id, _), entry in heapq.merge(*streams, key=lambda item: item[0]):
+                if arxiv_id != previous:
+                    previous = arxiv_id
+                    yield arxiv_id, entry
+        finally:
+            for f in files:
+                f.close()
+
+    def commit(self, binary_path: Optional[str] = None) -> None:
+        """Move the finished index into place and optionally export the binary index."""
+        self._out.write("}")
+        self._out.close()
+        os.replace(self.tmp_path, self.path)
+        try:
+            if binary_path:
+                self._spill()
+                write_binary_index(binary_path, self._iter_sorted(), self.id_width)
+        finally:
+            shutil.rmtree(self._run_dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        self._out.close()
+        shutil.rmtree(self._run_dir, ignore_errors=True)
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+
+def read_json_index(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class JsonIndexReader:
+    """The legacy JSON index loaded into memory, behind the same interface as the other readers.
+
+    Entries are held as tuples with the type, venue and each author name
+    interned, so the few thousand distinct venues and the recurring authors
+    are stored once rather than once per entry; ``get`` rebuilds the dict.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Compact each entry as the decoder produces it, so the full dict form
+        # of the index never exists in memory at once.
+        with open(path, "r", encoding="utf-8") as f:
+            self._index: Dict[str, Tuple] = json.load(
+                f, object_hook=lambda obj: _compact_entry(obj) if "title" in obj else obj
+            )
+
+    def get(self, arxiv_id: str) -> Optional[Dict[str, str]]:
+        compact = self._index.get(arxiv_id)
+        if compact is None:
+            return None
+        type_, title, year, venue, authors, ee = compact
+        return {
+            "type": type_,
+            "title": title,
+            "year": year,
+            "venue": venue,
+            "author": _AUTHOR_SEP.join(authors),
+            "ee": ee,
+        }
+
+    def iter_ids(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def close(self) -> None:
+        self._index = {}
+
+
+def _compact_entry(entry: Dict[str, str]) -> Tuple:
+    authors = str(entry.get("author", "") or "")
+    return (
+        sys.intern(str(entry.get("type", "") or "")),
+        str(entry.get("title", "") or ""),
+        sys.intern(str(entry.get("year", "") or "")),
+        sys.intern(str(entry.get("venue", "") or "")),
+        tuple(sys.intern(name) for name in authors.split(_AUTHOR_SEP)) if authors else (),
+        str(entry.get("ee", "") or ""),
+    )
+
+
+class _StringTable:
+    """Assign each distinct string a number and stream it to a temp file once."""
+
+    def __init__(self, out_dir: str):
+        self._refs: Dict[str, int] = {}
+        self.offsets_f = tempfile.TemporaryFile(dir=out_dir)
+        self.heap_f = tempfile.TemporaryFile(dir=out_dir)
+        self._heap_pos = 0
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def ref(self, value: str) -> int:
+        ref = self._refs.get(value)
+        if ref is None:
+            ref = self._refs[value] = len(self._refs)
+            data = value.encode("utf-8")
+            self.offsets_f.write(_BINARY_OFFSET.pack(self._heap_pos))
+            self.heap_f.write(data)
+            self._heap_pos += len(data)
+        return ref
+
+    def finish(self) -> None:
+        self.offsets_f.write(_BINARY_OFFSET.pack(self._heap_pos))
+
+    def close(self) -> None:
+        self.offsets_f.close()
+        self.heap_f.close()
+
+
+def _encode_entry(entry: Dict[str, str], strings: _StringTable) -> bytes:
+    authors = str(entry.get("author", "") or "")
+    author_refs = [strings.ref(name) for name in authors.split(_AUTHOR_SEP)] if authors else []
+    text = _FIELD_SEP.join(str(entry.get(f, "") or "") for f in ("title", "year", "ee")).encode("utf-8")
+    return b"".join([
+        _ENTRY_REFS.pack(
+            strings.ref(str(entry.get("type", "") or "")),
+            strings.ref(str(entry.get("venue", "") or "")),
+            len(author_refs),
+        ),
+        *(_AUTHOR_REF.pack(ref) for ref in author_refs),
+        text,
+    ])
+
+
+def write_binary_index(
+    path: str,
+    sorted_entries: Iterable[Tuple[str, Dict[str, str]]],
+    id_width: int,
+) -> int:
+    """Write the compact mmap-able index from entries already sorted by arXiv ID.
+
+    The ID table, offsets table, heap and string table are each streamed into
+    their own temp file and concatenated behind the header at the end; only
+    the string-to-number map of distinct venues and authors stays in memory.
+    Returns the number of entries written.
+    """
+    out_dir = os.path.dirname(path) or "."
+    tmp_path = f"{path}.tmp"
+    strings = _StringTable(out_dir)
+    try:
+        with tempfile.TemporaryFile(dir=out_dir) as ids_f, \
+                tempfile.TemporaryFile(dir=out_dir) as offsets_f, \
+                tempfile.TemporaryFile(dir=out_dir) as heap_f:
+            heap_pos = 0
+            count = 0
+            for arxiv_id, entry in sorted_entries:
+                key = arxiv_id.encode("utf-8")
+                if len(key) > id_width:
+                    raise ValueError(f"arXiv ID {arxiv_id!r} is wider than the {id_width}-byte ID table")
+                ids_f.write(key.ljust(id_width, b"\0"))
+                payload = _encode_entry(entry, strings)
+                offsets_f.write(_BINARY_OFFSET.pack(heap_pos))
+                heap_f.write(payload)
+                heap_pos += len(payload)
+                count += 1
+            offsets_f.write(_BINARY_OFFSET.pack(heap_pos))
+            strings.finish()
+
+            ids_start = _BINARY_HEADER.size
+            offsets_start = ids_start + count * id_width
+            heap_start = offsets_start + (count + 1) * _BINARY_OFFSET.size
+            string_offsets_start = heap_start + heap_pos
+            string_heap_start = string_offsets_start + (len(strings) + 1) * _BINARY_OFFSET.size
+            with open(tmp_path, "wb") as out:
+                out.write(_BINARY_HEADER.pack(
+                    _BINARY_MAGIC, _BINARY_VERSION, id_width, count, ids_start, offsets_start, heap_start,
+                    len(strings), string_offsets_start, string_heap_start,
+                ))
+                for section in (ids_f, offsets_f, heap_f, strings.offsets_f, strings.heap_f):
+                    section.seek(0)
+                    shutil.copyfileobj(section, out, 1024 * 1024)
+    finally:
+        strings.close()
+    os.replace(tmp_path, path)
+    return count
+
+
+def binary_index_is_current(path: str) -> bool:
+    """True if ``path`` is a binary index in the version this module writes."""
+    try:
+        with open(path, "rb") as f:
+            magic, version = struct.unpack("<8sI", f.read(12))
+    except (OSError, struct.error):
+        return False
+    return magic == _BINARY_MAGIC and version == _BINARY_VERSION
+
+
+class BinaryIndexReader:
+    """Binary-search lookups in a memory-mapped index file.
+
+    The mapping is read-only, so every process that opens the same file shares
+    its page-cache pages instead of holding a private copy of the index.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, id_width, count, ids_start, offsets_start, heap_start,
+             strings, string_offsets_start, string_heap_start) = _BINARY_HEADER.unpack_from(self._mm, 0)
+        except struct.error:
+            magic = version = None
+        if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {_BINARY_VERSION} arXiv index")
+        self.count = count
+        self._id_width = id_width
+        self._ids_start = ids_start
+        self._offsets_start = offsets_start
+        self._heap_start = heap_start
+        self._strings = strings
+        self._string_offsets_start = string_offsets_start
+        self._string_heap_start = string_heap_start
+
+    def _id_at(self, i: int) -> bytes:
+        start = self._ids_start + i * self._id_width
+        return self._mm[start:start + self._id_width]
+
+    def _find(self, arxiv_id: str) -> int:
+        key = arxiv_id.encode("utf-8")
+        if len(key) > self._id_width:
+            return -1
+        key = key.ljust(self._id_width, b"\0")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._id_at(lo) == key:
+            return lo
+        return -1
+
+    def iter_ids(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self._id_at(i).rstrip(b"\0").decode("utf-8")
+
+    def get(self, arxiv_id: str) -> Optional[Dict[str, str]]:
+        i = self._find(arxiv_id)
+        if i < 0:
+            return None
+        start, end = struct.unpack_from("<QQ", self._mm, self._offsets_start + i * _BINARY_OFFSET.size)
+        pos = self._heap_start + start
+        type_ref, venue_ref, n_authors = _ENTRY_REFS.unpack_from(self._mm, pos)
+        pos += _ENTRY_REFS.size
+        author_refs = struct.unpack_from(f"<{n_authors}I", self._mm, pos)
+        pos += n_authors * _AUTHOR_REF.size
+        title, year, ee = self._mm[pos:self._heap_start + end].decode("utf-8").split(_FIELD_SEP)
+        return {
+            "type": self._string(type_ref),
+            "title": title,
+            "year": year,
+            "venue": self._string(venue_ref),
+            "author": _AUTHOR_SEP.join(self._string(ref) for ref in author_refs),
+            "ee": ee,
+        }
+
+    def _string(self, ref: int) -> str:
+        if ref >= self._strings:
+            raise ValueError(f"{self.path}: string reference {ref} out of range")
+        start, end = struct.unpack_from("<QQ", self._mm, self._string_offsets_start + ref * _BINARY_OFFSET.size)
+        return self._mm[self._string_heap_start + start:self._string_heap_start + end].decode("utf-8")
+
+    def close(self) -> None:
+        self._mm.close()
@@ -0,0 +1,131 @@
+"""Persisted results of remote DBLP lookups, shared by the CLI and the web app.
+
+A found citation is kept for ``positive_ttl_seconds`` and a lookup that found
+nothing for ``negative_ttl_seconds``, in one SQLite file that any number of
+processes read and write (WAL mode, ``INSERT OR REPLACE``). Lookups that
+failed are never stored. ``CACHE_MODES`` are the ways a caller may use it:
+read and write it, skip reading but store fresh results, or leave it alone.
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - minimal Python builds may ship without sqlite3
+    sqlite3 = None
+
+from logger import logger
+
+CACHE_USE = "use"
+CACHE_REFRESH = "refresh"
+CACHE_BYPASS = "bypass"
+CACHE_MODES = (CACHE_USE, CACHE_REFRESH, CACHE_BYPASS)
+# Returned by ``get`` for IDs with no live entry; ``None`` is a cached "no match".
+CACHE_MISS = object()
+
+
+class LookupCache:
+    def __init__(self, path: str, positive_ttl_seconds: float, negative_ttl_seconds: float):
+        self.path = path
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional["sqlite3.Connection"] = None
+
+    def _connect(self, create: bool = False) -> Optional["sqlite3.Connection"]:
+        # Reads never create the file; the first stored result does.
+        if self._conn is None and sqlite3 is not None and (create or os.path.exists(self.path)):
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS lookups ("
+                    "arxiv_id TEXT PRIMARY KEY, citation TEXT, checked_at REAL NOT NULL) WITHOUT ROWID"
+                )
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"DBLP lookup cache {self.path} unavailable: {e}")
+        return self._conn
+
+    def _ttl(self, citation: Optional[str]) -> float:
+        return self.positive_ttl_seconds if citation is not None else self.negative_ttl_seconds
+
+    def get(self, arxiv_id: str):
+        """The cached citation (or None for a cached no-match), else ``CACHE_MISS``."""
+        with self._lock:
+            conn = self._connect()
+            row = None
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT citation, checked_at FROM lookups WHERE arxiv_id = ?", (arxiv_id,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not read DBLP lookup cache {self.path}: {e}")
+            if row is None or time.time() - row[1] > self._ttl(row[0]):
+                self.misses += 1
+                return CACHE_MISS
+            self.hits += 1
+        return json.loads(row[0]) if row[0] is not None else None
+
+    def set(self, arxiv_id: str, citation: Optional[dict]) -> None:
+        value = json.dumps(citation) if citation is not None else None
+        with self._lock:
+            conn = self._connect(create=True)
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO lookups VALUES (?, ?, ?)", (arxiv_id, value, time.time()))
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write DBLP lookup cache {self.path}: {e}")
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            try:
+                with conn:
+                    return conn.execute(
+                        "DELETE FROM lookups WHERE (citation IS NOT NULL AND checked_at < ?) "
+                        "OR (citation IS NULL AND checked_at < ?)",
+                        (now - self.positive_ttl_seconds, now - self.negative_ttl_seconds),
+                    ).rowcount
+            except sqlite3.Error as e:
+                logger.warning(f"Could not prune DBLP lookup cache {self.path}: {e}")
+                return 0
+
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            conn = self._connect()
+            entries = 0
+            if conn is not None:
+                try:
+                    entries = conn.execute("SELECT count(*) FROM lookups").fetchone()[0]
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not read DBLP lookup cache {self.path}: {e}")
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "positive_ttl_seconds": self.positive_ttl_seconds,
+                "negative_ttl_seconds": self.negative_ttl_seconds,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,6 +1,8 @@
 # main.py
 import argparse
+from dblp_api import prune_lookup_caches, use_dblp_base_urls
 from logger import logger
+from lookup_cache import CACHE_BYPASS, CACHE_REFRESH, CACHE_USE
 from pipeline import run_flow
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -10,14 +12,38 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("input_file", help="Path to input .bib file")
     parser.add_argument("output_file", nargs="?", default="output.bib", help="Path to write the output .bib")
     parser.add_argument("--diff-report", help="Optional Markdown file to write a per-record change report")
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument(
+        "--no-cache", dest="cache_mode", action="store_const", const=CACHE_BYPASS,
+        help="Neither read nor write the persistent DBLP lookup cache",
+    )
+    cache.add_argument(
+        "--refresh-cache", dest="cache_mode", action="store_const", const=CACHE_REFRESH,
+        help="Search DBLP again for every ID and store the fresh results",
+    )
+    parser.add_argument(
+        "--prune-cache", action="store_true",
+        help="Delete expired lookup cache entries before running",
+    )
+    parser.add_argument(
+        "--dblp-url", action="append", metavar="URL",
+        help="DBLP base URL to search and download from instead of dblp.org (repeat for mirrors)",
+    )
+    parser.set_defaults(cache_mode=CACHE_USE)
     return parser
 
 def main() -> int:
     parser = build_arg_parser()
     args = parser.parse_args()
 
+    if args.dblp_url:
+        use_dblp_base_urls(args.dblp_url)
+
+    if args.prune_cache:
+        logger.info(f"Pruned {prune_lookup_caches()} expired DBLP lookup cache entries")
+
     logger.info("Running ArxivToDblp pipeline")
-    stats = run_flow(args.input_file, args.output_file, args.diff_report)
+    stats = run_flow(args.input_file, args.output_file, args.diff_report, cache_mode=args.cache_mode)
 
     if not stats.get("ok", False):
         logger.error(f"Completed with errors: {stats.get('error')}")
@@ -31,8 +57,24 @@ def main() -> int:
         f"applied={stats.get('applied_replacements')} | "
         f"unchanged={stats.get('unchanged_records')} | "
         f"no match={stats.get('no_match_records')} | "
-        f"diffs={stats.get('diff_records')}"
+        f"diffs={stats.get('diff_records')} | "
+        f"cache hits={stats.get('lookup_cache_hits')} | "
+        f"cache misses={stats.get('lookup_cache_misses')} | "
+        f"deferred={stats.get('deferred_records')} | "
+        f"DBLP breaker={(stats.get('remote_breaker') or {}).get('state')}"
     )
+    tiers = [
+        f"{name} {tier['hits']}/{tier['lookups']} in {tier['mean_ms']} ms"
+        for name, tier in (stats.get("resolver") or {}).items()
+        if tier["lookups"]
+    ]
+    if tiers:
+        logger.info("Resolver tiers (hits/lookups, mean latency): " + " | ".join(tiers))
+    if stats.get("deferred_records"):
+        logger.warning(
+            f"{stats['deferred_records']} lookups were deferred while DBLP was unreachable; "
+            "run again later to resolve them"
+        )
     return 0
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+"""Bounded in-process cache of lookup results, for long-running workers.
+
+Entries are kept in least-recently-used order and the cache never holds
+more than ``max_entries`` of them or (by a rough estimate of their size)
+``max_bytes``; past either limit the least recently used go first. A found
+result lives ``positive_ttl_seconds`` and a cached "no match" (``None``)
+``negative_ttl_seconds``. Each TTL class also keeps its entries in order of
+expiry, so expired ones are dropped on every write, not only when someone
+happens to read them again. ``get`` returns ``CACHE_MISS`` for a key with no
+live entry, like ``LookupCache``.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from lookup_cache import CACHE_MISS
+
+# Per-entry bookkeeping (dict slots, tuples, key string) on top of the value.
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory held by a cached lookup result, in bytes."""
+    if value is None:
+        return 0
+    return len(json.dumps(value, default=str)) * 2
+
+
+class MemoryCache:
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 32 * 1024 * 1024,
+        positive_ttl_seconds: float = 120.0,
+        negative_ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        size_of: Callable[[Any], int] = estimate_size,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._size_of = size_of
+        self._lock = threading.Lock()
+        # key -> (expires_at, value, size), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        # key -> expires_at, soonest first (one fixed TTL per class keeps insertion order = expiry order)
+        self._expiry = {True: OrderedDict(), False: OrderedDict()}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, key: str) -> None:
+        _, value, size = self._entries.pop(key)
+        self._expiry[value is not None].pop(key, None)
+        self._bytes -= size
+
+    def _purge_expired(self, now: float) -> None:
+        for queue in self._expiry.values():
+            while queue:
+                key, expires_at = next(iter(queue.items()))
+                if expires_at > now:
+                    break
+                self._remove(key)
+                self.expirations += 1
+
+    def get(self, key: str):
+        """The cached value (``None`` for a cached no-match), else ``CACHE_MISS``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(key)
+                    self.expirations += 1
+                self.misses += 1
+                return CACHE_MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Optional[Any]) -> None:
+        found = value is not None
+        ttl = self.positive_ttl_seconds if found else self.negative_ttl_seconds
+        if ttl <= 0:
+            return
+        size = self._size_of(value) + len(key) + _ENTRY_OVERHEAD_BYTES
+        with self._lock:
+            now = self._clock()
+            if key in self._entries:
+                self._remove(key)
+            self._purge_expired(now)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (now + ttl, value, size)
+            self._expiry[found][key] = now + ttl
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "positive_ttl_seconds": self.positive_ttl_seconds,
+                "negative_ttl_seconds": self.negative_ttl_seconds,
+            }
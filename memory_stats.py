@@ -0,0 +1,68 @@
+"""Resident-memory readings for reporting the footprint of long-running jobs."""
+import os
+import sys
+import threading
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process, or None if it cannot be read."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes(children: bool = False) -> Optional[int]:
+    """Lifetime peak RSS of this process (or of its largest reaped child)."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PeakRssSampler:
+    """Track the highest RSS seen while the ``with`` block runs.
+
+    ``ru_maxrss`` only knows the lifetime peak of the process, so a background
+    thread samples the current RSS instead, which gives a per-job figure.
+    """
+
+    def __init__(self, interval_seconds: float = 0.2):
+        self.interval_seconds = interval_seconds
+        self.peak_bytes: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak_bytes is None or rss > self.peak_bytes):
+            self.peak_bytes = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def __enter__(self) -> "PeakRssSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+
+def format_mb(num_bytes: Optional[int]) -> str:
+    return "n/a" if num_bytes is None else f"{num_bytes / (1024 * 1024):.1f} MB"
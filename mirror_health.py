@@ -0,0 +1,85 @@
+"""Latency and error tracking for the DBLP search mirrors.
+
+Every request outcome is recorded against its endpoint: an exponentially
+weighted mean latency and error rate, plus a window of recent latencies for
+percentiles. ``ranked`` orders the endpoints healthiest first, so lookups go
+to the mirror that currently answers fastest and most reliably instead of
+alternating blindly. An endpoint nobody has measured yet ranks first, so
+each one is tried at least once. ``hedge_delay`` is how long to wait on a
+request before a second one to another mirror is worth sending.
+"""
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+# How much one error weighs against latency: a mirror failing half its
+# requests scores like one that is (1 + 0.5 * 10) = 6 times slower.
+_ERROR_WEIGHT = 10.0
+
+
+class _EndpointHealth:
+    def __init__(self, window: int):
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+
+class MirrorSelector:
+    def __init__(self, endpoints: Sequence[str], alpha: float = 0.2, window: int = 50):
+        if not endpoints:
+            raise ValueError("MirrorSelector needs at least one endpoint")
+        self.endpoints = list(endpoints)
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._health: Dict[str, _EndpointHealth] = {url: _EndpointHealth(window) for url in self.endpoints}
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        """Fold one request outcome into the endpoint's health."""
+        with self._lock:
+            health = self._health[endpoint]
+            health.requests += 1
+            health.errors += 0 if ok else 1
+            health.recent.append(seconds)
+            if health.latency is None:
+                health.latency = seconds
+                health.error_rate = 0.0 if ok else 1.0
+            else:
+                health.latency += self.alpha * (seconds - health.latency)
+                health.error_rate += self.alpha * ((0.0 if ok else 1.0) - health.error_rate)
+
+    def _score(self, health: _EndpointHealth) -> float:
+        if health.latency is None:
+            return 0.0
+        return health.latency * (1.0 + _ERROR_WEIGHT * health.error_rate)
+
+    def ranked(self) -> List[str]:
+        """Endpoints, healthiest first; ties keep the configured order."""
+        with self._lock:
+            return sorted(self.endpoints, key=lambda url: self._score(self._health[url]))
+
+    def latency_percentile(self, endpoint: str, fraction: float) -> Optional[float]:
+        with self._lock:
+            recent = sorted(self._health[endpoint].recent)
+        if not recent:
+            return None
+        return recent[min(len(recent) - 1, int(fraction * len(recent)))]
+
+    def hedge_delay(self, endpoint: str, fraction: float, default: float) -> float:
+        """Seconds after which a request to ``endpoint`` is slower than ``fraction`` of its recent ones."""
+        delay = self.latency_percentile(endpoint, fraction)
+        return delay if delay is not None else default
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            return {
+                url: {
+                    "latency_seconds": round(h.latency, 4) if h.latency is not None else None,
+                    "error_rate": round(h.error_rate, 4),
+                    "requests": h.requests,
+                    "errors": h.errors,
+                    "score": round(self._score(h), 4),
+                }
+                for url, h in self._health.items()
+            }
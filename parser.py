@@ -24,138 +24,133 @@ def extract_arxiv_id(*fields):
     return None
 
 
-def _skip_ws(content, i):
-    while i < len(content) and content[i].isspace():
-        i += 1
-    return i
+# The scanners below jump from one structural character to the next with
+# precompiled patterns and slice values out of the source, rather than
+# walking (and copying) the content one character at a time.
+_WHITESPACE = re.compile(r'\s*')
+_NAME = re.compile(r'[\w-]*')
+_FIELD_HEAD = re.compile(r'\s*([\w-]+)\s*=\s*')
+_SEPARATOR = re.compile(r'\s*,?')
+# A backslash escapes the next character, whatever it is.
+_BRACED_TOKEN = re.compile(r'\\.|["{}]', re.DOTALL)
+_QUOTED_TOKEN = re.compile(r'\\.|"', re.DOTALL)
+_RAW_VALUE = {'}': re.compile(r'[^,}]*'), ')': re.compile(r'[^,)]*')}
 
 
-def _read_balanced(content, i, open_char, close_char):
-    depth = 1
-    i += 1
-    out = []
-    escaped = False
-    in_quotes = False
+def _nested_braces(levels):
+    """Pattern for brace-balanced text, up to ``levels`` deep, without double quotes."""
+    flat = r'[^\\"{}]*(?:\\.[^\\"{}]*)*'
+    inner = flat
+    for _ in range(levels):
+        inner = flat + r'(?:\{' + inner + r'\}' + flat + r')*'
+    return inner
 
-    while i < len(content):
-        ch = content[i]
 
-        if escaped:
-            out.append(ch)
-            escaped = False
-            i += 1
-            continue
+# Most braced values match this in one call; the token scan handles the rest.
+_BRACED_VALUE = re.compile(r'\{(' + _nested_braces(3) + r')\}', re.DOTALL)
 
-        if ch == '\\':
-            out.append(ch)
-            escaped = True
-            i += 1
-            continue
 
-        if ch == '"':
+def _skip_ws(content, i):
+    return _WHITESPACE.match(content, i).end()
+
+
+def _read_balanced(content, i):
+    """The value of the ``{...}`` opening at ``i`` and the index after its closing brace.
+
+    Braces inside double quotes or escaped with a backslash do not count.
+    """
+    close = content.find('}', i + 1)
+    if close != -1:
+        value = content[i + 1:close]
+        if '{' not in value and '"' not in value and '\\' not in value:
+            return value, close + 1
+    nested = _BRACED_VALUE.match(content, i)
+    if nested:
+        return nested.group(1), nested.end()
+    depth = 1
+    in_quotes = False
+    search = _BRACED_TOKEN.search
+    match = search(content, i + 1)
+    while match:
+        token = match.group()
+        if token == '"':
             in_quotes = not in_quotes
-            out.append(ch)
-            i += 1
-            continue
-
-        if not in_quotes and ch == open_char:
+        elif not in_quotes and token == '{':
             depth += 1
-            out.append(ch)
-        elif not in_quotes and ch == close_char:
+        elif not in_quotes and token == '}':
             depth -= 1
             if depth == 0:
-                return ''.join(out), i + 1
-            out.append(ch)
-        else:
-            out.append(ch)
-        i += 1
-
+                return content[i + 1:match.start()], match.end()
+        match = search(content, match.end())
     raise ValueError("Unterminated balanced value")
 
 
 def _read_quoted(content, i):
-    i += 1
-    out = []
-    escaped = False
-    while i < len(content):
-        ch = content[i]
-        if escaped:
-            out.append(ch)
-            escaped = False
-        elif ch == '\\':
-            out.append(ch)
-            escaped = True
-        elif ch == '"':
-            return ''.join(out), i + 1
-        else:
-            out.append(ch)
-        i += 1
+    search = _QUOTED_TOKEN.search
+    match = search(content, i + 1)
+    while match:
+        if match.group() == '"':
+            return content[i + 1:match.start()], match.end()
+        match = search(content, match.end())
     raise ValueError("Unterminated quoted value")
 
 
 def _read_entry_header(content, i):
     start = i
-    i += 1
-    type_start = i
-    while i < len(content) and (content[i].isalnum() or content[i] in "_-"):
-        i += 1
-    entry_type = content[type_start:i]
+    i = _NAME.match(content, i + 1).end()
+    entry_type = content[start + 1:i]
     i = _skip_ws(content, i)
     if i >= len(content) or content[i] not in "{(":
         raise ValueError(f"Invalid entry header near index {start}")
 
     opener = content[i]
-    i += 1
-    i = _skip_ws(content, i)
-    key_start = i
-    while i < len(content) and content[i] != ',':
-        i += 1
-    if i >= len(content):
+    key_start = _skip_ws(content, i + 1)
+    i = content.find(',', key_start)
+    if i == -1:
         raise ValueError("Missing citation key separator")
     citation_key = content[key_start:i].strip()
     return entry_type, citation_key, i + 1, opener
 
 
+def _field_head_error(content, i):
+    """The error for a field that does not start with ``name =``."""
+    name_end = _NAME.match(content, i).end()
+    if name_end == i:
+        return ValueError(f"Invalid field name at index {i}")
+    return ValueError(f"Expected '=' after field {content[i:name_end]}")
+
+
 def _parse_fields(content, i, close_char):
     fields = {}
-    while i < len(content):
-        i = _skip_ws(content, i)
-        if i >= len(content):
-            break
-        if content[i] == close_char:
-            return fields, i + 1
-
-        key_start = i
-        while i < len(content) and (content[i].isalnum() or content[i] in "_-"):
-            i += 1
-        key = content[key_start:i]
-        if not key:
-            raise ValueError(f"Invalid field name at index {i}")
-
-        i = _skip_ws(content, i)
-        if i >= len(content) or content[i] != '=':
-            raise ValueError(f"Expected '=' after field {key}")
-        i += 1
-        i = _skip_ws(content, i)
-
-        if i >= len(content):
+    end = len(content)
+    raw_value = _RAW_VALUE[close_char]
+    while i < end:
+        head = _FIELD_HEAD.match(content, i)
+        if head is None:
+            i = _skip_ws(content, i)
+            if i >= end:
+                break
+            if content[i] == close_char:
+                return fields, i + 1
+            raise _field_head_error(content, i)
+        key = head.group(1)
+        i = head.end()
+
+        if i >= end:
             raise ValueError(f"Missing value for field {key}")
 
-        if content[i] == '{':
-            value, i = _read_balanced(content, i, '{', '}')
-        elif content[i] == '"':
+        ch = content[i]
+        if ch == '{':
+            value, i = _read_balanced(content, i)
+        elif ch == '"':
             value, i = _read_quoted(content, i)
         else:
-            raw_start = i
-            while i < len(content) and content[i] not in (',', close_char):
-                i += 1
-            value = content[raw_start:i].strip()
+            raw_end = raw_value.match(content, i).end()
+            value = content[i:raw_end].strip()
+            i = raw_end
 
         fields[key] = value
-
-        i = _skip_ws(content, i)
-        if i < len(content) and content[i] == ',':
-            i += 1
+        i = _SEPARATOR.match(content, i).end()
     raise ValueError("Unterminated entry body")
 
 
@@ -1,7 +1,8 @@
 # pipeline.py
 from typing import Optional, Dict, Any, List
 from parser import parse_bib_file, write_bib_file
-from dblp_api import find_dblp_citation
+from dblp_api import find_dblp_citation, lookup_cache_counters, remote_breaker_status, resolver_status
+from lookup_cache import CACHE_USE
 from logger import logger
 from diff import format_changes_for_log, format_changes_markdown
 from transform_service import generate_proposals, apply_replacements
@@ -10,6 +11,7 @@ def run_flow(
     input_file: str,
     output_file: str,
     diff_report: Optional[str] = None,
+    cache_mode: str = CACHE_USE,
 ) -> Dict[str, Any]:
     """
     Execute the full conversion pipeline:
@@ -18,6 +20,9 @@ def run_flow(
       3) Log and optionally write per-record diffs
       4) Write output .bib
 
+    ``cache_mode`` says how lookups use the persistent lookup cache
+    (``"use"``, ``"refresh"`` or ``"bypass"``).
+
     Returns a stats dict suitable for logging/telemetry or testing.
     """
     # 1) Parse
@@ -30,7 +35,14 @@ def run_flow(
     report_sections: List[str] = []
 
     # 2) Process records via shared transformation service
-    proposal_result = generate_proposals(original_records, find_dblp_citation)
+    cache_before = lookup_cache_counters()
+    proposal_result = generate_proposals(
+        original_records,
+        lambda arxiv_id, key, title=None, author=None: find_dblp_citation(
+            arxiv_id, key, title=title, author=author, cache_mode=cache_mode
+        ),
+    )
+    cache_after = lookup_cache_counters()
     proposals = proposal_result["proposals"]
     diffs = proposal_result["diffs"]
     shared_stats = proposal_result["stats"]
@@ -55,6 +67,10 @@ def run_flow(
         "output_file": output_file,
         **shared_stats,
         "applied_replacements": applied["applied_replacements"],
+        "lookup_cache_hits": cache_after["hits"] - cache_before["hits"],
+        "lookup_cache_misses": cache_after["misses"] - cache_before["misses"],
+        "remote_breaker": remote_breaker_status(),
+        "resolver": resolver_status(),
     }
 
     # 3) Write output
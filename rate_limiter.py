@@ -0,0 +1,142 @@
+"""Adaptive per-host request pacing for the DBLP search API.
+
+Each host gets a token bucket, kept in its virtual-scheduling form: a
+"theoretical arrival time" that advances by ``1 / rate`` per request, with
+``burst`` requests allowed ahead of it. ``acquire`` reserves the next slot
+under a lock and sleeps after releasing it, so waiting threads queue in
+arrival order without blocking each other. The rate follows the server:
+each 429 halves it (down to ``min_rate``) and honours Retry-After as a
+cooldown, and every successful request adds ``increase`` back, up to
+``max_rate``.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase: float = 0.05,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Request rate must be positive, got {rate}")
+        self.burst = max(1, int(burst))
+        self.min_rate = min(rate, min_rate) if min_rate is not None else rate / 16.0
+        self.max_rate = max(rate, max_rate) if max_rate is not None else rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._rate = rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tat = 0.0  # when the bucket is full again
+        self._not_before = 0.0  # end of a server-requested cooldown
+        self._waiting = 0
+        self.throttled = 0
+
+    @property
+    def rate(self) -> float:
+        with self._lock:
+            return self._rate
+
+    def _tolerance(self) -> float:
+        return (self.burst - 1) / self._rate
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Claim the next request slot and return how long to wait for it.
+
+        With ``max_wait``, a slot further away than that is left unclaimed and
+        ``None`` is returned, so a caller out of time does not push everyone
+        queued behind it back.
+        """
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            start = max(now, tat - self._tolerance(), self._not_before)
+            if max_wait is not None and start - now > max_wait:
+                return None
+            self._tat = max(tat, start) + 1.0 / self._rate
+            return start - now
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now; never waits."""
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            if now < max(tat - self._tolerance(), self._not_before):
+                return False
+            self._tat = tat + 1.0 / self._rate
+            return True
+
+    def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Block until a request may be sent; return the seconds waited.
+
+        Returns ``None`` at once, without a slot, if the wait would exceed ``max_wait``.
+        """
+        wait = self.reserve(max_wait)
+        if wait is not None and wait > 0:
+            with self._lock:
+                self._waiting += 1
+            try:
+                self._sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+        return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._rate = min(self.max_rate, self._rate + self.increase)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """React to a 429: slow down and, given Retry-After, pause every caller that long."""
+        with self._lock:
+            self.throttled += 1
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            now = self._clock()
+            if retry_after is not None and retry_after > 0:
+                self._not_before = max(self._not_before, now + retry_after)
+            # Drain the bucket, so requests resume one at a time rather than in a burst.
+            self._tat = max(self._tat, max(self._not_before, now) + self._tolerance())
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            now = self._clock()
+            return {
+                "rate_per_second": round(self._rate, 4),
+                "burst": self.burst,
+                "queue_depth": self._waiting,
+                "cooldown_seconds": round(max(0.0, self._not_before - now), 3),
+                "throttled": self.throttled,
+            }
+
+
+class HostRateLimiter:
+    """One ``TokenBucket`` per host, created on first use with the same settings."""
+
+    def __init__(self, rate: float, burst: int = 1, **bucket_options):
+        self.rate = rate
+        self.burst = burst
+        self._bucket_options = bucket_options
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst, **self._bucket_options)
+            return bucket
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats() for host, bucket in buckets.items()}
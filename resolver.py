@@ -0,0 +1,269 @@
+"""Tiered resolution of arXiv IDs to DBLP citations.
+
+A ``ResolverEngine`` asks its tiers in order (in-process LRU, local index,
+title index, known misses, persistent cache, remote search in the default
+build in ``dblp_api``) and the first answer wins; a tier that has none
+returns ``CACHE_MISS`` and the question moves on. ``None`` is an answer: DBLP
+has no such record. Once a tier answers, the others may ``remember`` it, which
+is how the caches fill: the persistent cache keeps what the remote tier found,
+the in-process LRU keeps every answer not read from the dump.
+
+Tiers are ``local`` when they answer from the downloaded dump (trusted as is
+and never copied into a cache) and ``remote`` when they send requests, so a
+caller can resolve without the network first and batch the rest. Each tier
+counts its lookups, hits, errors and call latency; ``ResolverEngine.stats``
+reports them. Engines share nothing but what their tiers are given, so
+several can run side by side in one process.
+"""
+import copy
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+from deadline import Deadline
+from lookup_cache import CACHE_BYPASS, CACHE_MISS, CACHE_USE, LookupCache
+from memory_cache import MemoryCache
+
+
+class LookupQuery:
+    """One arXiv ID to resolve, with everything a tier may need to do it."""
+
+    __slots__ = ("arxiv_id", "key", "title", "author", "cache_mode", "deadline", "request_timeout")
+
+    def __init__(
+        self,
+        arxiv_id: str,
+        key: str,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        cache_mode: str = CACHE_USE,
+        deadline: Optional[Deadline] = None,
+        request_timeout: float = 10,
+    ):
+        self.arxiv_id = arxiv_id
+        self.key = key
+        self.title = title
+        self.author = author
+        self.cache_mode = cache_mode
+        self.deadline = deadline
+        self.request_timeout = request_timeout
+
+
+class TierStats:
+    def __init__(self, window: int = 512):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.lookups = 0
+        self.hits = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float, lookups: int, hits: int, error: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.lookups += lookups
+            self.hits += hits
+            self.errors += 1 if error else 0
+            self.seconds += seconds
+            self._recent.append(seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            recent = sorted(self._recent)
+            return {
+                "calls": self.calls,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else None,
+                "errors": self.errors,
+                "mean_ms": round(self.seconds / self.calls * 1000, 3) if self.calls else None,
+                "p95_ms": round(recent[min(len(recent) - 1, int(0.95 * len(recent)))] * 1000, 3) if recent else None,
+            }
+
+
+class Tier:
+    name = "tier"
+    local = False
+    remote = False
+
+    def __init__(self):
+        self.counters = TierStats()
+
+    def lookup(self, query: LookupQuery):
+        """The answer for ``query`` (a citation or None), or ``CACHE_MISS``."""
+        return CACHE_MISS
+
+    def lookup_many(self, queries: Sequence[LookupQuery], batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """Answers by arXiv ID for the queries this tier can answer."""
+        answers = {}
+        for query in queries:
+            answer = self.lookup(query)
+            if answer is not CACHE_MISS:
+                answers[query.arxiv_id] = answer
+        return answers
+
+    def remember(self, query: LookupQuery, answer: Optional[dict], source: "Tier") -> None:
+        """Another tier answered ``query``; keep the answer if this tier caches."""
+
+    def stats(self) -> Dict[str, object]:
+        return self.counters.snapshot()
+
+
+class FunctionTier(Tier):
+    """A tier made of plain functions: ``lookup(query)`` and optionally ``lookup_many(queries, batch_size)``."""
+
+    def __init__(
+        self,
+        name: str,
+        lookup: Callable[[LookupQuery], Any],
+        lookup_many: Optional[Callable[[Sequence[LookupQuery], Optional[int]], Dict[str, Any]]] = None,
+        local: bool = False,
+        remote: bool = False,
+    ):
+        super().__init__()
+        self.name = name
+        self.local = local
+        self.remote = remote
+        self._lookup = lookup
+        self._lookup_many = lookup_many
+
+    def lookup(self, query: LookupQuery):
+        return self._lookup(query)
+
+    def lookup_many(self, queries: Sequence[LookupQuery], batch_size: Optional[int] = None) -> Dict[str, Any]:
+        if self._lookup_many is None:
+            return super().lookup_many(queries, batch_size)
+        return self._lookup_many(queries, batch_size)
+
+
+def with_key(citation: Optional[dict], key: str) -> Optional[dict]:
+    """A private copy of a shared answer, under the caller's citation key."""
+    if citation is None:
+        return None
+    citation = copy.deepcopy(citation)
+    citation["citation_key"] = key
+    return citation
+
+
+class MemoryTier(Tier):
+    """Answers kept in this process, in a bounded ``MemoryCache``."""
+
+    name = "memory"
+
+    def __init__(self, cache: MemoryCache):
+        super().__init__()
+        self.cache = cache
+
+    def lookup(self, query: LookupQuery):
+        if query.cache_mode != CACHE_USE:
+            return CACHE_MISS
+        answer = self.cache.get(query.arxiv_id)
+        return answer if answer is CACHE_MISS else with_key(answer, query.key)
+
+    def remember(self, query: LookupQuery, answer: Optional[dict], source: Tier) -> None:
+        if not source.local and query.cache_mode != CACHE_BYPASS:
+            self.cache.set(query.arxiv_id, copy.deepcopy(answer))
+
+
+class PersistentCacheTier(Tier):
+    """Remote answers kept across runs in a ``LookupCache``.
+
+    ``cache`` may be a zero-argument function returning the cache, so the
+    tier follows a cache that is swapped out after the engine was built.
+    """
+
+    name = "lookup_cache"
+
+    def __init__(self, cache: Union[LookupCache, Callable[[], LookupCache]]):
+        super().__init__()
+        self._cache = cache if callable(cache) else (lambda: cache)
+
+    def lookup(self, query: LookupQuery):
+        if query.cache_mode != CACHE_USE:
+            return CACHE_MISS
+        answer = self._cache().get(query.arxiv_id)
+        if answer is not None and answer is not CACHE_MISS:
+            answer["citation_key"] = query.key
+        return answer
+
+    def remember(self, query: LookupQuery, answer: Optional[dict], source: Tier) -> None:
+        if source.remote and query.cache_mode != CACHE_BYPASS:
+            self._cache().set(query.arxiv_id, answer)
+
+
+class ResolverEngine:
+    def __init__(self, tiers: Sequence[Tier]):
+        if len({tier.name for tier in tiers}) != len(tiers):
+            raise ValueError("Resolver tier names must be unique")
+        self.tiers: List[Tier] = list(tiers)
+
+    def tier(self, name: str) -> Tier:
+        for tier in self.tiers:
+            if tier.name == name:
+                return tier
+        raise KeyError(name)
+
+    def _selected(self, local: bool, remote: bool) -> List[Tier]:
+        return [tier for tier in self.tiers if (remote if tier.remote else local)]
+
+    def resolve(self, query: LookupQuery, remote: bool = True) -> Tuple[Any, Optional[Tier]]:
+        """The first answer for ``query`` and the tier that gave it, else ``(CACHE_MISS, None)``."""
+        for tier in self._selected(local=True, remote=remote):
+            started = time.perf_counter()
+            try:
+                answer = tier.lookup(query)
+            except Exception:
+                tier.counters.record(time.perf_counter() - started, 1, 0, error=True)
+                raise
+            tier.counters.record(time.perf_counter() - started, 1, 0 if answer is CACHE_MISS else 1)
+            if answer is not CACHE_MISS:
+                self.remember(query, answer, tier)
+                return answer, tier
+        return CACHE_MISS, None
+
+    def resolve_many(
+        self,
+        queries: Sequence[LookupQuery],
+        local: bool = True,
+        remote: bool = True,
+        batch_size: Optional[int] = None,
+        remember: bool = True,
+    ) -> Dict[str, Any]:
+        """Answers by arXiv ID; each tier gets the queries the tiers before it left open.
+
+        With ``remember=False`` the caller stores the answers itself (see ``remember``).
+        """
+        pending: List[LookupQuery] = []
+        seen = set()
+        for query in queries:
+            if query.arxiv_id not in seen:
+                seen.add(query.arxiv_id)
+                pending.append(query)
+        answers: Dict[str, Any] = {}
+        for tier in self._selected(local, remote):
+            if not pending:
+                break
+            started = time.perf_counter()
+            try:
+                found = tier.lookup_many(pending, batch_size)
+            except Exception:
+                tier.counters.record(time.perf_counter() - started, len(pending), 0, error=True)
+                raise
+            tier.counters.record(time.perf_counter() - started, len(pending), len(found))
+            for query in pending:
+                if query.arxiv_id in found:
+                    answers[query.arxiv_id] = found[query.arxiv_id]
+                    if remember:
+                        self.remember(query, found[query.arxiv_id], tier)
+            pending = [query for query in pending if query.arxiv_id not in found]
+        return answers
+
+    def remember(self, query: LookupQuery, answer: Optional[dict], source: Tier) -> None:
+        for tier in self.tiers:
+            if tier is not source:
+                tier.remember(query, answer, source)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {tier.name: tier.stats() for tier in self.tiers}
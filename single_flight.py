@@ -0,0 +1,63 @@
+"""Coalescing of concurrent identical calls within one process.
+
+When several threads (say, review jobs for bibliographies from the same lab)
+ask for the same key at once, only the first runs the call; the others wait
+for it and receive its result, or its exception. Once the call finishes the
+key is forgotten, so a later request runs a fresh call. Nothing is cached
+here; that is the lookup cache's job.
+"""
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """Run ``fn`` for ``key``, or wait for the run already in flight.
+
+        A waiter gives up with ``TimeoutError`` after ``timeout`` seconds; the
+        run itself carries on for the others.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Gave up waiting for the call in flight for {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}
@@ -4,3 +4,23 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_lookup_cache(tmp_path, monkeypatch):
+    """Give every test its own lookup cache, resolver engine and a closed circuit breaker."""
+    import dblp_api
+    from lookup_cache import LookupCache
+
+    from circuit_breaker import CircuitBreaker
+
+    cache = LookupCache(str(tmp_path / "lookup_cache.sqlite3"), 3600.0, 3600.0)
+    monkeypatch.setattr(dblp_api, "_LOOKUP_CACHE", cache)
+    # Answers remembered in memory by one test must not leak into the next.
+    monkeypatch.setattr(dblp_api, "_ENGINE", dblp_api.build_resolver_engine())
+    # Failed requests in one test must not open the breaker for the next.
+    monkeypatch.setattr(dblp_api, "_BREAKER", CircuitBreaker())
+    yield cache
+    cache.close()
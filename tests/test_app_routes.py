@@ -6,6 +6,7 @@ import unittest
 from unittest.mock import patch
 
 import app as app_module
+from errors import LookupDeferred
 
 
 class AppRouteTests(unittest.TestCase):
@@ -48,8 +49,25 @@ class AppRouteTests(unittest.TestCase):
         payload = status_resp.get_json()
         self.assertEqual(payload['status'], 'queued')
         self.assertTrue(payload['dataset_sync_in_progress'])
+        self.assertEqual(payload['remote_breaker']['state'], 'closed')
         mock_process.assert_called_once()
 
+    @patch('app.find_dblp_citation', side_effect=LookupDeferred("paused"))
+    def test_review_job_marks_lookups_deferred_while_breaker_is_open(self, mock_find):
+        token = 'deferred'
+        state = {
+            'status': 'queued',
+            'records': [{'type': 'misc', 'citation_key': 'k1', 'from_arxiv': True, 'arxiv_id': '1234.5678', 'fields': {}}],
+        }
+        app_module._write_state(token, state)
+
+        app_module._process_review_job(token)
+
+        done = app_module._read_state(token)
+        self.assertEqual(done['status'], 'done')
+        self.assertEqual(done['records'][0]['lookup_status'], 'deferred')
+        self.assertEqual(done['totals']['deferred_records'], 1)
+
     def test_finalize_with_accepted_indices(self):
         token = 'tok'
         state = {
@@ -72,6 +90,24 @@ class AppRouteTests(unittest.TestCase):
         expired = self.client.post('/finalize', data={'token': 'does-not-exist'})
         self.assertEqual(expired.status_code, 302)
 
+    @patch('app.local_index_status', return_value={"generation": 3, "loaded": True, "source": "binary"})
+    def test_index_status_reports_active_generation(self, mock_status):
+        resp = self.client.get('/index_status')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.get_json()["generation"], 3)
+
+    @patch('app.rate_limiter_status', return_value={"dblp.org": {"rate_per_second": 0.5, "queue_depth": 2}})
+    def test_rate_limit_status_reports_each_host(self, mock_status):
+        resp = self.client.get('/rate_limit_status')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.get_json()["dblp.org"]["queue_depth"], 2)
+
+    @patch('app.resolver_status', return_value={"memory": {"lookups": 4, "hits": 1, "hit_rate": 0.25}})
+    def test_resolver_status_reports_each_tier(self, mock_status):
+        resp = self.client.get('/resolver_status')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.get_json()["memory"]["hit_rate"], 0.25)
+
 
 class StartupSyncDecisionTests(unittest.TestCase):
     def test_should_start_sync_in_non_debug_process(self):
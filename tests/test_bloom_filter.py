@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+
+from bloom_filter import BloomFilter, build_bloom_filter
+
+
+class BloomFilterTests(unittest.TestCase):
+    def test_no_false_negatives_and_false_positives_near_target(self):
+        bloom = BloomFilter.for_capacity(10000, fp_rate=0.01)
+        keys = [f"2401.{n:05d}" for n in range(10000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in keys))
+        false_positives = sum(f"2402.{n:05d}" in bloom for n in range(10000))
+        self.assertLess(false_positives, 200)
+        self.assertAlmostEqual(bloom.expected_fp_rate(), 0.01, delta=0.002)
+        self.assertEqual(bloom.stats()["memory_bytes"], 11982)
+
+    def test_round_trip_and_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ids.bloom")
+            stats = build_bloom_filter(path, ["1234.5678", "cs/9901001"], capacity=2)
+            loaded = BloomFilter.load(path)
+            self.assertIn("cs/9901001", loaded)
+            self.assertNotIn("9999.99999", loaded)
+            self.assertEqual(loaded.stats(), stats)
+
+            with open(path, "wb") as f:
+                f.write(b"garbage")
+            with self.assertRaises(ValueError):
+                BloomFilter.load(path)
+        with self.assertRaises(ValueError):
+            BloomFilter.for_capacity(10, fp_rate=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+import dblp_api
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from deadline import Deadline
+from errors import LookupDeadlineExceeded, LookupDeferred
+from transform_service import generate_proposals
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0, clock=self.clock)
+
+    def test_opens_after_consecutive_failures_only(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.stats()["rejected"], 1)
+
+    def test_half_open_lets_one_probe_through(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 30.0
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens_for_another_timeout(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 31.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertAlmostEqual(self.breaker.retry_in(), 30.0)
+
+    def test_released_probe_lets_the_next_caller_probe(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 30.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.release_probe()
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+
+
+class RemoteBreakerTests(unittest.TestCase):
+    def test_open_breaker_defers_lookups_without_requests_or_sleeps(self):
+        session = MagicMock()
+        session.get.side_effect = requests.ConnectionError("down")
+        with patch.object(dblp_api, "_BREAKER", CircuitBreaker(failure_threshold=2, reset_timeout=60.0)), \
+                patch("dblp_api._build_dblp_session", return_value=session), \
+                patch.object(dblp_api, "_DBLP_SESSION", None), \
+                patch("dblp_api._reserve_request_slot"), patch("dblp_api.time.sleep") as sleep, \
+                patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine(tiers=("lookup_cache", "remote"))):
+            with self.assertRaises(LookupDeferred):
+                dblp_api.find_dblp_citation("2101.00001", "k1")
+            with self.assertRaises(LookupDeferred):
+                dblp_api.find_dblp_citation("2101.00002", "k2")
+
+            self.assertEqual(session.get.call_count, 2)
+            sleep.assert_not_called()
+            self.assertEqual(dblp_api.remote_breaker_status()["state"], OPEN)
+
+    def test_probe_that_runs_out_of_time_does_not_wedge_the_breaker(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"result": {}}))
+        with patch.object(dblp_api, "_BREAKER", breaker), \
+                patch.object(dblp_api, "_DBLP_SESSION", session), \
+                patch("dblp_api._reserve_request_slot"):
+            # Time runs out between the breaker check and the request.
+            deadline = MagicMock(spec=Deadline)
+            deadline.expired.return_value = False
+            deadline.cap.return_value = 0.0
+            with self.assertRaises(LookupDeadlineExceeded):
+                dblp_api.try_fetch_from_dblp("2101.00001", deadline=deadline)
+            self.assertEqual(breaker.state, HALF_OPEN)
+            with patch("dblp_api._reserve_request_slot", side_effect=LookupDeadlineExceeded("no slot")):
+                with self.assertRaises(LookupDeadlineExceeded):
+                    dblp_api.try_fetch_from_dblp("2101.00001", deadline=Deadline(5.0))
+            self.assertEqual(breaker.state, HALF_OPEN)
+
+            self.assertEqual(dblp_api.try_fetch_from_dblp("2101.00002"), {"result": {}})
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_deferred_lookups_are_counted_apart_from_failures(self):
+        records = [{"citation_key": "k", "from_arxiv": True, "arxiv_id": "2101.00001"}]
+        result = generate_proposals(records, MagicMock(side_effect=LookupDeferred("paused")))
+        self.assertEqual(result["stats"]["deferred_records"], 1)
+        self.assertEqual(result["stats"]["failures"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch
 
 from transform_service import generate_proposals, apply_replacements
+from pipeline import run_flow
 from review_logic import build_review_state, finalize_records
 
 
@@ -24,7 +25,7 @@ def _fixture_records():
     ]
 
 
-def _lookup(arxiv_id, citation_key):
+def _lookup(arxiv_id, citation_key, title=None, author=None):
     if arxiv_id == "1234.5678":
         return {
             "type": "inproceedings",
@@ -49,6 +50,15 @@ class CrossInterfaceTests(unittest.TestCase):
         self.assertEqual(web_state["totals"]["total"], cli_result["stats"]["total_records"])
         self.assertEqual(web_state["totals"]["with_proposals"], cli_result["stats"]["proposed_replacements"])
 
+    def test_cli_lookups_get_the_citing_title_and_author(self):
+        records = _fixture_records()
+        records[0]["fields"]["author"] = "Jane Doe"
+        with patch("pipeline.parse_bib_file", return_value=records), patch("pipeline.write_bib_file"), \
+                patch("pipeline.find_dblp_citation", return_value=None) as lookup:
+            run_flow("in.bib", "out.bib")
+
+        lookup.assert_called_once_with("1234.5678", "k1", title="Paper A", author="Jane Doe", cache_mode="use")
+
     def test_cli_and_web_share_replacement_application(self):
         records = _fixture_records()
         proposals = generate_proposals(records, _lookup)["proposals"]
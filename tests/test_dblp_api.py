@@ -3,9 +3,17 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from dblp_api import find_dblp_citation
+import pytest
+import requests
+
+import dblp_api
+from dblp_api import find_dblp_citation, find_dblp_citations, try_fetch_from_dblp
+from deadline import Deadline
+from errors import LookupDeadlineExceeded, LookupFailure
+from mirror_health import MirrorSelector
+from rate_limiter import HostRateLimiter
 
 
 def _make_hit(title, year, ee=None, venue="TestConf", authors=None, record_type="article"):
@@ -62,3 +70,130 @@ def test_find_dblp_citation_returns_none_when_no_candidate_matches_and_threshold
         citation = find_dblp_citation("1234.5678", "origKey", min_confidence=0.7)
 
     assert citation is None
+
+
+def _ok_response():
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"result": {"hits": {"@total": "0"}}}
+    return response
+
+
+def test_try_fetch_from_dblp_reuses_one_session_across_lookups():
+    session = MagicMock()
+    session.get.return_value = _ok_response()
+    with patch.object(dblp_api, "_DBLP_SESSION", None), \
+            patch("dblp_api._build_dblp_session", return_value=session) as build, \
+            patch("dblp_api._reserve_request_slot"):
+        try_fetch_from_dblp("1234.5678")
+        try_fetch_from_dblp("2345.6789")
+
+    assert build.call_count == 1
+    assert session.get.call_count == 2
+    session.close.assert_not_called()
+
+
+def test_try_fetch_from_dblp_recreates_session_after_connection_error():
+    broken = MagicMock()
+    broken.get.side_effect = requests.ConnectionError("reset by peer")
+    fresh = MagicMock()
+    fresh.get.return_value = _ok_response()
+    with patch.object(dblp_api, "_DBLP_SESSION", None), \
+            patch("dblp_api._build_dblp_session", side_effect=[broken, fresh]), \
+            patch("dblp_api._reserve_request_slot"), patch("dblp_api.time.sleep"):
+        assert try_fetch_from_dblp("1234.5678", max_retries=2) == {"result": {"hits": {"@total": "0"}}}
+        assert dblp_api._DBLP_SESSION is fresh
+
+
+def test_try_fetch_from_dblp_keeps_session_after_timeout():
+    session = MagicMock()
+    session.get.side_effect = requests.ReadTimeout("slow")
+    with patch.object(dblp_api, "_DBLP_SESSION", None), \
+            patch("dblp_api._build_dblp_session", return_value=session) as build, \
+            patch("dblp_api._reserve_request_slot"), patch("dblp_api.time.sleep"):
+        with pytest.raises(LookupFailure):
+            try_fetch_from_dblp("1234.5678", max_retries=2)
+
+    assert build.call_count == 1
+
+
+def test_deadline_caps_request_timeouts_and_skips_retries_that_cannot_finish():
+    now = [0.0]
+    timeouts = []
+
+    def timed_out(url, params, timeout):
+        timeouts.append(timeout)
+        now[0] += timeout
+        raise requests.ReadTimeout("slow")
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    session = MagicMock()
+    session.get.side_effect = timed_out
+    deadline = Deadline(12.0, clock=lambda: now[0])
+    with patch.object(dblp_api, "_DBLP_SESSION", session), \
+            patch.object(dblp_api, "_MIRRORS", MirrorSelector(["https://dblp.test/search/publ/api"])), \
+            patch("dblp_api._reserve_request_slot"), patch("dblp_api.time.sleep", side_effect=sleep):
+        with pytest.raises(LookupDeadlineExceeded):
+            try_fetch_from_dblp("1234.5678", max_retries=5, request_timeout=10, deadline=deadline)
+
+    assert timeouts[0] == 10
+    assert len(timeouts) == 2 and timeouts[1] <= 1.0
+    assert now[0] <= 12.0
+
+
+def test_rate_limiter_wait_past_the_deadline_is_not_taken():
+    limiter = HostRateLimiter(rate=1.0)
+    limiter.bucket("dblp.test").on_throttled(retry_after=60.0)
+    with patch.object(dblp_api, "_RATE_LIMITER", limiter), pytest.raises(LookupDeadlineExceeded):
+        dblp_api._reserve_request_slot("dblp.test", Deadline(0.5))
+    assert limiter.bucket("dblp.test").stats()["queue_depth"] == 0
+
+
+def _search_result(hits, total=None):
+    return {"result": {"hits": {"@total": str(len(hits) if total is None else total), "hit": hits}}}
+
+
+def test_find_dblp_citations_splits_one_batched_search_per_id():
+    ids = ["2101.1234", "2101.12345", "cs/0601001"]
+    data = _search_result([
+        _make_hit("Longer Id", "2021", ee="https://arxiv.org/abs/2101.12345"),
+        _make_hit("Old Style", "2006", ee="https://arxiv.org/abs/cs/0601001"),
+    ])
+    with patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine(tiers=("lookup_cache", "known_miss", "remote"))), \
+            patch("dblp_api.try_fetch_many_from_dblp", return_value=data) as batched, \
+            patch("dblp_api.try_fetch_from_dblp") as single:
+        results = find_dblp_citations(ids, ["a", "b", "c"], batch_size=10)
+
+    batched.assert_called_once()
+    assert batched.call_args[0][0] == ids
+    single.assert_not_called()
+    # 2101.1234 is a prefix of 2101.12345, not a match for it.
+    assert results["2101.1234"] is None
+    assert dblp_api._LOOKUP_CACHE.get("2101.1234") is None
+    assert results["2101.12345"]["fields"]["title"] == "Longer Id"
+    assert results["2101.12345"]["citation_key"] == "b"
+    assert results["cs/0601001"]["fields"]["title"] == "Old Style"
+
+
+def test_find_dblp_citations_searches_unmatched_id_alone_when_result_was_truncated():
+    data = _search_result([_make_hit("First", "2021", ee="https://arxiv.org/abs/2101.00001")], total=40)
+    single_data = _search_result([_make_hit("Second", "2021", ee="https://arxiv.org/abs/2101.00002")])
+    with patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine(tiers=("lookup_cache", "remote"))), \
+            patch("dblp_api.try_fetch_many_from_dblp", return_value=data), \
+            patch("dblp_api.try_fetch_from_dblp", return_value=single_data) as single:
+        results = find_dblp_citations(["2101.00001", "2101.00002"], ["a", "b"])
+
+    single.assert_called_once_with("2101.00002", request_timeout=10, deadline=None)
+    assert results["2101.00002"]["fields"]["title"] == "Second"
+
+
+def test_batched_search_ors_ids_and_asks_for_more_hits():
+    session = MagicMock()
+    session.get.return_value = _ok_response()
+    with patch.object(dblp_api, "_DBLP_SESSION", session), patch("dblp_api._reserve_request_slot"):
+        dblp_api.try_fetch_many_from_dblp(["2101.00001", "2101.00002", "2101.00003"])
+
+    params = session.get.call_args.kwargs["params"]
+    assert params["q"] == "2101.00001|2101.00002|2101.00003"
+    assert params["h"] == 15
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dblp_download import download_dump, dump_last_checked
+from errors import DownloadIncomplete
+
+
+class _DumpHandler(BaseHTTPRequestHandler):
+    payload = b""
+    etag = '"v1"'
+    last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+    cut_after = None
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == cls.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") in (cls.etag, cls.last_modified):
+            start = int(range_header.split("=", 1)[1].split("-", 1)[0])
+        body = cls.payload[start:]
+        self.send_response(206 if start else 200)
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(cls.payload) - 1}/{len(cls.payload)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", cls.etag)
+        self.send_header("Last-Modified", cls.last_modified)
+        self.end_headers()
+        if cls.cut_after is not None:
+            self.wfile.write(body[:cls.cut_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class DumpDownloadTests(unittest.TestCase):
+    def setUp(self):
+        _DumpHandler.payload = bytes(range(256)) * 40
+        _DumpHandler.etag = '"v1"'
+        _DumpHandler.cut_after = None
+        _DumpHandler.requests_seen = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _DumpHandler)
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/xml/dblp.xml.gz"
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out = os.path.join(tmp.name, "dblp.xml.gz")
+
+    def _read(self):
+        with open(self.out, "rb") as f:
+            return f.read()
+
+    def test_unchanged_dump_costs_one_304(self):
+        self.assertTrue(download_dump(self.url, self.out, timeout=5))
+        first_checked = dump_last_checked(self.out)
+
+        self.assertFalse(download_dump(self.url, self.out, timeout=5))
+        self.assertEqual(_DumpHandler.requests_seen[-1].get("If-None-Match"), '"v1"')
+        self.assertEqual(self._read(), _DumpHandler.payload)
+        self.assertGreaterEqual(dump_last_checked(self.out), first_checked)
+
+    def test_changed_dump_is_downloaded_again(self):
+        download_dump(self.url, self.out, timeout=5)
+        _DumpHandler.etag = '"v2"'
+        _DumpHandler.payload = b"new dump"
+        self.assertTrue(download_dump(self.url, self.out, timeout=5))
+        self.assertEqual(self._read(), b"new dump")
+
+    def test_interrupted_download_resumes_with_range(self):
+        _DumpHandler.cut_after = 3000
+        with pytest.raises(DownloadIncomplete):
+            download_dump(self.url, self.out, timeout=5)
+        self.assertFalse(os.path.exists(self.out))
+        self.assertEqual(os.path.getsize(f"{self.out}.tmp"), 3000)
+
+        _DumpHandler.cut_after = None
+        self.assertTrue(download_dump(self.url, self.out, timeout=5))
+        self.assertEqual(_DumpHandler.requests_seen[-1].get("Range"), "bytes=3000-")
+        self.assertEqual(self._read(), _DumpHandler.payload)
+        self.assertFalse(os.path.exists(f"{self.out}.tmp"))
+
+    def test_on_chunk_sees_the_whole_file_across_a_resume(self):
+        _DumpHandler.cut_after = 3000
+        with pytest.raises(DownloadIncomplete):
+            download_dump(self.url, self.out, timeout=5)
+
+        _DumpHandler.cut_after = None
+        seen = []
+        self.assertTrue(download_dump(self.url, self.out, timeout=5, on_chunk=seen.append))
+        self.assertEqual(b"".join(seen), _DumpHandler.payload)
+
+        seen.clear()
+        self.assertFalse(download_dump(self.url, self.out, timeout=5, on_chunk=seen.append))
+        self.assertEqual(seen, [])
+
+    def test_partial_of_an_outdated_dump_restarts_from_zero(self):
+        _DumpHandler.cut_after = 100
+        with pytest.raises(DownloadIncomplete):
+            download_dump(self.url, self.out, timeout=5)
+
+        _DumpHandler.cut_after = None
+        _DumpHandler.etag = '"v2"'
+        _DumpHandler.last_modified = "Tue, 02 Jan 2024 00:00:00 GMT"
+        _DumpHandler.payload = b"fresh" * 100
+        self.assertTrue(download_dump(self.url, self.out, timeout=5))
+        self.assertEqual(self._read(), b"fresh" * 100)
+
+    def test_short_body_is_not_moved_into_place(self):
+        class _Resp:
+            status_code = 200
+            headers = {"Content-Length": "10", "ETag": '"x"'}
+
+            class raw:
+                @staticmethod
+                def stream(*args, **kwargs):
+                    yield b"12345"
+
+            def raise_for_status(self):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        class _Session:
+            def get(self, *args, **kwargs):
+                return _Resp()
+
+        with pytest.raises(DownloadIncomplete):
+            download_dump(self.url, self.out, session=_Session())
+        self.assertFalse(os.path.exists(self.out))
+        self.assertEqual(os.path.getsize(f"{self.out}.tmp"), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import time
 import unittest
 
 from dblp_api import DblpLookupService
+from lookup_cache import CACHE_MISS
 
 
 class StubService(DblpLookupService):
@@ -8,6 +10,9 @@ class StubService(DblpLookupService):
         super().__init__(max_concurrency=2, total_timeout_budget=2, cache_ttl_seconds=60)
         self.fetch_count = {}
 
+    def _fetch_batch(self, arxiv_ids, original_keys, deadline=None):
+        return {arxiv_id: self._fetch_one(arxiv_id, key) for arxiv_id, key in zip(arxiv_ids, original_keys)}
+
     def _fetch_one(self, arxiv_id, original_key):
         self.fetch_count[arxiv_id] = self.fetch_count.get(arxiv_id, 0) + 1
         return {
@@ -33,6 +38,16 @@ class DblpLookupServiceTests(unittest.TestCase):
         svc.lookup_many(["2401.00001"], ["k1"])
         svc.lookup_many(["2401.00001"], ["k1b"])
         self.assertEqual(svc.fetch_count.get("2401.00001"), 1)
+        self.assertEqual(svc.cache_stats()["hits"], 1)
+        self.assertEqual(svc.resolver_stats()["memory"]["hits"], 1)
+
+    def test_cache_is_bounded(self):
+        svc = StubService()
+        svc._cache.max_entries = 3
+        ids = [f"2401.0000{i}" for i in range(6)]
+        svc.lookup_many(ids, ids)
+        stats = svc.cache_stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (3, 3))
 
     def test_none_results_are_cached(self):
         class NoneService(StubService):
@@ -45,6 +60,65 @@ class DblpLookupServiceTests(unittest.TestCase):
         svc.lookup_many(["2409.00009"], ["k2"])
         self.assertEqual(svc.fetch_count.get("2409.00009"), 1)
 
+    def test_pending_ids_are_fetched_in_batches(self):
+        class BatchService(StubService):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def _fetch_batch(self, arxiv_ids, original_keys, deadline=None):
+                self.batches.append(list(arxiv_ids))
+                return super()._fetch_batch(arxiv_ids, original_keys, deadline)
+
+        svc = BatchService()
+        svc.batch_size = 2
+        ids = ["2401.00001", "2401.00002", "2401.00003"]
+        out = svc.lookup_many(ids, ["k1", "k2", "k3"])
+        self.assertEqual(svc.batches, [ids[:2], ids[2:]])
+        self.assertEqual([r["fields"]["title"] for r in out], [f"Paper {i}" for i in ids])
+
+    def test_remote_batches_run_in_parallel_and_keep_input_order(self):
+        class SlowService(StubService):
+            def __init__(self):
+                super().__init__()
+                self.max_concurrency = 3
+                self.batch_size = 10
+                self.batches = []
+
+            def _fetch_batch(self, arxiv_ids, original_keys, deadline=None):
+                self.batches.append(list(arxiv_ids))
+                time.sleep(0.3)
+                return super()._fetch_batch(arxiv_ids, original_keys, deadline)
+
+        svc = SlowService()
+        ids = [f"2401.0000{i}" for i in range(6)]
+        started = time.monotonic()
+        out = svc.lookup_many(ids, [f"k{i}" for i in range(6)])
+
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(len(svc.batches), 3)
+        self.assertEqual([r["citation_key"] for r in out], [f"k{i}" for i in range(6)])
+
+    def test_local_answers_do_not_wait_for_remote_batches_past_the_budget(self):
+        class MixedService(StubService):
+            def _resolve_local(self, arxiv_id, original_key):
+                if arxiv_id.startswith("local"):
+                    return {"type": "article", "citation_key": original_key, "fields": {"title": "Local"}}
+                return CACHE_MISS
+
+            def _fetch_batch(self, arxiv_ids, original_keys, deadline=None):
+                time.sleep(1.0)
+                return super()._fetch_batch(arxiv_ids, original_keys, deadline)
+
+        svc = MixedService()
+        svc.total_timeout_budget = 0.2
+        started = time.monotonic()
+        out = svc.lookup_many(["remote.1", "local.1"], ["k1", "k2"])
+
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertIsNone(out[0])
+        self.assertEqual(out[1]["fields"]["title"], "Local")
+
 
 if __name__ == "__main__":
     unittest.main()
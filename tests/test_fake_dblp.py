@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import dblp_api
+from benchmarks.fake_dblp import SEARCH_PATH, FakeDblpServer, parse_latency
+from benchmarks.synthetic_dump import write_dump
+from dblp_download import download_dump
+from errors import DownloadIncomplete
+from mirror_health import MirrorSelector
+from rate_limiter import HostRateLimiter
+
+
+class FakeDblpTests(unittest.TestCase):
+    def _server(self, **options) -> FakeDblpServer:
+        server = FakeDblpServer(**options).start()
+        self.addCleanup(server.stop)
+        for patcher in (
+            patch.object(dblp_api, "_MIRRORS", MirrorSelector([server.base_url + SEARCH_PATH])),
+            patch.object(dblp_api, "_RATE_LIMITER", HostRateLimiter(rate=100.0, burst=10)),
+            patch.object(dblp_api, "_DBLP_SESSION", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return server
+
+    def test_batched_lookups_resolve_exactly_the_ids_the_server_knows(self):
+        server = self._server(hit_ratio=0.5)
+        ids = [f"2101.{n:05d}" for n in range(12)]
+        with patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine(tiers=("lookup_cache", "remote"))):
+            results = dblp_api.find_dblp_citations(ids, ids, cache_mode="bypass")
+
+        self.assertEqual({i for i, c in results.items() if c}, {i for i in ids if server.knows(i)})
+        found = next(c for c in results.values() if c)
+        self.assertEqual(found["fields"]["venue"], "CoRR")
+        self.assertTrue(found["fields"]["author"])
+        self.assertEqual(server.stats()["searches"], 2)
+
+    def test_client_backs_off_when_the_server_throttles(self):
+        server = self._server(throttle_first=1, retry_after=0.05)
+        ids = [f"2102.{n:05d}" for n in range(4)]
+        for arxiv_id in ids:
+            dblp_api.try_fetch_from_dblp(arxiv_id, request_timeout=2)
+
+        self.assertEqual(server.stats()["throttled"], 1)
+        self.assertEqual(server.stats()["searches"], len(ids))
+        host = server.base_url.split("//")[1]
+        self.assertEqual(dblp_api.rate_limiter_status()[host]["throttled"], 1)
+
+    def test_reset_dump_download_resumes_where_it_was_cut(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "source.xml.gz")
+            write_dump(source, 3000)
+            server = self._server(dump_path=source, reset_ratio=1.0)
+            url = server.base_url + "/xml/dblp.xml.gz"
+            target = os.path.join(tmp, "dblp.xml.gz")
+
+            with self.assertRaises(DownloadIncomplete):
+                download_dump(url, target)
+            server.reset_ratio = 0.0
+            self.assertTrue(download_dump(url, target))
+            self.assertFalse(download_dump(url, target))
+
+            with open(source, "rb") as a, open(target, "rb") as b:
+                self.assertEqual(a.read(), b.read())
+            self.assertEqual(server.stats()["status_206"], 1)
+            self.assertEqual(server.stats()["not_modified"], 1)
+
+    def test_latency_specs(self):
+        import random
+
+        rng = random.Random(1)
+        self.assertEqual(parse_latency("fixed:0.25")(rng), 0.25)
+        self.assertTrue(0.1 <= parse_latency("uniform:0.1,0.2")(rng) <= 0.2)
+        with self.assertRaises(ValueError):
+            parse_latency("pareto:1")
+
+
+class DblpBaseUrlTests(unittest.TestCase):
+    def test_base_urls_set_search_mirrors_and_dump_url(self):
+        with patch.object(dblp_api, "_DBLP_BASE_URLS", None), patch.object(dblp_api, "_DBLP_SEARCH_URLS", None), \
+                patch.object(dblp_api, "_DBLP_XML_URL", None), patch.object(dblp_api, "_MIRRORS", None):
+            dblp_api.use_dblp_base_urls(["http://127.0.0.1:8765/", "http://127.0.0.1:8766"])
+            self.assertEqual(dblp_api._DBLP_XML_URL, "http://127.0.0.1:8765/xml/dblp.xml.gz")
+            self.assertEqual(dblp_api._MIRRORS.ranked(), [
+                "http://127.0.0.1:8765/search/publ/api", "http://127.0.0.1:8766/search/publ/api",
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main()
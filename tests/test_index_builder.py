@@ -0,0 +1,106 @@
+import gzip
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from index_builder import StreamingIndexBuilder, default_worker_count, extract_chunk, iter_index_entries, iter_index_entries_parallel
+
+_RECORD = """<{tag} mdate="2024-01-01" key="{key}">
+<author>Ren&eacute; M&uuml;ller</author>
+<author>Ada Lovelace</author>
+<title>Paper {n} &amp; Friends.</title>
+<year>2024</year>
+<{venue_tag}>Venue {n}</{venue_tag}>
+<ee>{ee}</ee>
+</{tag}>
+"""
+
+
+def _dump(n_records):
+    parts = [
+        '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+        '<!DOCTYPE dblp SYSTEM "dblp.dtd">\n'
+        "<dblp>\n"
+    ]
+    for n in range(n_records):
+        tag = ("article", "inproceedings", "phdthesis")[n % 3]
+        ee = f"https://arxiv.org/abs/2401.{n:05d}v1" if n % 2 == 0 else f"https://doi.org/10.1/{n}"
+        parts.append(_RECORD.format(
+            tag=tag,
+            key=f"x/{n}",
+            n=n,
+            venue_tag="booktitle" if tag == "inproceedings" else "journal",
+            ee=ee,
+        ))
+    parts.append("</dblp>\n")
+    return "".join(parts).encode("iso-8859-1")
+
+
+class IndexBuilderTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "dblp.xml.gz")
+        with gzip.open(self.path, "wb") as f:
+            f.write(_dump(40))
+
+    def test_serial_extraction_resolves_dtd_entities(self):
+        entries = dict(iter_index_entries(self.path))
+        self.assertEqual(len(entries), 20)
+        first = entries["2401.00000"]
+        self.assertEqual(first["author"], "René Müller and Ada Lovelace")
+        self.assertEqual(first["title"], "Paper 0 & Friends.")
+        self.assertEqual(first["type"], "article")
+        self.assertEqual(entries["2401.00002"]["type"], "phdthesis")
+
+    def test_parallel_pipeline_matches_serial_output_in_order(self):
+        serial = list(iter_index_entries(self.path))
+        parallel = list(iter_index_entries_parallel(self.path, workers=2, chunk_bytes=1024))
+        self.assertEqual(parallel, serial)
+
+    def _stream(self, compressed, workers):
+        entries = []
+        builder = StreamingIndexBuilder(lambda arxiv_id, entry: entries.append((arxiv_id, entry)), workers=workers, chunk_bytes=1024)
+        for i in range(0, len(compressed), 97):
+            builder.feed(compressed[i:i + 97])
+        builder.close()
+        return entries
+
+    def test_streaming_builder_matches_serial_output(self):
+        serial = list(iter_index_entries(self.path))
+        with open(self.path, "rb") as f:
+            compressed = f.read()
+        self.assertEqual(self._stream(compressed, workers=0), serial)
+        self.assertEqual(self._stream(compressed, workers=2), serial)
+
+    def test_streaming_builder_reads_concatenated_gzip_members(self):
+        dump = _dump(10)
+        cut = dump.index(b"<article", 200)
+        compressed = gzip.compress(dump[:cut]) + gzip.compress(dump[cut:])
+        self.assertEqual(self._stream(compressed, workers=0), list(iter_index_entries(self.path))[:5])
+
+    def test_chunk_prefilter_skips_records_without_arxiv_links(self):
+        chunk = (
+            b'<article key="a"><title>No link</title><ee>https://doi.org/x</ee></article>\n'
+            b'<www key="b"><title>Broken &undefined; record arxiv.org/abs/1</title></www>\n'
+            b'<inproceedings key="c"><title>Linked</title><ee>https://arxiv.org/abs/2402.00002</ee></inproceedings>\n'
+        )
+        entries, errors = extract_chunk(chunk)
+        self.assertEqual([arxiv_id for arxiv_id, _ in entries], ["2402.00002"])
+        self.assertEqual(errors, 1)
+        self.assertEqual(extract_chunk(b'<article key="a"><title>&broken</article>'), ([], 0))
+
+    def test_single_cpu_hosts_default_to_the_serial_path(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("DBLP_INDEX_BUILD_WORKERS", None)
+            with patch("os.cpu_count", return_value=1):
+                self.assertEqual(default_worker_count(), 0)
+            with patch("os.cpu_count", return_value=4):
+                self.assertEqual(default_worker_count(), 4)
+        with patch.dict(os.environ, {"DBLP_INDEX_BUILD_WORKERS": "2"}), patch("os.cpu_count", return_value=1):
+            self.assertEqual(default_worker_count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from index_handle import IndexHandle, bump_generation, read_generation
+
+
+class _FakeIndex:
+    def __init__(self, label):
+        self.label = label
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class IndexHandleTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.marker = os.path.join(tmp.name, "index.generation.json")
+        self.loads = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def _load(self):
+        self.release.wait(5)
+        index = _FakeIndex(f"gen{read_generation(self.marker)}")
+        self.loads.append(index)
+        return index
+
+    def _handle(self, **kwargs):
+        handle = IndexHandle(self._load, lambda: self.marker, **kwargs)
+        self.addCleanup(handle.close)
+        return handle
+
+    def _wait_for(self, handle, label):
+        deadline = time.monotonic() + 5
+        while handle.current().label != label:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def test_generations_are_counted_atomically(self):
+        self.assertEqual(read_generation(self.marker), 0)
+        self.assertEqual(bump_generation(self.marker, entries=5), 1)
+        self.assertEqual(bump_generation(self.marker), 2)
+        self.assertFalse(os.path.exists(f"{self.marker}.tmp"))
+
+    def test_new_generation_on_disk_is_swapped_in_without_a_gap(self):
+        handle = self._handle(check_interval=0.0)
+        self.assertEqual(handle.current().label, "gen0")
+
+        # Another process finished a rebuild; loading it here is slow.
+        self.release.clear()
+        bump_generation(self.marker)
+        for _ in range(20):
+            self.assertEqual(handle.current().label, "gen0")
+        self.assertTrue(handle.status()["loading"])
+        self.release.set()
+        self._wait_for(handle, "gen1")
+        self.assertEqual(handle.status()["generation"], 1)
+        self.assertFalse(self.loads[0].closed)  # still within its grace period
+
+    def test_reload_swaps_now_and_retired_generations_are_closed_later(self):
+        handle = self._handle(check_interval=0.0, retire_after=0.0)
+        first = handle.current()
+        bump_generation(self.marker)
+        handle.reload()
+        self.assertEqual(handle.peek().label, "gen1")
+        self.assertFalse(first.closed)
+        handle.current()
+        self.assertTrue(first.closed)
+
+    def test_close_discards_a_load_still_in_flight(self):
+        handle = self._handle(check_interval=0.0)
+        handle.current()
+        self.release.clear()
+        bump_generation(self.marker)
+        handle.current()
+        handle.close()
+        self.release.set()
+        deadline = time.monotonic() + 5
+        while len(self.loads) < 2 or not self.loads[1].closed:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        self.assertIsNone(handle.peek())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,540 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import dblp_api
+from local_index import (
+    BinaryIndexReader,
+    JsonIndexReader,
+    JsonIndexWriter,
+    SqliteIndexReader,
+    SqliteIndexUpdater,
+    SqliteIndexWriter,
+    binary_index_is_current,
+    write_binary_index,
+)
+
+_DUMP = b"""<?xml version="1.0" encoding="ISO-8859-1"?>
+<dblp>
+<article mdate="2024-01-01" key="journals/x/Doe24">
+<author>Jane Doe</author>
+<author>John Roe</author>
+<title>Indexed Paper.</title>
+<year>2024</year>
+<journal>J. Test</journal>
+<ee>https://arxiv.org/abs/2401.00001v2</ee>
+</article>
+<inproceedings mdate="2024-01-01" key="conf/x/Roe23">
+<author>John Roe</author>
+<title>Not On arXiv.</title>
+<year>2023</year>
+<booktitle>TestConf</booktitle>
+<ee>https://doi.org/10.1000/xyz</ee>
+</inproceedings>
+</dblp>
+"""
+
+
+class LocalIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.xml_path = os.path.join(self.tmpdir.name, "dblp.xml.gz")
+        with gzip.open(self.xml_path, "wb") as f:
+            f.write(_DUMP)
+        patches = [
+            patch.object(dblp_api, "_LOCAL_DBLP_XML_GZ", self.xml_path),
+            patch.object(dblp_api, "_LOCAL_DBLP_INDEX", os.path.join(self.tmpdir.name, "index.json")),
+            patch.object(dblp_api, "_LOCAL_DBLP_INDEX_DB", os.path.join(self.tmpdir.name, "index.sqlite3")),
+            patch.object(dblp_api, "_LOCAL_DBLP_INDEX_BIN", os.path.join(self.tmpdir.name, "index.bin")),
+            patch.object(dblp_api, "_LOCAL_DBLP_INDEX_BLOOM", os.path.join(self.tmpdir.name, "index.bloom")),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        dblp_api._reset_local_index()
+        self.addCleanup(dblp_api._reset_local_index)
+
+
+class SqliteIndexTests(LocalIndexTestCase):
+    def test_writer_batches_and_reader_point_lookup(self):
+        path = os.path.join(self.tmpdir.name, "batched.sqlite3")
+        writer = SqliteIndexWriter(path, batch_size=2)
+        for n in range(5):
+            writer.add(f"2401.0000{n}", {"type": "article", "title": f"T{n}"})
+        writer.commit()
+
+        reader = SqliteIndexReader(path)
+        self.addCleanup(reader.close)
+        self.assertEqual(writer.count, 5)
+        self.assertEqual(reader.get("2401.00003")["title"], "T3")
+        self.assertEqual(reader.get("2401.00003")["venue"], "")
+        self.assertIsNone(reader.get("9999.99999"))
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_rebuild_writes_sqlite_and_lookup_skips_remote(self):
+        dblp_api._rebuild_local_arxiv_index()
+
+        self.assertTrue(os.path.exists(dblp_api._LOCAL_DBLP_INDEX_DB))
+        with patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            citation = dblp_api.find_dblp_citation("2401.00001", "k1")
+        self.assertEqual(citation["citation_key"], "k1")
+        self.assertEqual(citation["fields"]["title"], "Indexed Paper.")
+        self.assertEqual(citation["fields"]["author"], "Jane Doe and John Roe")
+        self.assertEqual(citation["fields"]["venue"], "J. Test")
+        self.assertEqual(dblp_api.local_index_status()["source"], "binary")
+
+    def test_json_index_used_when_no_sqlite_index_exists(self):
+        with open(dblp_api._LOCAL_DBLP_INDEX, "w", encoding="utf-8") as f:
+            json.dump({"2402.00002": {"type": "article", "title": "From JSON"}}, f)
+
+        self.assertEqual(dblp_api._lookup_local_index("2402.00002")["title"], "From JSON")
+
+    def test_rebuild_falls_back_to_json_without_sqlite(self):
+        with patch("dblp_api.sqlite_available", return_value=False):
+            dblp_api._rebuild_local_arxiv_index()
+            self.assertEqual(dblp_api._lookup_local_index("2401.00001")["year"], "2024")
+
+        self.assertFalse(os.path.exists(dblp_api._LOCAL_DBLP_INDEX_DB))
+        with open(dblp_api._LOCAL_DBLP_INDEX, "r", encoding="utf-8") as f:
+            self.assertEqual(list(json.load(f)), ["2401.00001"])
+
+
+class IncrementalIndexTests(LocalIndexTestCase):
+    def _write_index(self, entries, path):
+        writer = SqliteIndexWriter(path)
+        for arxiv_id, entry in entries:
+            writer.add(arxiv_id, entry)
+        writer.commit()
+
+    def test_updater_writes_only_the_delta(self):
+        path = os.path.join(self.tmpdir.name, "live.sqlite3")
+        self._write_index([
+            ("2401.00001", {"key": "a", "title": "Same"}),
+            ("2401.00002", {"key": "b", "title": "Old title"}),
+            ("2401.00003", {"key": "c", "title": "Withdrawn"}),
+        ], path)
+        reader = SqliteIndexReader(path)
+        self.addCleanup(reader.close)
+
+        updater = SqliteIndexUpdater(path, batch_size=2)
+        updater.add("2401.00001", {"key": "a", "title": "Same"})
+        updater.add("2401.00002", {"key": "b", "title": "New title"})
+        updater.add("2401.00004", {"key": "d", "title": "Brand new"})
+        # Batches are committed as they go, so an open reader already sees them.
+        self.assertEqual(reader.get("2401.00002")["title"], "New title")
+        self.assertEqual(reader.get("2401.00003")["title"], "Withdrawn")
+        updater.commit()
+
+        self.assertEqual((updater.count, updater.upserted, updater.deleted), (3, 2, 1))
+        self.assertIsNone(reader.get("2401.00003"))
+        self.assertEqual(reader.get("2401.00004")["title"], "Brand new")
+        self.assertEqual(reader.get("2401.00001")["title"], "Same")
+
+    def test_aborted_update_skips_deletes(self):
+        path = os.path.join(self.tmpdir.name, "live.sqlite3")
+        self._write_index([("2401.00001", {"key": "a", "title": "Kept"})], path)
+        updater = SqliteIndexUpdater(path)
+        updater.add("2401.00002", {"key": "b", "title": "Added"})
+        updater.abort()
+
+        reader = SqliteIndexReader(path)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.get("2401.00001")["title"], "Kept")
+        self.assertIsNone(reader.get("2401.00002"))
+
+    def test_latest_record_wins_for_shared_arxiv_id(self):
+        path = os.path.join(self.tmpdir.name, "dupes.sqlite3")
+        bin_path = os.path.join(self.tmpdir.name, "dupes.bin")
+        writer = SqliteIndexWriter(path)
+        writer.add("2401.00001", {"key": "corr", "title": "Preprint"})
+        writer.add("2401.00001", {"key": "conf", "title": "Published"})
+        writer.commit(binary_path=bin_path)
+
+        reader = SqliteIndexReader(path)
+        self.addCleanup(reader.close)
+        binary = BinaryIndexReader(bin_path)
+        self.addCleanup(binary.close)
+        self.assertEqual(reader.get("2401.00001")["title"], "Published")
+        self.assertEqual(binary.get("2401.00001")["title"], "Published")
+        self.assertEqual(binary.count, 1)
+
+    def test_incremental_update_picks_the_same_winner_as_a_full_rebuild(self):
+        first = [
+            ("2001.00001", {"key": "conf/A", "title": "ConfA"}),
+            ("2001.00001", {"key": "corr/B", "title": "CoRR"}),
+        ]
+        second = [(f"2101.{n:05d}", {"key": f"x/{n}", "title": f"Other {n}"}) for n in range(5)] + [
+            ("2001.00001", {"key": "conf/A", "title": "ConfA, revised"}),
+            ("2001.00001", {"key": "corr/B", "title": "CoRR"}),
+        ]
+        path = os.path.join(self.tmpdir.name, "live.sqlite3")
+        bin_path = os.path.join(self.tmpdir.name, "live.bin")
+        self._write_index(first, path)
+        updater = SqliteIndexUpdater(path, batch_size=3)
+        for arxiv_id, entry in second:
+            updater.add(arxiv_id, entry)
+        updater.commit(binary_path=bin_path)
+        full_path = os.path.join(self.tmpdir.name, "full.sqlite3")
+        self._write_index(second, full_path)
+
+        readers = [SqliteIndexReader(path), SqliteIndexReader(full_path), BinaryIndexReader(bin_path)]
+        for reader in readers:
+            self.addCleanup(reader.close)
+        self.assertEqual([reader.get("2001.00001")["title"] for reader in readers], ["CoRR"] * 3)
+        self.assertEqual(list(readers[0].iter_sorted()), list(readers[1].iter_sorted()))
+        self.assertEqual(updater.reordered, 1)
+
+    def test_incremental_update_only_reorders_shared_arxiv_ids(self):
+        others = [(f"2101.{n:05d}", {"key": f"x/{n}", "title": f"Other {n}"}) for n in range(10)]
+        first = others + [("2001.00001", {"key": "corr/A", "title": "CoRR"})]
+        # corr/A moves to the front and conf/C, flushed in a later batch, shares its ID.
+        second = [
+            ("2001.00001", {"key": "corr/A", "title": "CoRR"}),
+            ("2001.00001", {"key": "conf/C", "title": "Published"}),
+        ] + others
+        path = os.path.join(self.tmpdir.name, "live.sqlite3")
+        self._write_index(first, path)
+        updater = SqliteIndexUpdater(path, batch_size=1)
+        for arxiv_id, entry in second:
+            updater.add(arxiv_id, entry)
+        updater.commit()
+        full_path = os.path.join(self.tmpdir.name, "full.sqlite3")
+        self._write_index(second, full_path)
+
+        readers = [SqliteIndexReader(path), SqliteIndexReader(full_path)]
+        for reader in readers:
+            self.addCleanup(reader.close)
+        self.assertEqual([reader.get("2001.00001")["title"] for reader in readers], ["Published"] * 2)
+        self.assertEqual(list(readers[0].iter_sorted()), list(readers[1].iter_sorted()))
+        self.assertEqual((updater.upserted, updater.reordered), (1, 1))
+
+        # Prepending one record moves all twelve, but only the two sharing an ID are rewritten.
+        updater = SqliteIndexUpdater(path)
+        for arxiv_id, entry in [("2201.00001", {"key": "new/1", "title": "New"})] + second:
+            updater.add(arxiv_id, entry)
+        updater.commit()
+        self.assertEqual((updater.upserted, updater.reordered), (1, 2))
+
+    def test_second_rebuild_is_incremental(self):
+        dblp_api._rebuild_local_arxiv_index()
+        stats = dblp_api._rebuild_local_arxiv_index()
+        self.assertEqual((stats["upserted"], stats["deleted"]), (0, 0))
+
+        with gzip.open(self.xml_path, "wb") as f:
+            f.write(_DUMP.replace(b"Indexed Paper.", b"Indexed Paper, Revised."))
+        stats = dblp_api._rebuild_local_arxiv_index()
+        self.assertEqual((stats["upserted"], stats["deleted"]), (1, 0))
+        self.assertEqual(dblp_api._lookup_local_index("2401.00001")["title"], "Indexed Paper, Revised.")
+
+
+_TITLE_DUMP = b"""<?xml version="1.0" encoding="ISO-8859-1"?>
+<!DOCTYPE dblp SYSTEM "dblp.dtd">
+<dblp>
+<article mdate="2024-01-01" key="journals/corr/abs-2401-00009">
+<author>Ren&eacute; M&uuml;ller</author>
+<title>Scaling Laws for Sparse Retrieval.</title>
+<year>2024</year>
+<journal>CoRR</journal>
+<ee>https://arxiv.org/abs/2401.00009</ee>
+</article>
+<inproceedings mdate="2024-06-01" key="conf/sigir/Muller24">
+<author>Ren&eacute; M&uuml;ller</author>
+<author>Ada Lovelace</author>
+<title>Scaling Laws for Sparse Retrieval</title>
+<year>2024</year>
+<booktitle>SIGIR</booktitle>
+<ee>https://doi.org/10.1145/1</ee>
+</inproceedings>
+<inproceedings mdate="2024-06-01" key="conf/sigir/Other24">
+<author>Someone Else</author>
+<title>Scaling Laws for Sparse Retrieval</title>
+<year>2024</year>
+<booktitle>SIGIR</booktitle>
+<ee>https://doi.org/10.1145/2</ee>
+</inproceedings>
+<article mdate="2024-01-01" key="journals/x/Roe25">
+<author>John Roe</author>
+<title>Unlinked Results on Graph Colouring.</title>
+<year>2025</year>
+<journal>J. Graphs</journal>
+<ee>https://doi.org/10.1000/g</ee>
+</article>
+</dblp>
+"""
+
+
+class TitleIndexTests(LocalIndexTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(dblp_api, "_TITLE_INDEX_ENABLED", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with gzip.open(self.xml_path, "wb") as f:
+            f.write(_TITLE_DUMP)
+        dblp_api._rebuild_local_arxiv_index()
+
+    def test_preprint_hit_is_upgraded_to_the_published_version(self):
+        with patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            citation = dblp_api.find_dblp_citation("2401.00009", "k")
+        self.assertEqual(citation["fields"]["venue"], "SIGIR")
+        self.assertEqual(citation["fields"]["ee"], "https://doi.org/10.1145/1")
+        self.assertEqual(citation["type"], "inproceedings")
+
+    def test_citing_title_and_author_resolve_unlinked_ids_locally(self):
+        with patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            citation = dblp_api.find_dblp_citation(
+                "2501.00001", "k", title="{Unlinked} results on graph colouring", author="Roe, John and Doe, Jane"
+            )
+        self.assertEqual(citation["fields"]["venue"], "J. Graphs")
+
+        # Wrong first author: no title match, and the ID is absent from the dump.
+        with patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            self.assertIsNone(dblp_api.find_dblp_citation(
+                "2501.00001", "k", title="Unlinked Results on Graph Colouring", author="Jane Doe"
+            ))
+
+    def test_title_buckets_follow_incremental_updates(self):
+        with gzip.open(self.xml_path, "wb") as f:
+            f.write(_TITLE_DUMP.replace(b"Unlinked Results on Graph Colouring.", b"Linked Results on Hypergraphs."))
+        stats = dblp_api._rebuild_local_arxiv_index()
+        self.assertEqual((stats["upserted"], stats["deleted"]), (1, 0))
+
+        reader = dblp_api._get_title_index_reader()
+        self.assertEqual(reader.find_by_title("Unlinked Results on Graph Colouring"), [])
+        self.assertEqual(reader.find_by_title("Linked results on hypergraphs")[0][1], "journals/x/Roe25")
+
+
+class NegativeLookupTests(LocalIndexTestCase):
+    def test_ids_absent_from_the_dump_skip_the_remote_search(self):
+        dblp_api._rebuild_local_arxiv_index()
+        self.assertEqual(dblp_api.local_index_status()["bloom"]["keys"], 1)
+
+        with patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            self.assertIsNone(dblp_api.find_dblp_citation("2501.99999", "k"))
+            self.assertEqual(dblp_api.find_dblp_citation("2401.00001", "k")["fields"]["venue"], "J. Test")
+
+    def test_filter_older_than_the_index_is_ignored(self):
+        dblp_api._rebuild_local_arxiv_index()
+        dblp_api._reset_local_index()
+        with open(dblp_api._LOCAL_DBLP_INDEX_BLOOM, "r+b") as f:
+            f.seek(40)
+            f.write(b"\0" * 8)  # created_at = 1970
+
+        dblp_api._get_local_index_reader()
+        self.assertIsNone(dblp_api._LOCAL_INDEX.peek().bloom)
+        self.assertEqual(dblp_api._lookup_local_index("2401.00001")["year"], "2024")
+
+    def test_remote_misses_are_remembered_across_processes(self):
+        empty = {"result": {"hits": {"@total": "0"}}}
+        with patch("dblp_api.try_fetch_from_dblp", return_value=empty) as remote:
+            self.assertIsNone(dblp_api.find_dblp_citation("2501.00002", "k"))
+            # A new process starts with an empty in-memory tier.
+            with patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine()):
+                self.assertIsNone(dblp_api.find_dblp_citation("2501.00002", "k"))
+        remote.assert_called_once()
+        self.assertEqual(dblp_api.local_index_status()["lookup_cache"]["hits"], 1)
+
+    def test_a_refreshed_hit_replaces_an_earlier_miss(self):
+        empty = {"result": {"hits": {"@total": "0"}}}
+        found = {"result": {"hits": {"@total": "1", "hit": {"info": {
+            "type": "article", "title": "Found Later.", "ee": "https://arxiv.org/abs/2501.00004",
+        }}}}}
+        with patch("dblp_api.try_fetch_from_dblp", return_value=empty):
+            self.assertIsNone(dblp_api.find_dblp_citation("2501.00004", "k"))
+        with patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine()), \
+                patch("dblp_api.try_fetch_from_dblp", return_value=found):
+            self.assertIsNotNone(dblp_api.find_dblp_citation("2501.00004", "k", cache_mode="refresh"))
+        with patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine()), \
+                patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            self.assertEqual(dblp_api.find_dblp_citation("2501.00004", "k")["fields"]["title"], "Found Later.")
+
+    def test_cached_hits_win_over_the_filter_of_the_dump(self):
+        dblp_api._rebuild_local_arxiv_index()
+        dblp_api._LOOKUP_CACHE.set("2501.99998", {"citation_key": "old", "fields": {"title": "Not In The Dump."}})
+
+        with patch("dblp_api.try_fetch_from_dblp", side_effect=AssertionError("remote called")):
+            self.assertIsNone(dblp_api.find_dblp_citation("2501.99999", "k"))
+            self.assertEqual(dblp_api.find_dblp_citation("2501.99998", "k")["fields"]["title"], "Not In The Dump.")
+
+
+class SinglePassSyncTests(LocalIndexTestCase):
+    def setUp(self):
+        super().setUp()
+        with open(self.xml_path, "rb") as f:
+            self.compressed = f.read()
+        os.remove(self.xml_path)
+        patches = [
+            patch.object(dblp_api, "_LOCAL_DBLP_SYNC_LOCKFILE", os.path.join(self.tmpdir.name, "sync.lock")),
+            patch("dblp_api.default_worker_count", return_value=0),
+            patch("dblp_api._rebuild_local_arxiv_index", side_effect=AssertionError("dump read twice")),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _fake_download(self, url, out_path, on_chunk=None, **kwargs):
+        for i in range(0, len(self.compressed), 64):
+            on_chunk(self.compressed[i:i + 64])
+        with open(out_path, "wb") as f:
+            f.write(self.compressed)
+        return True
+
+    def test_index_is_built_while_the_dump_downloads(self):
+        with patch("dblp_api.download_dump", side_effect=self._fake_download):
+            dblp_api.ensure_local_dblp_dataset_fresh(single_pass=True)
+
+        self.assertTrue(os.path.exists(self.xml_path))
+        self.assertGreaterEqual(os.path.getmtime(dblp_api._LOCAL_DBLP_INDEX_DB), os.path.getmtime(self.xml_path))
+        self.assertEqual(dblp_api._lookup_local_index("2401.00001")["title"], "Indexed Paper.")
+
+    def test_unchanged_dump_leaves_index_untouched(self):
+        with open(self.xml_path, "wb") as f:
+            f.write(self.compressed)
+        os.utime(self.xml_path, (0, 0))
+        with patch("dblp_api.download_dump", side_effect=self._fake_download):
+            dblp_api.ensure_local_dblp_dataset_fresh(single_pass=True)
+        index_mtime = os.path.getmtime(dblp_api._LOCAL_DBLP_INDEX_DB)
+
+        os.utime(self.xml_path, (0, 0))
+        with patch("dblp_api.download_dump", return_value=False):
+            dblp_api.ensure_local_dblp_dataset_fresh(single_pass=True)
+        self.assertEqual(os.path.getmtime(dblp_api._LOCAL_DBLP_INDEX_DB), index_mtime)
+
+
+class StreamingJsonIndexTests(LocalIndexTestCase):
+    def test_json_writer_spills_runs_and_later_records_win(self):
+        json_path = os.path.join(self.tmpdir.name, "streamed.json")
+        bin_path = os.path.join(self.tmpdir.name, "streamed.bin")
+        writer = JsonIndexWriter(json_path, run_size=2)
+        for n in (3, 1, 2, 1, 0):
+            writer.add(f"2401.0000{n}", {"title": f"T{n}-{writer.count}"})
+        writer.commit(binary_path=bin_path)
+
+        with open(json_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+        self.assertEqual(loaded["2401.00001"]["title"], "T1-3")
+        reader = BinaryIndexReader(bin_path)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.count, 4)
+        self.assertEqual(reader.get("2401.00001")["title"], "T1-3")
+        self.assertEqual(reader.get("2401.00000")["title"], "T0-4")
+        self.assertEqual(os.listdir(self.tmpdir.name).count("streamed.json.tmp"), 0)
+        self.assertFalse(any(name.startswith("arxiv-index-runs-") for name in os.listdir(self.tmpdir.name)))
+
+    def test_json_reader_shares_repeated_venue_and_author_strings(self):
+        json_path = os.path.join(self.tmpdir.name, "shared.json")
+        writer = JsonIndexWriter(json_path)
+        for n in (1, 2):
+            writer.add(f"2401.0000{n}", {"title": f"T{n}", "venue": "".join(["J. ", "Test"]), "author": f"Jane Doe and Co {n}"})
+        writer.commit()
+
+        reader = JsonIndexReader(json_path)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.get("2401.00002")["author"], "Jane Doe and Co 2")
+        first, second = reader._index["2401.00001"], reader._index["2401.00002"]
+        self.assertIs(first[3], second[3])
+        self.assertIs(first[4][0], second[4][0])
+        self.assertIsNone(reader.get("2401.00003"))
+
+    def test_rebuild_reports_peak_memory(self):
+        with self.assertLogs("BibTeXProcessor", level="INFO") as logs:
+            stats = dblp_api._rebuild_local_arxiv_index()
+        self.assertEqual(stats["entries"], 1)
+        self.assertGreater(stats["peak_rss_bytes"], 0)
+        self.assertTrue(any("peak RSS" in line for line in logs.output))
+
+
+class BinaryIndexTests(LocalIndexTestCase):
+    def test_binary_round_trip_with_mixed_id_widths(self):
+        entries = {
+            "2401.00001": {"type": "article", "title": "Modern", "author": "Ünïcode Author"},
+            "cs/9901001": {"type": "misc", "title": "Legacy"},
+            "math.AG/0101001": {"type": "book", "title": "Wide ID", "venue": "Annals"},
+        }
+        path = os.path.join(self.tmpdir.name, "mixed.bin")
+        width = max(len(k) for k in entries)
+        self.assertEqual(write_binary_index(path, sorted(entries.items()), width), 3)
+
+        reader = BinaryIndexReader(path)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.count, 3)
+        for arxiv_id, entry in entries.items():
+            self.assertEqual(reader.get(arxiv_id)["title"], entry["title"])
+        self.assertEqual(reader.get("2401.00001")["author"], "Ünïcode Author")
+        self.assertEqual(reader.get("math.AG/0101001")["venue"], "Annals")
+        self.assertIsNone(reader.get("2401.0000"))
+        self.assertIsNone(reader.get("0000.00000"))
+        self.assertIsNone(reader.get("zzzz/9999999999999999"))
+
+    def test_repeated_venues_and_authors_are_stored_once(self):
+        entries = [
+            (f"2401.0000{n}", {"type": "article", "title": f"Paper {n}", "venue": "Shared Venue",
+                               "author": "Jane Doe and John Roe" if n % 2 else "John Roe"})
+            for n in range(6)
+        ]
+        path = os.path.join(self.tmpdir.name, "shared.bin")
+        write_binary_index(path, entries, 10)
+
+        with open(path, "rb") as f:
+            data = f.read()
+        self.assertEqual(data.count(b"Shared Venue"), 1)
+        self.assertEqual(data.count(b"John Roe"), 1)
+        reader = BinaryIndexReader(path)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.get("2401.00003")["author"], "Jane Doe and John Roe")
+        self.assertEqual(reader.get("2401.00004")["author"], "John Roe")
+        self.assertEqual(reader.get("2401.00004")["venue"], "Shared Venue")
+
+    def test_incremental_update_rewrites_binary_index_in_an_older_format(self):
+        dblp_api._rebuild_local_arxiv_index()
+        dblp_api._reset_local_index()
+        with open(dblp_api._LOCAL_DBLP_INDEX_BIN, "r+b") as f:
+            f.seek(8)
+            f.write((1).to_bytes(4, "little"))
+        self.assertFalse(binary_index_is_current(dblp_api._LOCAL_DBLP_INDEX_BIN))
+
+        dblp_api._rebuild_local_arxiv_index()
+        self.assertTrue(binary_index_is_current(dblp_api._LOCAL_DBLP_INDEX_BIN))
+        self.assertIsInstance(dblp_api._get_local_index_reader(), BinaryIndexReader)
+
+    def test_empty_binary_index(self):
+        path = os.path.join(self.tmpdir.name, "empty.bin")
+        write_binary_index(path, [], 0)
+        reader = BinaryIndexReader(path)
+        self.addCleanup(reader.close)
+        self.assertIsNone(reader.get("2401.00001"))
+
+    def test_rebuild_exports_binary_index_used_for_lookups(self):
+        dblp_api._rebuild_local_arxiv_index()
+
+        self.assertIsInstance(dblp_api._get_local_index_reader(), BinaryIndexReader)
+        self.assertEqual(dblp_api._lookup_local_index("2401.00001")["venue"], "J. Test")
+        self.assertIsNone(dblp_api._lookup_local_index("2301.99999"))
+
+    def test_rebuild_swaps_in_a_new_generation_while_old_readers_stay_open(self):
+        dblp_api._rebuild_local_arxiv_index()
+        old_reader = dblp_api._get_local_index_reader()
+        self.assertEqual(dblp_api.local_index_status()["generation"], 1)
+
+        dblp_api._rebuild_local_arxiv_index(incremental=False)
+        status = dblp_api.local_index_status()
+        self.assertEqual((status["generation"], status["on_disk_generation"]), (2, 2))
+        self.assertIsNot(dblp_api._get_local_index_reader(), old_reader)
+        self.assertEqual(old_reader.get("2401.00001")["venue"], "J. Test")
+
+    def test_corrupt_binary_index_falls_back_to_sqlite(self):
+        dblp_api._rebuild_local_arxiv_index()
+        dblp_api._reset_local_index()
+        with open(dblp_api._LOCAL_DBLP_INDEX_BIN, "wb") as f:
+            f.write(b"not an index" * 10)
+
+        self.assertIsInstance(dblp_api._get_local_index_reader(), SqliteIndexReader)
+        self.assertEqual(dblp_api._lookup_local_index("2401.00001")["year"], "2024")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import dblp_api
+from lookup_cache import CACHE_BYPASS, CACHE_MISS, CACHE_REFRESH, LookupCache
+from pipeline import run_flow
+
+_FOUND = {"result": {"hits": {"@total": "1", "hit": {"info": {
+    "type": "article", "title": "Cached Paper", "ee": "https://arxiv.org/abs/2101.00001",
+    "authors": {"author": [{"text": "Jane Doe"}]},
+}}}}}
+
+
+class LookupCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "lookups.sqlite3")
+
+    def _cache(self, positive_ttl=3600.0, negative_ttl=3600.0) -> LookupCache:
+        cache = LookupCache(self.path, positive_ttl, negative_ttl)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_reads_do_not_create_the_file(self):
+        self.assertIs(self._cache().get("2101.00001"), CACHE_MISS)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_found_and_not_found_results_are_shared_between_instances(self):
+        self._cache().set("2101.00001", {"citation_key": "k", "fields": {"title": "T"}})
+        self._cache().set("2101.00002", None)
+
+        other = self._cache()
+        self.assertEqual(other.get("2101.00001")["fields"]["title"], "T")
+        self.assertIsNone(other.get("2101.00002"))
+        self.assertEqual(other.counters(), {"hits": 2, "misses": 0})
+
+    def test_negative_results_expire_on_their_own_ttl(self):
+        self._cache().set("2101.00001", {"fields": {}})
+        self._cache().set("2101.00002", None)
+
+        cache = self._cache(positive_ttl=3600.0, negative_ttl=-1.0)
+        self.assertIsNotNone(cache.get("2101.00001"))
+        self.assertIs(cache.get("2101.00002"), CACHE_MISS)
+        self.assertEqual(cache.purge_expired(), 1)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_database_errors_in_stats_and_purge_are_logged_not_raised(self):
+        cache = self._cache()
+        cache._conn = MagicMock()
+        cache._conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(cache.stats()["entries"], 0)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(cache.purge_expired(), 0)
+        cache._conn = None
+
+
+class CachedLookupTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine(tiers=("lookup_cache", "remote")))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_second_lookup_is_answered_from_the_cache_under_the_new_key(self):
+        with patch("dblp_api.try_fetch_from_dblp", return_value=_FOUND) as fetch:
+            dblp_api.find_dblp_citation("2101.00001", "first")
+            citation = dblp_api.find_dblp_citation("2101.00001", "second")
+
+        fetch.assert_called_once()
+        self.assertEqual(citation["citation_key"], "second")
+        self.assertEqual(citation["fields"]["title"], "Cached Paper")
+
+    def test_refresh_searches_again_and_bypass_leaves_the_cache_alone(self):
+        with patch("dblp_api.try_fetch_from_dblp", return_value=_FOUND) as fetch:
+            dblp_api.find_dblp_citation("2101.00001", "k", cache_mode=CACHE_BYPASS)
+            self.assertEqual(dblp_api._LOOKUP_CACHE.stats()["entries"], 0)
+            dblp_api.find_dblp_citation("2101.00001", "k")
+            dblp_api.find_dblp_citation("2101.00001", "k", cache_mode=CACHE_REFRESH)
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_batched_lookups_consult_and_fill_the_cache(self):
+        dblp_api._LOOKUP_CACHE.set("2101.00009", None)
+        with patch("dblp_api.try_fetch_from_dblp", return_value=_FOUND) as fetch, \
+                patch("dblp_api.try_fetch_many_from_dblp") as batched:
+            results = dblp_api.find_dblp_citations(["2101.00001", "2101.00009"], ["a", "b"])
+            again = dblp_api.find_dblp_citations(["2101.00001"], ["c"])
+
+        batched.assert_not_called()
+        fetch.assert_called_once()
+        self.assertIsNone(results["2101.00009"])
+        self.assertEqual(again["2101.00001"]["citation_key"], "c")
+
+    def test_remote_misses_follow_the_lookup_cache_ttl_and_cache_mode(self):
+        empty = {"result": {"hits": {"@total": "0"}}}
+        with patch.object(dblp_api._LOOKUP_CACHE, "negative_ttl_seconds", 0.0), \
+                patch("dblp_api.try_fetch_from_dblp", return_value=empty) as fetch:
+            dblp_api.find_dblp_citation("2101.00003", "k", cache_mode=CACHE_BYPASS)
+            self.assertEqual(dblp_api._LOOKUP_CACHE.stats()["entries"], 0)
+            # Every persistent tier: with a zero TTL none of them answers a remote miss.
+            engine = dblp_api.build_resolver_engine(tiers=("lookup_cache", "known_miss", "remote"))
+            with patch.object(dblp_api, "_ENGINE", engine):
+                dblp_api.find_dblp_citation("2101.00003", "k")
+                dblp_api.find_dblp_citation("2101.00003", "k")
+        self.assertEqual(dblp_api._LOOKUP_CACHE.stats()["entries"], 1)
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_run_flow_reports_cache_hits_and_misses(self):
+        rec = {"type": "article", "citation_key": "k1", "from_arxiv": True, "arxiv_id": "2101.00001", "fields": {}}
+        with patch("pipeline.parse_bib_file", return_value=[rec]), patch("pipeline.write_bib_file"), \
+                patch("dblp_api.try_fetch_from_dblp", return_value=_FOUND):
+            first = run_flow("in.bib", "out.bib")
+            second = run_flow("in.bib", "out.bib")
+
+        self.assertEqual((first["lookup_cache_hits"], first["lookup_cache_misses"]), (0, 1))
+        self.assertEqual((second["lookup_cache_hits"], second["lookup_cache_misses"]), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from lookup_cache import CACHE_MISS
+from memory_cache import MemoryCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class MemoryCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _cache(self, **options) -> MemoryCache:
+        return MemoryCache(clock=self.clock, size_of=lambda value: 100, **options)
+
+    def test_least_recently_used_entry_is_evicted_first(self):
+        cache = self._cache(max_entries=2)
+        cache.set("a", {"n": 1})
+        cache.set("b", {"n": 2})
+        cache.get("a")
+        cache.set("c", {"n": 3})
+
+        self.assertIs(cache.get("b"), CACHE_MISS)
+        self.assertEqual(cache.get("a"), {"n": 1})
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_byte_budget_bounds_the_cache(self):
+        cache = self._cache(max_bytes=1000)
+        for i in range(20):
+            cache.set(f"id{i}", {"n": i})
+
+        stats = cache.stats()
+        self.assertLessEqual(stats["bytes"], 1000)
+        self.assertEqual(stats["entries"] + stats["evictions"], 20)
+        self.assertEqual(cache.get("id19"), {"n": 19})
+
+    def test_misses_expire_before_found_results(self):
+        cache = self._cache(positive_ttl_seconds=60.0, negative_ttl_seconds=10.0)
+        cache.set("found", {"n": 1})
+        cache.set("missing", None)
+        self.assertIsNone(cache.get("missing"))
+
+        self.clock.now += 11.0
+        self.assertIs(cache.get("missing"), CACHE_MISS)
+        self.assertEqual(cache.get("found"), {"n": 1})
+        self.clock.now += 50.0
+        self.assertIs(cache.get("found"), CACHE_MISS)
+
+    def test_expired_entries_are_dropped_without_being_read(self):
+        cache = self._cache(positive_ttl_seconds=10.0)
+        for i in range(5):
+            cache.set(f"old{i}", {"n": i})
+        self.clock.now += 20.0
+        cache.set("new", {"n": 9})
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()["expirations"], 5)
+        self.assertEqual(cache.stats()["bytes"], 100 + len("new") + 200)
+
+    def test_counters(self):
+        cache = self._cache()
+        cache.get("a")
+        cache.set("a", {"n": 1})
+        cache.get("a")
+        cache.get("a")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import dblp_api
+from mirror_health import MirrorSelector
+from rate_limiter import HostRateLimiter
+
+
+class MirrorSelectorTests(unittest.TestCase):
+    def test_unmeasured_mirror_is_tried_before_a_measured_one(self):
+        selector = MirrorSelector(["a", "b"])
+        selector.record("a", 0.1, ok=True)
+        self.assertEqual(selector.ranked(), ["b", "a"])
+
+    def test_errors_outweigh_a_small_latency_advantage(self):
+        selector = MirrorSelector(["a", "b"])
+        selector.record("a", 0.2, ok=True)
+        selector.record("b", 0.1, ok=True)
+        self.assertEqual(selector.ranked(), ["b", "a"])
+        selector.record("b", 0.1, ok=False)
+        self.assertEqual(selector.ranked(), ["a", "b"])
+        self.assertEqual(selector.stats()["b"]["errors"], 1)
+
+    def test_hedge_delay_follows_recent_latency_percentile(self):
+        selector = MirrorSelector(["a"])
+        self.assertEqual(selector.hedge_delay("a", 0.9, default=4.0), 4.0)
+        for ms in range(1, 11):
+            selector.record("a", ms / 100, ok=True)
+        self.assertAlmostEqual(selector.hedge_delay("a", 0.9, default=4.0), 0.10)
+
+
+def _serve(delay: float, status: int = 200):
+    """A stand-in DBLP search endpoint answering after ``delay`` seconds."""
+    class Handler(BaseHTTPRequestHandler):
+        calls = 0
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            Handler.calls += 1
+            if delay:
+                time.sleep(delay)
+            body = json.dumps({"result": {"hits": {"@total": "0"}}, "server": self.server.server_port}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server, Handler
+
+
+class MirrorRoutingTests(unittest.TestCase):
+    def _mirrors(self, *servers):
+        urls = [f"http://127.0.0.1:{server.server_address[1]}/search/publ/api" for server, _ in servers]
+        for server, _ in servers:
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+        for patcher in (
+            patch.object(dblp_api, "_MIRRORS", MirrorSelector(urls)),
+            patch.object(dblp_api, "_RATE_LIMITER", HostRateLimiter(rate=1000.0, burst=10)),
+            patch.object(dblp_api, "_DBLP_SESSION", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return urls
+
+    def test_lookups_move_to_the_mirror_that_answers(self):
+        broken, fast = _serve(0.0, status=503), _serve(0.0)
+        self._mirrors(broken, fast)
+        with patch("dblp_api.time.sleep") as sleep:
+            for _ in range(3):
+                dblp_api.try_fetch_from_dblp("2101.00001", max_retries=3, request_timeout=2)
+
+        self.assertEqual(broken[1].calls, 1)
+        self.assertEqual(fast[1].calls, 3)
+        sleep.assert_not_called()
+
+    def test_hedged_request_returns_the_faster_mirror(self):
+        slow, fast = _serve(1.5), _serve(0.0)
+        urls = self._mirrors(slow, fast)
+        dblp_api._MIRRORS.record(urls[0], 0.05, ok=True)
+        dblp_api._MIRRORS.record(urls[1], 0.5, ok=True)
+
+        started = time.monotonic()
+        with patch.object(dblp_api, "_HEDGE_REQUESTS", True):
+            data = dblp_api.try_fetch_from_dblp("2101.00001", request_timeout=5)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(data["server"], fast[0].server_address[1])
+        self.assertEqual((slow[1].calls, fast[1].calls), (1, 1))
+
+    def test_no_hedge_without_a_free_slot_on_the_other_host(self):
+        slow, fast = _serve(0.3), _serve(0.0)
+        urls = self._mirrors(slow, fast)
+        dblp_api._MIRRORS.record(urls[0], 0.01, ok=True)
+        dblp_api._MIRRORS.record(urls[1], 0.5, ok=True)
+        fast_host = urls[1].split("/")[2]
+        dblp_api._RATE_LIMITER.bucket(fast_host).on_throttled(retry_after=60.0)
+
+        with patch.object(dblp_api, "_HEDGE_REQUESTS", True):
+            data = dblp_api.try_fetch_from_dblp("2101.00001", request_timeout=5)
+
+        self.assertEqual(data["server"], slow[0].server_address[1])
+        self.assertEqual(fast[1].calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,28 @@ class ParserTests(unittest.TestCase):
             r"Symbols like \{ and \} and nested {parts}",
         )
 
+    def test_deep_nesting_and_quoted_braces_inside_braced_values(self):
+        content = r'''@article{key6,
+  title = {a{b{c{d{e}}}}f},
+  note = {see "}" and \{},
+  pages = 1--10
+}
+'''
+        fields = parse_bib_content(content)[0]["fields"]
+        self.assertEqual(fields["title"], "a{b{c{d{e}}}}f")
+        self.assertEqual(fields["note"], r'see "}" and \{')
+        self.assertEqual(fields["pages"], "1--10")
+
+    def test_malformed_entries_raise(self):
+        for content, message in (
+            ("@article{key7,\n  title {x}\n}", "Expected '=' after field title"),
+            ("@article{key8,\n  = {x}\n}", "Invalid field name"),
+            ("@article{key9,\n  title = {x\n", "Unterminated balanced value"),
+            ("@article{key10,\n  title = {x},\n", "Unterminated entry body"),
+        ):
+            with self.assertRaisesRegex(ValueError, message):
+                parse_bib_content(content)
+
     def test_round_trip_keeps_semantically_important_characters(self):
         content = r'''@inproceedings{key5,
   title = {Symbols like \{ and \} and nested {parts}},
@@ -0,0 +1,101 @@
+import threading
+import unittest
+
+from rate_limiter import HostRateLimiter, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _bucket(self, **options) -> TokenBucket:
+        return TokenBucket(clock=self.clock, sleep=self.clock.sleep, **options)
+
+    def test_burst_is_free_then_requests_are_paced(self):
+        bucket = self._bucket(rate=2.0, burst=3)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_idle_time_refills_the_bucket(self):
+        bucket = self._bucket(rate=1.0, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        self.clock.now += 10.0
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_throttle_halves_rate_and_honours_retry_after(self):
+        bucket = self._bucket(rate=1.0, burst=4, min_rate=0.1)
+        bucket.on_throttled(retry_after=5.0)
+
+        self.assertAlmostEqual(bucket.rate, 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 5.0)
+        # No burst after the cooldown: the next slot is one interval later.
+        self.assertAlmostEqual(bucket.reserve(), 7.0)
+        self.assertEqual(bucket.stats()["throttled"], 1)
+
+    def test_acquire_past_max_wait_returns_none_without_claiming_a_slot(self):
+        bucket = self._bucket(rate=1.0, burst=1)
+        bucket.acquire()
+        self.assertIsNone(bucket.acquire(max_wait=0.5))
+        self.assertEqual(self.clock.now, 100.0)
+        self.assertAlmostEqual(bucket.acquire(max_wait=1.0), 1.0)
+
+    def test_rate_recovers_on_success_up_to_max(self):
+        bucket = self._bucket(rate=1.0, max_rate=1.2, increase=0.1)
+        bucket.on_throttled()
+        for _ in range(10):
+            bucket.on_success()
+        self.assertAlmostEqual(bucket.rate, 1.2)
+
+    def test_rate_never_drops_below_min(self):
+        bucket = self._bucket(rate=1.0, min_rate=0.3)
+        for _ in range(5):
+            bucket.on_throttled()
+        self.assertAlmostEqual(bucket.rate, 0.3)
+
+    def test_waiting_threads_do_not_hold_the_lock(self):
+        release = threading.Event()
+        slept = threading.Event()
+
+        def blocking_sleep(seconds):
+            slept.set()
+            release.wait(5)
+
+        # The clock stands still, so the waiter's slot is always a full second away.
+        bucket = TokenBucket(rate=1.0, burst=1, clock=_FakeClock(), sleep=blocking_sleep)
+        bucket.reserve()
+        waiter = threading.Thread(target=bucket.acquire)
+        waiter.start()
+        self.assertTrue(slept.wait(5))
+        self.assertEqual(bucket.stats()["queue_depth"], 1)
+        release.set()
+        waiter.join(5)
+        self.assertEqual(bucket.stats()["queue_depth"], 0)
+
+
+class HostRateLimiterTests(unittest.TestCase):
+    def test_hosts_are_limited_independently(self):
+        clock = _FakeClock()
+        limiter = HostRateLimiter(rate=1.0, burst=1, clock=clock, sleep=clock.sleep)
+        self.assertEqual(limiter.bucket("dblp.org").reserve(), 0.0)
+        self.assertEqual(limiter.bucket("dblp.uni-trier.de").reserve(), 0.0)
+        self.assertAlmostEqual(limiter.bucket("dblp.org").reserve(), 1.0)
+        self.assertEqual(set(limiter.stats()), {"dblp.org", "dblp.uni-trier.de"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+
+from lookup_cache import CACHE_BYPASS, CACHE_MISS, CACHE_REFRESH
+from memory_cache import MemoryCache
+from resolver import FunctionTier, LookupQuery, MemoryTier, PersistentCacheTier, ResolverEngine
+
+
+class _DictCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key, CACHE_MISS)
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+
+def _found(arxiv_id):
+    return {"type": "article", "citation_key": arxiv_id, "fields": {"title": f"Paper {arxiv_id}"}}
+
+
+class ResolverEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.memory = MemoryCache()
+        self.persistent = _DictCache()
+        self.remote_calls = []
+        self.batches = []
+
+        def remote_many(queries, batch_size):
+            self.batches.append([query.arxiv_id for query in queries])
+            return {query.arxiv_id: _found(query.arxiv_id) for query in queries}
+
+        def remote_one(query):
+            self.remote_calls.append(query.arxiv_id)
+            return _found(query.arxiv_id)
+
+        self.engine = ResolverEngine([
+            MemoryTier(self.memory),
+            FunctionTier("local_index", lambda q: _found(q.arxiv_id) if q.arxiv_id == "local" else CACHE_MISS, local=True),
+            PersistentCacheTier(self.persistent),
+            FunctionTier("remote", remote_one, remote_many, remote=True),
+        ])
+
+    def test_first_tier_with_an_answer_wins_and_the_caches_remember_it(self):
+        answer, tier = self.engine.resolve(LookupQuery("2101.00001", "first"))
+        self.assertEqual(tier.name, "remote")
+        self.assertIn("2101.00001", self.persistent.entries)
+
+        answer, tier = self.engine.resolve(LookupQuery("2101.00001", "second"))
+        self.assertEqual((tier.name, answer["citation_key"]), ("memory", "second"))
+        self.assertEqual(self.remote_calls, ["2101.00001"])
+
+        stats = self.engine.stats()
+        self.assertEqual((stats["memory"]["lookups"], stats["memory"]["hits"]), (2, 1))
+        self.assertEqual(stats["memory"]["hit_rate"], 0.5)
+        self.assertEqual(stats["remote"]["hits"], 1)
+        self.assertIsNotNone(stats["remote"]["p95_ms"])
+
+    def test_local_answers_are_not_cached(self):
+        _, tier = self.engine.resolve(LookupQuery("local", "k"))
+        self.assertEqual(tier.name, "local_index")
+        self.assertEqual((len(self.memory), self.persistent.entries), (0, {}))
+
+    def test_cache_modes(self):
+        self.engine.resolve(LookupQuery("2101.00001", "k", cache_mode=CACHE_BYPASS))
+        self.assertEqual((len(self.memory), self.persistent.entries), (0, {}))
+
+        self.engine.resolve(LookupQuery("2101.00001", "k"))
+        _, tier = self.engine.resolve(LookupQuery("2101.00001", "k", cache_mode=CACHE_REFRESH))
+        self.assertEqual(tier.name, "remote")
+        self.assertEqual(len(self.remote_calls), 3)
+
+    def test_resolve_without_remote_tiers(self):
+        answer, tier = self.engine.resolve(LookupQuery("2101.00001", "k"), remote=False)
+        self.assertIs(answer, CACHE_MISS)
+        self.assertIsNone(tier)
+        self.assertEqual(self.remote_calls, [])
+
+    def test_resolve_many_batches_what_the_earlier_tiers_left_open(self):
+        self.persistent.set("2101.00002", None)
+        queries = [LookupQuery(arxiv_id, arxiv_id) for arxiv_id in ("local", "2101.00001", "2101.00002", "2101.00001")]
+
+        answers = self.engine.resolve_many(queries, batch_size=10)
+
+        self.assertEqual(self.batches, [["2101.00001"]])
+        self.assertEqual(set(answers), {"local", "2101.00001", "2101.00002"})
+        self.assertIsNone(answers["2101.00002"])
+        self.assertEqual(self.engine.stats()["lookup_cache"]["lookups"], 2)
+        self.assertIsNot(self.memory.get("2101.00001"), CACHE_MISS)
+
+    def test_engines_do_not_share_tiers(self):
+        other = ResolverEngine([MemoryTier(MemoryCache())])
+        self.engine.resolve(LookupQuery("2101.00001", "k"))
+        self.assertIs(other.resolve(LookupQuery("2101.00001", "k"))[0], CACHE_MISS)
+        self.assertEqual(other.stats()["memory"]["hits"], 0)
+
+    def test_tier_names_must_be_unique(self):
+        with self.assertRaises(ValueError):
+            ResolverEngine([MemoryTier(MemoryCache()), MemoryTier(MemoryCache())])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import dblp_api
+from single_flight import SingleFlight
+
+_FOUND = {"result": {"hits": {"@total": "1", "hit": {"info": {
+    "type": "article", "title": "Popular Paper", "ee": "https://arxiv.org/abs/2101.00001",
+    "authors": {"author": [{"text": "Jane Doe"}]},
+}}}}}
+
+
+def _run_concurrently(n, target):
+    results = [None] * n
+    errors = [None] * n
+
+    def run(i):
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return results, errors
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        leader = threading.Thread(target=flight.do, args=("k", slow))
+        leader.start()
+        started.wait(5)
+        results = []
+        followers = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(3)]
+        for t in followers:
+            t.start()
+        while flight.stats()["coalesced"] < 3:
+            time.sleep(0.01)
+        release.set()
+        for t in [leader] + followers:
+            t.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 3)
+        self.assertEqual(flight.stats(), {"calls": 1, "coalesced": 3, "in_flight": 0})
+
+    def test_exception_reaches_every_waiter_and_key_is_released(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        self.assertEqual(flight.do("k", lambda: 2), 2)
+
+    def test_waiter_gives_up_after_its_timeout_without_stopping_the_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=("k", lambda: release.wait(5)))
+        leader.start()
+        while flight.stats()["in_flight"] == 0:
+            time.sleep(0.01)
+
+        with self.assertRaises(TimeoutError):
+            flight.do("k", lambda: None, timeout=0.05)
+        self.assertEqual(flight.stats()["in_flight"], 1)
+        release.set()
+        leader.join(5)
+
+
+class CoalescedLookupTests(unittest.TestCase):
+    def test_concurrent_review_jobs_send_one_search_and_keep_their_keys(self):
+        def slow_fetch(arxiv_id, request_timeout=10, deadline=None):
+            time.sleep(0.2)
+            return _FOUND
+
+        flight = SingleFlight()
+        with patch.object(dblp_api, "_SINGLE_FLIGHT", flight), \
+                patch.object(dblp_api, "_ENGINE", dblp_api.build_resolver_engine(tiers=("lookup_cache", "remote"))), \
+                patch("dblp_api.try_fetch_from_dblp", side_effect=slow_fetch) as fetch:
+            results, errors = _run_concurrently(
+                4, lambda i: dblp_api.find_dblp_citation("2101.00001", f"key{i}", cache_mode="bypass")
+            )
+
+        self.assertEqual(errors, [None] * 4)
+        fetch.assert_called_once()
+        self.assertEqual(flight.stats()["coalesced"], 3)
+        self.assertEqual([r["citation_key"] for r in results], [f"key{i}" for i in range(4)])
+        self.assertIsNot(results[0]["fields"], results[1]["fields"])
+
+
+if __name__ == "__main__":
+    unittest.main()
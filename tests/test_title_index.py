@@ -0,0 +1,27 @@
+import unittest
+
+from title_index import first_author_surname, normalize_title, title_band_keys, title_similarity
+
+
+class TitleIndexTests(unittest.TestCase):
+    def test_normalization_ignores_case_accents_punctuation_and_braces(self):
+        self.assertEqual(normalize_title("{BERT}: Pre-training of Deep Bidirectional Transformers."), "bert pre training of deep bidirectional transformers")
+        self.assertEqual(normalize_title("Über Café"), "uber cafe")
+
+    def test_first_author_surname_handles_both_name_orders(self):
+        self.assertEqual(first_author_surname("René Müller and Ada Lovelace"), "muller")
+        self.assertEqual(first_author_surname(r"M{\"u}ller, Ren{\'e} and Lovelace, Ada"), "muller")
+        self.assertEqual(first_author_surname("Wei Wang 0001"), "wang")
+        self.assertEqual(first_author_surname(""), "")
+
+    def test_near_duplicate_titles_share_buckets_and_score_high(self):
+        a = "Attention Is All You Need."
+        b = "Attention is all you need"
+        self.assertEqual(title_band_keys(a), title_band_keys(b))
+        self.assertEqual(title_similarity(a, b), 1.0)
+        self.assertLess(title_similarity(a, "Deep Residual Learning for Image Recognition"), 0.2)
+        self.assertEqual(title_band_keys("..."), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Title keys for matching DBLP records that do not link an arXiv abstract.
+
+Published versions of arXiv papers are usually separate DBLP records whose
+``ee`` points at the publisher, so the arXiv ID alone cannot find them. Each
+indexed record therefore also gets a handful of integer bucket keys derived
+from its normalized title:
+
+- one key for the exact normalized title, and
+- one key per band of a MinHash signature over the title's words, so titles
+  that differ in a word or two (subtitles, "A" vs "The") still share a bucket.
+
+Records sharing any key are candidates; ``title_similarity`` and the first
+author's surname decide between them.
+"""
+import random
+import re
+import struct
+import unicodedata
+import zlib
+from typing import FrozenSet, List
+
+MIN_TITLE_SIMILARITY = 0.85
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at by for from in into is of on or the to via with without".split()
+)
+_NUM_HASHES = 12
+_ROWS_PER_BAND = 3
+_MASK32 = (1 << 32) - 1
+_rng = random.Random(0x5EED)
+# h -> (a*h + b) mod 2**32 with odd ``a`` permutes 32-bit word hashes; it stays
+# in machine-sized ints, which matters at one call per DBLP record.
+_PERMUTATIONS = [(_rng.randrange(1 << 32) | 1, _rng.randrange(1 << 32)) for _ in range(_NUM_HASHES)]
+_BAND = struct.Struct(f"<{_ROWS_PER_BAND}I")
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase ASCII-folded words of ``title``; drops punctuation and BibTeX braces."""
+    return " ".join(_TOKEN_RE.findall(_fold(title)))
+
+
+def first_author_surname(authors: str) -> str:
+    """Normalized surname of the first author in a BibTeX/DBLP ``author`` string.
+
+    Handles "Last, First" and "First Last" forms and DBLP's homonym suffixes
+    ("Wei Wang 0001").
+    """
+    first = re.split(r"\s+and\s+", (authors or "").strip(), maxsplit=1)[0]
+    if "," in first:
+        name = first.split(",", 1)[0]
+    else:
+        words = [w for w in first.split() if not w.isdigit()]
+        name = words[-1] if words else ""
+    return "".join(_TOKEN_RE.findall(_fold(name)))
+
+
+def _words(normalized: str) -> FrozenSet[str]:
+    words = normalized.split()
+    return frozenset(w for w in words if w not in _STOPWORDS) or frozenset(words)
+
+
+def title_band_keys(title: str) -> List[int]:
+    """Bucket keys for ``title``; empty if it has no words."""
+    normalized = normalize_title(title)
+    if not normalized:
+        return []
+    keys = [zlib.crc32(normalized.encode("utf-8"))]
+    hashes = [zlib.crc32(w.encode("utf-8")) for w in _words(normalized)]
+    signature = [min([(a * h + b) & _MASK32 for h in hashes]) for a, b in _PERMUTATIONS]
+    for band in range(_NUM_HASHES // _ROWS_PER_BAND):
+        rows = signature[band * _ROWS_PER_BAND:(band + 1) * _ROWS_PER_BAND]
+        # Band number in the high bits keeps bands from colliding with each other.
+        keys.append(((band + 1) << 32) | zlib.crc32(_BAND.pack(*rows)))
+    return keys
+
+
+def _trigrams(normalized: str) -> FrozenSet[str]:
+    padded = f"  {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def title_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the character trigrams of two normalized titles."""
+    norm_a, norm_b = normalize_title(a), normalize_title(b)
+    if not norm_a or not norm_b:
+        return 0.0
+    grams_a, grams_b = _trigrams(norm_a), _trigrams(norm_b)
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
@@ -3,11 +3,13 @@ from __future__ import annotations
 from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 
 from diff import compute_diff
+from errors import LookupDeferred
 
 Record = Dict[str, Any]
 Proposal = Optional[Record]
 DiffResult = Optional[Dict[str, Any]]
-LookupFn = Callable[[str, Optional[str]], Proposal]
+# Called as lookup_fn(arxiv_id, citation_key, title=..., author=...) with the citing entry's fields.
+LookupFn = Callable[..., Proposal]
 
 
 def generate_proposals(records: Sequence[Record], lookup_fn: LookupFn) -> Dict[str, Any]:
@@ -22,6 +24,8 @@ def generate_proposals(records: Sequence[Record], lookup_fn: LookupFn) -> Dict[s
         "diff_records": 0,
         "failures": 0,
         "failure_keys": [],
+        "deferred_records": 0,
+        "deferred_keys": [],
     }
 
     for rec in records:
@@ -34,7 +38,14 @@ def generate_proposals(records: Sequence[Record], lookup_fn: LookupFn) -> Dict[s
 
         stats["candidate_records"] += 1
         try:
-            dblp_rec = lookup_fn(arxiv_id, rec.get("citation_key"))
+            fields = rec.get("fields") or {}
+            dblp_rec = lookup_fn(arxiv_id, rec.get("citation_key"), title=fields.get("title"), author=fields.get("author"))
+        except LookupDeferred:
+            stats["deferred_records"] += 1
+            stats["deferred_keys"].append(rec.get("citation_key"))
+            proposals.append(None)
+            diffs.append(None)
+            continue
         except Exception:
             stats["failures"] += 1
             stats["failure_keys"].append(rec.get("citation_key"))